@@ -4,16 +4,31 @@ This package contains the core logic for building Pyvider providers into
 distributable artifacts, such as the Progressive Secure Package Format (PSPF).
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .models import (
     PSPF_EOF_MAGIC,
     PSPF_VERSION,
     PspfFooter,
 )
-from .packaging.orchestrator import BuildOrchestrator
 
 # NOTE: The verifier is NOT imported here to avoid an import cycle.
 # The `verify` command in the CLI should import it directly.
 
+if TYPE_CHECKING:
+    from .packaging.orchestrator import BuildOrchestrator
+
+
+def __getattr__(name: str) -> Any:
+    # The orchestrator pulls in the provider framework; importing the
+    # package (and so the CLI) should not.
+    if name == "BuildOrchestrator":
+        from .packaging.orchestrator import BuildOrchestrator
+
+        return BuildOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "PSPF_EOF_MAGIC",
     "PSPF_VERSION",
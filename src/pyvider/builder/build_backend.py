@@ -11,7 +11,7 @@ from wheel.wheelfile import WheelFile
 
 from pyvider.telemetry import logger
 
-from .compiler import ensure_go_binary
+from .compiler import ensure_go_binaries
 from .exceptions import BuildError
 from .packaging.orchestrator import BuildOrchestrator
 
@@ -61,7 +61,11 @@ def build_wheel(
             f"Public key for embedding not found at resolved path: {public_key_path}"
         )
 
-    launcher_bin_path = ensure_go_binary("pspf-launcher")
+    # Compile both tools concurrently on a cold cache; the orchestrator's own
+    # lookup of the packager is then a cache hit.
+    launcher_bin_path = ensure_go_binaries("pspf-launcher", "pspf-packager")[
+        "pspf-launcher"
+    ]
 
     scripts = project_conf.get("scripts", {})
     if not scripts or len(scripts) != 1:
@@ -1,32 +1,59 @@
 """The `pyvbuild` command-line interface."""
 
-import importlib.metadata
+from datetime import datetime
+import hashlib
 from pathlib import Path
 import shutil
+import stat
 import subprocess
+import time
 import tomllib
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from attrs import define
 import click
 
-from .compiler import _get_cache_dir, ensure_go_binary
-from .exceptions import BuildError, InvalidFooterError
-from .packaging.orchestrator import BuildOrchestrator
-from .packaging.reader import PspfReader
+from .compiler import _get_cache_dir, ensure_go_binaries, ensure_go_binary
+from .exceptions import BuildError, VerificationError
+from .models import ARCHIVE_SECTIONS
+from .packaging.batch import (
+    BatchResult,
+    default_workers,
+    expand_manifests,
+    run_batch,
+)
+
+# Building imports the provider framework, which takes far longer than
+# anything `verify`, `ls` or `cache` do, so the build and delta modules are
+# imported by the commands that use them. So are the package reader, crypto,
+# zstandard and the runtime cache, which `--help` and most commands never need.
+if TYPE_CHECKING:
+    from .packaging.orchestrator import BuildOrchestrator
+
 
-try:
-    __version__ = importlib.metadata.version("pyvider-builder")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.0.0-dev"
+def _print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    # Resolved only when asked for: importlib.metadata is slow to import.
+    if not value or ctx.resilient_parsing:
+        return
+    import importlib.metadata
+
+    try:
+        version = importlib.metadata.version("pyvider-builder")
+    except importlib.metadata.PackageNotFoundError:
+        version = "0.0.0-dev"
+    click.echo(f"pyvbuild version {version}")
+    ctx.exit()
 
 
 @click.group(context_settings=dict(help_option_names=["-h", "--help"]))
-@click.version_option(
-    __version__,
+@click.option(
     "-V",
     "--version",
-    prog_name="pyvbuild",
-    message="%(prog)s version %(version)s",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
 )
 def cli() -> None:
     """Progressive Secure Packaging Format (PSPF) Build Tool."""
@@ -81,6 +108,167 @@ def keygen(out_dir: str) -> None:
         raise click.Abort() from e
 
 
+@define(frozen=True, slots=True)
+class BuildOptions:
+    """The `pyvbuild package` options shared by every manifest it builds."""
+
+    private_key_path: str | None = None
+    public_key_path: str | None = None
+    out: str | None = None
+    jobs: int | None = None
+    compression_level: int | None = None
+    compression_threads: int | None = None
+    compression_overrides: tuple[str, ...] = ()
+    compile_bytecode: bool | None = None
+    trace_path: str | None = None
+
+
+def _prepare_build(
+    manifest_path: Path, options: BuildOptions
+) -> tuple["BuildOrchestrator", Path, Path]:
+    """
+    Reads a manifest and returns the orchestrator that builds it, with the
+    package's output path and public key.
+    """
+    from .packaging.compression import resolve_compression
+    from .packaging.orchestrator import BuildOrchestrator
+
+    with manifest_path.open("rb") as f:
+        pyproject_data = tomllib.load(f)
+
+    pyvider_conf = pyproject_data.get("tool", {}).get("pyvider", {})
+    if not pyvider_conf:
+        raise click.UsageError(
+            "A [tool.pyvider] section was not found in pyproject.toml."
+        )
+
+    build_conf = pyvider_conf.get("build", {})
+    signing_conf = pyvider_conf.get("signing", {})
+    manifest_dir = manifest_path.parent
+
+    final_out = Path(
+        options.out
+        or manifest_dir
+        / pyvider_conf.get("output_path", "dist/terraform-provider-pyvider")
+    )
+    final_key = Path(
+        options.private_key_path
+        or manifest_dir
+        / signing_conf.get("private_key_path", "keys/provider-private.key")
+    )
+    final_pub_key = Path(
+        options.public_key_path
+        or manifest_dir
+        / signing_conf.get("public_key_path", "keys/provider-public.key")
+    )
+    entry_point = pyvider_conf.get("entry_point")
+    python_version = pyvider_conf.get("python_version")
+    compression = resolve_compression(
+        build_conf.get("compression", {}),
+        level=options.compression_level,
+        threads=options.compression_threads,
+        overrides=options.compression_overrides,
+    )
+
+    if not all([final_out, final_key, final_pub_key, entry_point]):
+        raise click.UsageError(
+            "Missing required configuration. Check paths in [tool.pyvider] or provide them as CLI options."
+        )
+
+    if not final_key.exists():
+        raise click.UsageError(
+            f"Private key not found at '{final_key}'. Please run `pyvbuild keygen` to generate keys."
+        )
+    if not final_pub_key.exists():
+        raise click.UsageError(
+            f"Public key not found at '{final_pub_key}'. Please run `pyvbuild keygen` to generate keys."
+        )
+
+    # Compile both tools concurrently on a cold cache; the orchestrator's own
+    # lookup of the packager is then a cache hit.
+    launcher_bin_path = ensure_go_binaries("pspf-launcher", "pspf-packager")[
+        "pspf-launcher"
+    ]
+
+    orchestrator = BuildOrchestrator(
+        launcher_bin_path=str(launcher_bin_path),
+        package_integrity_key_path=str(final_key),
+        public_key_path=str(final_pub_key),
+        output_pspf_path=str(final_out),
+        build_config=build_conf,
+        manifest_dir=manifest_dir,
+        entry_point=entry_point,
+        python_version=python_version,
+        jobs=options.jobs,
+        compression=compression,
+        compile_bytecode=options.compile_bytecode,
+    )
+    return orchestrator, final_out, final_pub_key
+
+
+def _batch_trace_path(trace_path: str, output: Path) -> Path:
+    """Names one target's trace in a batch, e.g. `trace.<output name>.json`."""
+    trace = Path(trace_path)
+    return trace.with_name(f"{trace.stem}.{output.name}{trace.suffix}")
+
+
+def _build_batch_target(manifest_path: Path, options: BuildOptions) -> BatchResult:
+    """Builds and verifies one manifest of a batch, in a pool worker."""
+    from .crypto import load_public_key
+    from .packaging.reader import PspfReader
+
+    started = time.perf_counter()
+    orchestrator = None
+    output = None
+    try:
+        orchestrator, output, public_key = _prepare_build(manifest_path, options)
+        try:
+            orchestrator.build_package()
+        finally:
+            if options.trace_path:
+                orchestrator.timer.write_chrome_trace(
+                    _batch_trace_path(options.trace_path, output)
+                )
+        with PspfReader(output) as reader:
+            reader.verify(load_public_key(public_key))
+        error = None
+    except (BuildError, VerificationError, click.UsageError, OSError) as e:
+        error = str(e)
+    except Exception as e:
+        # Anything else would escape the pool and cost the batch its summary.
+        error = f"{type(e).__name__}: {e}"
+    return BatchResult(
+        manifest=manifest_path,
+        duration=time.perf_counter() - started,
+        output=output,
+        error=error,
+        phases=orchestrator.timer.totals() if orchestrator else {},
+    )
+
+
+def _echo_batch_summary(results: list[BatchResult]) -> None:
+    click.echo("\n" + "=" * 20 + " Batch Summary " + "=" * 20)
+    for result in results:
+        if result.ok:
+            slowest = result.slowest_phase()
+            detail = f"; slowest: {slowest[0]} {slowest[1]:.1f}s" if slowest else ""
+            click.secho(
+                f"✅ {result.manifest} → {result.output} "
+                f"({result.duration:.1f}s{detail})",
+                fg="green",
+            )
+        else:
+            first_line = (result.error or "").strip().splitlines()[:1]
+            click.secho(
+                f"❌ {result.manifest} ({result.duration:.1f}s): "
+                f"{first_line[0] if first_line else 'failed'}",
+                fg="red",
+                err=True,
+            )
+    built = sum(result.ok for result in results)
+    click.echo(f"{built} of {len(results)} packages built and verified.")
+
+
 @cli.command("package")
 @click.option(
     "--private-key-path",
@@ -99,10 +287,51 @@ def keygen(out_dir: str) -> None:
 )
 @click.option(
     "--manifest",
-    "pyproject_toml_path",
-    default="pyproject.toml",
-    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
-    help="Path to the pyproject.toml manifest file.",
+    "manifest_patterns",
+    multiple=True,
+    default=["pyproject.toml"],
+    metavar="PATH",
+    help="Path or glob of pyproject.toml manifests. Repeatable; several "
+    "manifests are built as a batch.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Manifests to build in parallel in a batch. Defaults to the CPU count.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of local dependency wheels to build in parallel.",
+)
+@click.option(
+    "--compression-level",
+    type=click.IntRange(min=1, max=22),
+    help="zstd level for every package section (overrides pyproject.toml).",
+)
+@click.option(
+    "--compression-threads",
+    type=click.IntRange(min=0),
+    help="zstd worker threads per section; 0 uses every CPU.",
+)
+@click.option(
+    "--compression",
+    "compression_overrides",
+    multiple=True,
+    metavar="SECTION:LEVEL[:THREADS]",
+    help="Per-section zstd settings, e.g. 'python_install:19:0'. Repeatable.",
+)
+@click.option(
+    "--compile-bytecode/--no-compile-bytecode",
+    default=None,
+    help="Ship unchecked-hash .pyc files for the stdlib and site-packages payload.",
+)
+@click.option(
+    "--trace",
+    "trace_path",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    help="Write a Chrome/Perfetto trace of the build phases to this file.",
 )
 @click.pass_context
 def package_command(
@@ -110,70 +339,44 @@ def package_command(
     private_key_path: str | None,
     public_key_path: str | None,
     out: str | None,
-    pyproject_toml_path: str,
+    manifest_patterns: tuple[str, ...],
+    workers: int | None,
+    jobs: int | None,
+    compression_level: int | None,
+    compression_threads: int | None,
+    compression_overrides: tuple[str, ...],
+    compile_bytecode: bool | None,
+    trace_path: str | None,
 ) -> None:
     """Packages the provider and immediately verifies it."""
-    click.echo("🚀 Packaging provider...")
+    options = BuildOptions(
+        private_key_path=private_key_path,
+        public_key_path=public_key_path,
+        out=out,
+        jobs=jobs,
+        compression_level=compression_level,
+        compression_threads=compression_threads,
+        compression_overrides=compression_overrides,
+        compile_bytecode=compile_bytecode,
+        trace_path=trace_path,
+    )
     try:
-        manifest_path = Path(pyproject_toml_path)
-        with manifest_path.open("rb") as f:
-            pyproject_data = tomllib.load(f)
+        manifests = expand_manifests(manifest_patterns)
+    except BuildError as e:
+        raise click.BadParameter(str(e), param_hint="'--manifest'") from e
+    if len(manifests) > 1:
+        _package_batch(manifests, options, workers=workers)
+        return
 
-        pyvider_conf = pyproject_data.get("tool", {}).get("pyvider", {})
-        if not pyvider_conf:
-            raise click.UsageError(
-                "A [tool.pyvider] section was not found in pyproject.toml."
-            )
-
-        build_conf = pyvider_conf.get("build", {})
-        signing_conf = pyvider_conf.get("signing", {})
-        manifest_dir = manifest_path.parent
-
-        final_out = Path(
-            out
-            or manifest_dir
-            / pyvider_conf.get("output_path", "dist/terraform-provider-pyvider")
-        )
-        final_key = Path(
-            private_key_path
-            or manifest_dir
-            / signing_conf.get("private_key_path", "keys/provider-private.key")
-        )
-        final_pub_key = Path(
-            public_key_path
-            or manifest_dir
-            / signing_conf.get("public_key_path", "keys/provider-public.key")
-        )
-        entry_point = pyvider_conf.get("entry_point")
-        python_version = pyvider_conf.get("python_version")
-
-        if not all([final_out, final_key, final_pub_key, entry_point]):
-            raise click.UsageError(
-                "Missing required configuration. Check paths in [tool.pyvider] or provide them as CLI options."
-            )
-
-        if not final_key.exists():
-            raise click.UsageError(
-                f"Private key not found at '{final_key}'. Please run `pyvbuild keygen` to generate keys."
-            )
-        if not final_pub_key.exists():
-            raise click.UsageError(
-                f"Public key not found at '{final_pub_key}'. Please run `pyvbuild keygen` to generate keys."
-            )
-
-        launcher_bin_path = ensure_go_binary("pspf-launcher")
-
-        orchestrator = BuildOrchestrator(
-            launcher_bin_path=str(launcher_bin_path),
-            package_integrity_key_path=str(final_key),
-            public_key_path=str(final_pub_key),
-            output_pspf_path=str(final_out),
-            build_config=build_conf,
-            manifest_dir=manifest_dir,
-            entry_point=entry_point,
-            python_version=python_version,
-        )
-        orchestrator.build_package()
+    click.echo("🚀 Packaging provider...")
+    try:
+        orchestrator, final_out, final_pub_key = _prepare_build(manifests[0], options)
+        try:
+            orchestrator.build_package()
+        finally:
+            if trace_path:
+                orchestrator.timer.write_chrome_trace(Path(trace_path))
+                click.echo(f"⏱️  Build trace written to {trace_path}")
         click.secho(f"✅ Package built successfully: {final_out}", fg="green")
 
         click.echo("\n" + "=" * 20 + " Auto-Verification " + "=" * 20)
@@ -188,6 +391,33 @@ def package_command(
         raise click.Abort() from e
 
 
+def _package_batch(
+    manifests: list[Path], options: BuildOptions, *, workers: int | None
+) -> None:
+    if options.out:
+        raise click.UsageError("--out cannot be used with several manifests.")
+    workers = workers or default_workers(len(manifests))
+    click.echo(
+        f"🚀 Packaging {len(manifests)} providers with {workers} parallel workers..."
+    )
+    try:
+        # Compile the Go tools once, before the workers look them up.
+        ensure_go_binaries("pspf-launcher", "pspf-packager")
+    except BuildError as e:
+        click.secho(f"❌ Packaging Failed:\n{e}", fg="red", err=True)
+        raise click.Abort() from e
+
+    results = run_batch(_build_batch_target, manifests, options, workers=workers)
+    for result in results:
+        if not result.ok:
+            click.secho(
+                f"\n❌ {result.manifest} failed:\n{result.error}", fg="red", err=True
+            )
+    _echo_batch_summary(results)
+    if not all(result.ok for result in results):
+        raise click.exceptions.Exit(1)
+
+
 @cli.command("verify")
 @click.argument(
     "package_file",
@@ -202,6 +432,9 @@ def verify_command(
     package_file: str | None, public_key_path: str | None
 ) -> None:
     """Verifies a PSPF package."""
+    from .crypto import load_public_key
+    from .packaging.reader import PspfReader
+
     manifest_path = Path("pyproject.toml")
     final_package_file = Path(package_file) if package_file else None
     final_public_key = Path(public_key_path) if public_key_path else None
@@ -229,34 +462,178 @@ def verify_command(
     try:
         reader = PspfReader(final_package_file)
         click.echo(reader.get_info())
-
-        packager_executable = ensure_go_binary("pspf-packager")
-        verify_cmd_args = [
-            str(packager_executable),
-            "verify",
-            str(final_package_file),
-            "--public-key",
-            str(final_public_key),
-        ]
-        result = subprocess.run(
-            verify_cmd_args, check=True, capture_output=True, text=True
-        )
-        click.secho("✅ Go-based cryptographic verification successful.", fg="green")
-        if result.stderr:
-            click.echo(result.stderr)
-    except InvalidFooterError as e:
+        reader.verify(load_public_key(final_public_key))
+        click.secho("✅ Cryptographic verification successful.", fg="green")
+    except VerificationError as e:
         click.secho(f"❌ Python-based verification failed: {e}", fg="red", err=True)
         raise click.Abort() from e
-    except (BuildError, subprocess.CalledProcessError) as e:
-        stderr_info = (
-            f"\n  Stderr: {e.stderr.strip()}"
-            if hasattr(e, "stderr") and e.stderr
-            else ""
+
+
+@cli.command("ls")
+@click.argument(
+    "package_file", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+)
+@click.option(
+    "--section",
+    type=click.Choice(ARCHIVE_SECTIONS),
+    default="payload",
+    show_default=True,
+    help="The section archive to list.",
+)
+@click.option(
+    "--long", "-l", "long_format", is_flag=True, help="Show modes, sizes and SHA-256s."
+)
+def ls_command(package_file: str, section: str, long_format: bool) -> None:
+    """Lists the files in a section of a PSPF package."""
+    import tarfile
+
+    import zstandard
+
+    from .packaging.reader import PspfReader
+
+    try:
+        with PspfReader(Path(package_file)) as reader:
+            for member in reader.members(section):
+                if not long_format:
+                    click.echo(member.path)
+                    continue
+                sha256 = member.sha256[:12] if member.sha256 else "-"
+                click.echo(
+                    f"{stat.filemode(member.mode)[1:]} {member.size:>12} {sha256:<12} "
+                    f"{member.path}"
+                )
+    except (VerificationError, tarfile.TarError, zstandard.ZstdError) as e:
+        click.secho(
+            f"❌ Could not list the {section} section: {e}", fg="red", err=True
         )
+        raise click.Abort() from e
+
+
+@cli.command("cat")
+@click.argument(
+    "package_file", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+)
+@click.argument("member_path")
+@click.option(
+    "--section",
+    type=click.Choice(ARCHIVE_SECTIONS),
+    default=None,
+    help="The section archive to read. Defaults to metadata for its own files, "
+    "else payload.",
+)
+def cat_command(package_file: str, member_path: str, section: str | None) -> None:
+    """
+    Writes one file from a PSPF package to stdout. When the package has a
+    member index, the file is checked against its recorded SHA-256.
+    """
+    import tarfile
+
+    import zstandard
+
+    from .packaging.reader import VERIFY_CHUNK_SIZE, PspfReader
+
+    with PspfReader(Path(package_file)) as reader:
+        digest = hashlib.sha256()
+        try:
+            if section is None:
+                metadata = {m.path for m in reader.members("metadata")}
+                section = "metadata" if member_path in metadata else "payload"
+            expected = next(
+                (
+                    m.sha256
+                    for m in reader.index() or ()
+                    if (m.section, m.path) == (section, member_path)
+                ),
+                None,
+            )
+            with reader.open_member(section, member_path) as member:
+                while chunk := member.read(VERIFY_CHUNK_SIZE):
+                    digest.update(chunk)
+                    click.echo(chunk, nl=False)
+        except (
+            FileNotFoundError,
+            VerificationError,
+            tarfile.TarError,
+            zstandard.ZstdError,
+        ) as e:
+            click.secho(f"❌ {e}", fg="red", err=True)
+            raise click.Abort() from e
+    if expected is not None and digest.hexdigest() != expected:
         click.secho(
-            f"❌ Go-based verification failed: {e}{stderr_info}", fg="red", err=True
+            f"❌ '{member_path}' does not match the SHA-256 in the member index.",
+            fg="red",
+            err=True,
         )
+        raise click.exceptions.Exit(1)
+
+
+@cli.command("delta")
+@click.argument(
+    "old_package", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+)
+@click.argument(
+    "new_package", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+)
+@click.option(
+    "--out",
+    "-o",
+    required=True,
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    help="Path to write the delta to.",
+)
+def delta_command(old_package: str, new_package: str, out: str) -> None:
+    """Creates a delta that upgrades OLD_PACKAGE to NEW_PACKAGE."""
+    from .packaging.delta import create_delta
+    from .runtime_cache import format_size
+
+    try:
+        stats = create_delta(Path(old_package), Path(new_package), Path(out))
+    except (BuildError, VerificationError) as e:
+        click.secho(f"❌ Delta failed: {e}", fg="red", err=True)
         raise click.Abort() from e
+    reused = ", ".join(stats.reused_sections) or "none"
+    click.echo(f"Reused sections: {reused}")
+    click.secho(
+        f"✅ Delta written to {out}: {format_size(stats.delta_size)} "
+        f"for a {format_size(stats.new_size)} package "
+        f"({stats.delta_size / stats.new_size:.1%}).",
+        fg="green",
+    )
+
+
+@cli.command("apply-delta")
+@click.argument(
+    "old_package", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+)
+@click.argument(
+    "delta_file", type=click.Path(exists=True, dir_okay=False, resolve_path=True)
+)
+@click.option(
+    "--out",
+    "-o",
+    required=True,
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    help="Path to write the upgraded package to.",
+)
+@click.option(
+    "--public-key-path",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help="Verify the result against this key instead of the one OLD_PACKAGE embeds.",
+)
+def apply_delta_command(
+    old_package: str, delta_file: str, out: str, public_key_path: str | None
+) -> None:
+    """Rebuilds a new package from OLD_PACKAGE and DELTA_FILE and verifies it."""
+    from .crypto import load_public_key
+    from .packaging.delta import apply_delta
+
+    try:
+        public_key = load_public_key(Path(public_key_path)) if public_key_path else None
+        apply_delta(Path(old_package), Path(delta_file), Path(out), public_key)
+    except VerificationError as e:
+        click.secho(f"❌ Applying the delta failed: {e}", fg="red", err=True)
+        raise click.Abort() from e
+    click.secho(f"✅ Package rebuilt and verified: {out}", fg="green")
 
 
 @cli.command("clean")
@@ -272,4 +649,92 @@ def clean_command() -> None:
         click.secho("i️ Cache directory not found, nothing to clean.", fg="yellow")
 
 
+@cli.group("cache")
+def cache_group() -> None:
+    """Inspects and prunes the launcher's runtime cache."""
+
+
+@cache_group.command("list")
+def cache_list_command() -> None:
+    """Lists provider environments, least recently used first."""
+    from .runtime_cache import (
+        format_size,
+        launcher_cache_dir,
+        list_environments,
+        list_store_entries,
+    )
+
+    root = launcher_cache_dir()
+    environments = list_environments(root)
+    store = list_store_entries(root)
+    if not environments and not store:
+        click.secho(f"i️ No runtime cache found at {root}.", fg="yellow")
+        return
+
+    click.echo(f"Runtime cache: {root}")
+    for env in environments:
+        last_used = datetime.fromtimestamp(env.last_used).strftime("%Y-%m-%d %H:%M")
+        status = "  (in use)" if env.in_use else ""
+        click.echo(f"  {env.name:<48} {format_size(env.size):>10}  {last_used}{status}")
+    for entry in store:
+        label = f"store/{entry.section}/{entry.path.name[:16]}"
+        click.echo(f"  {label:<48} {format_size(entry.size):>10}")
+    total = sum(e.size for e in environments) + sum(e.size for e in store)
+    click.echo(f"Total: {format_size(total)}")
+
+
+def _parse_option(parser: str) -> Any:
+    """Returns a click callback that parses values with a `runtime_cache` parser."""
+
+    def callback(ctx: click.Context, param: click.Parameter, value: str | None) -> Any:
+        from . import runtime_cache
+
+        if value is None:
+            return None
+        try:
+            return getattr(runtime_cache, parser)(value)
+        except ValueError as e:
+            raise click.BadParameter(str(e)) from e
+
+    return callback
+
+
+@cache_group.command("gc")
+@click.option(
+    "--max-size",
+    callback=_parse_option("parse_size"),
+    metavar="SIZE",
+    help="Evict least recently used environments until the cache fits, e.g. 5G.",
+)
+@click.option(
+    "--older-than",
+    callback=_parse_option("parse_duration"),
+    metavar="DURATION",
+    help="Evict environments not used for this long, e.g. 30d or 12h.",
+)
+@click.option("--dry-run", is_flag=True, help="Report what would be removed.")
+def cache_gc_command(
+    max_size: int | None, older_than: float | None, dry_run: bool
+) -> None:
+    """Evicts unused provider environments and unreferenced shared runtimes."""
+    from .runtime_cache import collect_garbage, format_size, launcher_cache_dir
+
+    report = collect_garbage(
+        launcher_cache_dir(), max_size=max_size, older_than=older_than, dry_run=dry_run
+    )
+    verb = "Would remove" if dry_run else "Removed"
+    for env in report.evicted:
+        click.echo(f"{verb} {env.name} ({format_size(env.size)})")
+    for entry in report.removed_store_entries:
+        label = f"store/{entry.section}/{entry.path.name[:16]}"
+        click.echo(f"{verb} {label} ({format_size(entry.size)})")
+    for env in report.skipped_in_use:
+        click.secho(f"i️ Kept {env.name}: in use by a running provider.", fg="yellow")
+    if report.store_locked:
+        click.secho(
+            "i️ Skipped the shared store: a provider is being set up.", fg="yellow"
+        )
+    click.secho(f"✅ {verb} {format_size(report.freed)}.", fg="green")
+
+
 main = cli
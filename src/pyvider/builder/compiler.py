@@ -1,8 +1,16 @@
 """
 On-demand compiler for the Go binaries bundled with pyvider-builder.
+
+Compiled binaries are cached under a directory named after a hash of the
+bundled Go sources and the Go toolchain configuration, so a changed source
+tree, Go version or target platform never reuses a stale binary.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import importlib.resources
+import os
 from pathlib import Path
 import shutil
 import subprocess
@@ -10,6 +18,7 @@ import subprocess
 import click
 
 from .exceptions import BuildError
+from .locking import file_lock
 
 
 def _get_cache_dir() -> Path:
@@ -40,24 +49,44 @@ def _find_go_source_path() -> Path:
         ) from e
 
 
+def _go_env() -> str:
+    """Returns the Go settings that affect the compiled output."""
+    result = subprocess.run(
+        ["go", "env", "GOOS", "GOARCH", "GOVERSION", "CGO_ENABLED"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise BuildError(f"Failed to query the Go environment: {result.stderr.strip()}")
+    return result.stdout
+
+
+@functools.cache
+def _source_cache_key(go_module_root: Path) -> str:
+    """
+    Hashes every file in the Go module (including go.mod and go.sum) together
+    with GOOS, GOARCH, the Go version and CGO_ENABLED.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(p for p in go_module_root.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(go_module_root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    digest.update(_go_env().encode())
+    return digest.hexdigest()[:16]
+
+
 def ensure_go_binary(tool_name: str) -> Path:
     """
     Ensures a Go binary is compiled and ready, returning its path.
+
+    Compilation happens under a per-key file lock and the binary is moved
+    into place atomically, so concurrent processes share a single build.
     """
     if not shutil.which("go"):
         raise BuildError("Go compiler not found in PATH. Please install Go.")
 
-    bin_cache_dir = _get_cache_dir() / "bin"
-    bin_cache_dir.mkdir(exist_ok=True)
-    binary_path = bin_cache_dir / tool_name
-
-    if binary_path.exists():
-        return binary_path
-
-    click.secho(
-        f"Go binary '{tool_name}' not found in cache. Compiling...", fg="yellow"
-    )
-
     try:
         go_module_root = _find_go_source_path()
 
@@ -66,24 +95,44 @@ def ensure_go_binary(tool_name: str) -> Path:
                 f"go.mod not found in the discovered source path: {go_module_root}"
             )
 
-        # Add -buildvcs=false to prevent Go from trying to find a .git directory.
-        # This is essential for building in clean environments like Docker or CI.
-        cmd = [
-            "go",
-            "build",
-            "-buildvcs=false",
-            "-o",
-            str(binary_path),
-            f"./{tool_name}",
-        ]
-        result = subprocess.run(
-            cmd, cwd=go_module_root, capture_output=True, text=True, check=False
-        )
+        bin_cache_dir = _get_cache_dir() / "bin" / _source_cache_key(go_module_root)
+        binary_path = bin_cache_dir / tool_name
+        if binary_path.exists():
+            return binary_path
 
-        if result.returncode != 0:
-            raise BuildError(
-                f"Failed to compile Go binary '{tool_name}'.\nStderr: {result.stderr.strip()}"
+        bin_cache_dir.mkdir(parents=True, exist_ok=True)
+        with file_lock(bin_cache_dir / f".{tool_name}.lock"):
+            # Another process may have finished the build while we waited.
+            if binary_path.exists():
+                return binary_path
+
+            click.secho(
+                f"Go binary '{tool_name}' not found in cache. Compiling...",
+                fg="yellow",
             )
+            partial_path = bin_cache_dir / f".{tool_name}.{os.getpid()}.partial"
+
+            # Add -buildvcs=false to prevent Go from trying to find a .git directory.
+            # This is essential for building in clean environments like Docker or CI.
+            cmd = [
+                "go",
+                "build",
+                "-buildvcs=false",
+                "-o",
+                str(partial_path),
+                f"./{tool_name}",
+            ]
+            result = subprocess.run(
+                cmd, cwd=go_module_root, capture_output=True, text=True, check=False
+            )
+
+            if result.returncode != 0:
+                partial_path.unlink(missing_ok=True)
+                raise BuildError(
+                    f"Failed to compile Go binary '{tool_name}'.\nStderr: {result.stderr.strip()}"
+                )
+
+            partial_path.replace(binary_path)
 
         click.secho(
             f"Successfully compiled '{tool_name}' to '{binary_path}'.", fg="green"
@@ -96,3 +145,10 @@ def ensure_go_binary(tool_name: str) -> Path:
         raise BuildError(
             f"An unexpected error occurred during Go compilation: {e}"
         ) from e
+
+
+def ensure_go_binaries(*tool_names: str) -> dict[str, Path]:
+    """Ensures several Go binaries concurrently, returning their paths by name."""
+    with ThreadPoolExecutor(max_workers=len(tool_names) or 1) as executor:
+        paths = list(executor.map(ensure_go_binary, tool_names))
+    return dict(zip(tool_names, paths, strict=True))
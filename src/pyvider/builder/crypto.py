@@ -2,10 +2,13 @@
 Centralized cryptographic operations for the Pyvider builder.
 """
 
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from pathlib import Path
 
-from .exceptions import SigningError
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa, utils
+
+from .exceptions import SignatureVerificationError, SigningError, VerificationError
 
 
 def generate_keys() -> tuple[rsa.RSAPrivateKey, rsa.RSAPublicKey]:
@@ -14,6 +17,28 @@ def generate_keys() -> tuple[rsa.RSAPrivateKey, rsa.RSAPublicKey]:
     return private_key, private_key.public_key()
 
 
+def load_private_key(path: Path) -> rsa.RSAPrivateKey:
+    """Loads an unencrypted RSA private key (PKCS#1 or PKCS#8 PEM)."""
+    try:
+        private_key = serialization.load_pem_private_key(path.read_bytes(), None)
+    except (OSError, TypeError, ValueError) as e:
+        raise SigningError(f"Could not load private key from {path}: {e}") from e
+    if not isinstance(private_key, rsa.RSAPrivateKey):
+        raise SigningError(f"Key in {path} is not an RSA private key.")
+    return private_key
+
+
+def load_public_key(path: Path) -> rsa.RSAPublicKey:
+    """Loads an RSA public key from a PEM file."""
+    try:
+        public_key = serialization.load_pem_public_key(path.read_bytes())
+    except (OSError, ValueError) as e:
+        raise VerificationError(f"Could not load public key from {path}: {e}") from e
+    if not isinstance(public_key, rsa.RSAPublicKey):
+        raise VerificationError(f"Key in {path} is not an RSA public key.")
+    return public_key
+
+
 def sign_payload_hash(payload_hash: bytes, private_key: rsa.RSAPrivateKey) -> bytes:
     """Signs a 32-byte hash using RSA-PSS, matching the Go implementation."""
     if not isinstance(payload_hash, bytes) or len(payload_hash) != 32:
@@ -24,5 +49,20 @@ def sign_payload_hash(payload_hash: bytes, private_key: rsa.RSAPrivateKey) -> by
         padding.PSS(
             mgf=padding.MGF1(hashes.SHA256()), salt_length=hashes.SHA256.digest_size
         ),
-        hashes.SHA256(),
+        utils.Prehashed(hashes.SHA256()),
     )
+
+
+def verify_payload_hash(
+    payload_hash: bytes, signature: bytes, public_key: rsa.RSAPublicKey
+) -> None:
+    """Verifies an RSA-PSS signature over a 32-byte SHA-256 hash."""
+    try:
+        public_key.verify(
+            signature,
+            payload_hash,
+            padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.AUTO),
+            utils.Prehashed(hashes.SHA256()),
+        )
+    except InvalidSignature as e:
+        raise SignatureVerificationError("Package PSS signature is invalid.") from e
@@ -0,0 +1,341 @@
+package main
+
+import (
+	"archive/tar"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"runtime"
+	"strings"
+	"sync"
+
+	"pspf-tools/go/pkg/pspf"
+
+	"github.com/valyala/gozstd"
+)
+
+// inlineWriteThreshold is the largest file handed to the write pool; bigger
+// files are streamed to disk by the archive reader itself, so pooled writes
+// never hold more than a few MB in memory.
+const inlineWriteThreshold = 1024 * 1024
+
+// extractWriteWorkers bounds concurrent file writes within one archive.
+var extractWriteWorkers = runtime.NumCPU()
+
+type fileWrite struct {
+	target string
+	mode   os.FileMode
+	data   []byte
+}
+
+// writePool writes extracted files on a fixed set of goroutines while the
+// archive reader moves on to the next entry.
+type writePool struct {
+	jobs chan fileWrite
+	wg   sync.WaitGroup
+
+	mu  sync.Mutex
+	err error
+}
+
+func newWritePool(workers int) *writePool {
+	if workers < 1 {
+		workers = 1
+	}
+	p := &writePool{jobs: make(chan fileWrite, workers*2)}
+	p.wg.Add(workers)
+	for i := 0; i < workers; i++ {
+		go p.run()
+	}
+	return p
+}
+
+func (p *writePool) run() {
+	defer p.wg.Done()
+	for job := range p.jobs {
+		if p.failed() != nil {
+			continue
+		}
+		if err := os.WriteFile(job.target, job.data, job.mode); err != nil {
+			p.mu.Lock()
+			if p.err == nil {
+				p.err = err
+			}
+			p.mu.Unlock()
+		}
+	}
+}
+
+func (p *writePool) failed() error {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+	return p.err
+}
+
+// wait stops accepting work and returns the first write error, if any.
+func (p *writePool) wait() error {
+	close(p.jobs)
+	p.wg.Wait()
+	return p.failed()
+}
+
+func withinDir(dest, target string) bool {
+	rel, err := filepath.Rel(filepath.Clean(dest), filepath.Clean(target))
+	return err == nil && rel != ".." && !strings.HasPrefix(rel, ".."+string(filepath.Separator))
+}
+
+// safeDirs tracks the directories under an extraction root known to be real
+// directories. An archive that creates a symlink and then writes below it
+// would otherwise write wherever the link points.
+type safeDirs struct {
+	dest  string
+	known map[string]bool
+}
+
+// check fails if any existing directory between dest and dir is a symlink.
+// A directory checked once stays safe: a later symlink entry cannot replace
+// it, because os.Symlink never overwrites.
+func (d *safeDirs) check(dir string) error {
+	if dir == d.dest || d.known[dir] {
+		return nil
+	}
+	if err := d.check(filepath.Dir(dir)); err != nil {
+		return err
+	}
+	info, err := os.Lstat(dir)
+	if os.IsNotExist(err) {
+		return nil
+	}
+	if err != nil {
+		return err
+	}
+	if !info.IsDir() {
+		return fmt.Errorf("tar entry path passes through non-directory %s", dir)
+	}
+	d.known[dir] = true
+	return nil
+}
+
+// unTar extracts a zstd-compressed tar stream into dest and returns the names
+// of the regular files it contained. Small files are written by a worker
+// pool; hard links are created once every regular file is on disk. Entries
+// that would land outside dest, symlinks pointing outside it, writes through
+// a symlink and duplicate entries are rejected, so an archive cannot write
+// outside dest even before its package's signature has been checked.
+func unTar(r io.Reader, dest string) ([]string, error) {
+	zr := gozstd.NewReader(r)
+	defer zr.Release()
+	tr := tar.NewReader(zr)
+	pool := newWritePool(extractWriteWorkers)
+	dirs := &safeDirs{dest: filepath.Clean(dest), known: map[string]bool{}}
+	seen := map[string]bool{}
+	var files []string
+	var links []*tar.Header
+
+	err := func() error {
+		for {
+			header, err := tr.Next()
+			if err == io.EOF {
+				return nil
+			}
+			if err != nil {
+				return err
+			}
+			target := filepath.Join(dest, header.Name)
+			if !withinDir(dest, target) {
+				return fmt.Errorf("zip slip detected in tar archive")
+			}
+			if seen[target] {
+				return fmt.Errorf("tar entry %s appears twice", header.Name)
+			}
+			seen[target] = true
+			if err := dirs.check(filepath.Dir(target)); err != nil {
+				return err
+			}
+
+			switch header.Typeflag {
+			case tar.TypeDir:
+				if err := os.MkdirAll(target, 0755); err != nil {
+					return err
+				}
+			case tar.TypeReg:
+				files = append(files, header.Name)
+				if err := os.MkdirAll(filepath.Dir(target), 0755); err != nil {
+					return err
+				}
+				if header.Size <= inlineWriteThreshold {
+					data := make([]byte, header.Size)
+					if _, err := io.ReadFull(tr, data); err != nil {
+						return err
+					}
+					pool.jobs <- fileWrite{target: target, mode: os.FileMode(header.Mode), data: data}
+				} else if err := writeStream(tr, target, os.FileMode(header.Mode)); err != nil {
+					return err
+				}
+			case tar.TypeSymlink:
+				if filepath.IsAbs(header.Linkname) || !withinDir(dest, filepath.Join(filepath.Dir(target), header.Linkname)) {
+					return fmt.Errorf("tar symlink %s points outside the archive", header.Name)
+				}
+				if err := os.MkdirAll(filepath.Dir(target), 0755); err != nil {
+					return err
+				}
+				if err := os.Symlink(header.Linkname, target); err != nil {
+					return err
+				}
+			case tar.TypeLink:
+				// Hard links appear in some python-build-standalone archives,
+				// which can be embedded as-is.
+				if !withinDir(dest, filepath.Join(dest, header.Linkname)) {
+					return fmt.Errorf("zip slip detected in tar archive")
+				}
+				links = append(links, header)
+			}
+			if err := pool.failed(); err != nil {
+				return err
+			}
+		}
+	}()
+	if waitErr := pool.wait(); err == nil {
+		err = waitErr
+	}
+	if err != nil {
+		return nil, err
+	}
+
+	for _, header := range links {
+		target := filepath.Join(dest, header.Name)
+		source := filepath.Join(dest, header.Linkname)
+		if err := dirs.check(filepath.Dir(source)); err != nil {
+			return nil, err
+		}
+		if err := os.MkdirAll(filepath.Dir(target), 0755); err != nil {
+			return nil, err
+		}
+		if err := os.Link(source, target); err != nil {
+			return nil, err
+		}
+	}
+	return files, nil
+}
+
+func writeStream(r io.Reader, target string, mode os.FileMode) error {
+	f, err := os.OpenFile(target, os.O_CREATE|os.O_WRONLY|os.O_TRUNC, mode)
+	if err != nil {
+		return err
+	}
+	if _, err := io.Copy(f, r); err != nil {
+		f.Close()
+		return err
+	}
+	return f.Close()
+}
+
+// extractSections unpacks the metadata and payload archives into workDir
+// and, unless the shared store already holds them, the Python install and
+// uv binary into rt's store entries. All four run concurrently, each straight
+// from the package file. Trees named by reuse are linked from the previous
+// environment instead. It returns the payload's regular files.
+func extractSections(f *os.File, footer *pspf.Footer, workDir string, rt *sharedRuntime, reuse *treeReuse) ([]string, error) {
+	var (
+		wg           sync.WaitGroup
+		mu           sync.Mutex
+		firstErr     error
+		payloadFiles []string
+	)
+	run := func(name string, fn func() error) {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			defer timings.begin("extract:" + name)()
+			if err := fn(); err != nil {
+				mu.Lock()
+				if firstErr == nil {
+					firstErr = fmt.Errorf("failed to extract %s: %w", name, err)
+				}
+				mu.Unlock()
+			}
+		}()
+	}
+
+	run("metadata", func() error {
+		if reuse.has("metadata_extracted") {
+			return reuse.link("metadata_extracted", workDir)
+		}
+		_, err := unTar(sectionReader(f, footer.MetadataTgzOffset, footer.MetadataTgzSize), filepath.Join(workDir, "metadata_extracted"))
+		return err
+	})
+	run("payload", func() error {
+		if reuse.has("payload_extracted") {
+			if err := reuse.link("payload_extracted", workDir); err != nil {
+				return err
+			}
+			files, err := regularFiles(filepath.Join(workDir, "payload_extracted"))
+			payloadFiles = files
+			return err
+		}
+		files, err := unTar(sectionReader(f, footer.PayloadTgzOffset, footer.PayloadTgzSize), filepath.Join(workDir, "payload_extracted"))
+		payloadFiles = files
+		return err
+	})
+	if reuse.has(".venv") {
+		run("venv", func() error { return reuse.link(".venv", workDir) })
+	}
+	run("python_install", func() error { return rt.populatePythonInstall(f) })
+	run("uv", func() error { return rt.populateUv(f) })
+	wg.Wait()
+	return payloadFiles, firstErr
+}
+
+// verifyAndExtract verifies the package's signature, then wipes workDir and
+// extracts the package into it and the shared store. If verification fails,
+// nothing is extracted.
+//
+// PSPF_OVERLAP_VERIFY=1 extracts while the signature is verified on another
+// goroutine. unTar keeps every write inside its destination, nothing
+// extracted is executed until verification succeeds, and store entries are
+// only published once it has. If it fails, workDir is removed again.
+func verifyAndExtract(f *os.File, footer *pspf.Footer, workDir string, rt *sharedRuntime, reuse *treeReuse) ([]string, error) {
+	verify := func() error {
+		defer timings.begin("verify_signature")()
+		return verifyPackage(f, footer)
+	}
+	overlap := envFlag("PSPF_OVERLAP_VERIFY")
+	if !overlap {
+		if err := verify(); err != nil {
+			return nil, fmt.Errorf("package verification failed: %w", err)
+		}
+	}
+
+	os.RemoveAll(workDir)
+	if err := os.MkdirAll(workDir, 0755); err != nil {
+		return nil, err
+	}
+
+	var verifyErr error
+	if overlap {
+		verified := make(chan struct{})
+		go func() {
+			verifyErr = verify()
+			close(verified)
+		}()
+		rt.verified = func() error {
+			<-verified
+			return verifyErr
+		}
+		defer func() { rt.verified = nil }()
+	}
+
+	payloadFiles, extractErr := extractSections(f, footer, workDir, rt, reuse)
+	if rt.verified != nil {
+		verifyErr = rt.verified()
+	}
+	if verifyErr != nil {
+		os.RemoveAll(workDir)
+		return nil, fmt.Errorf("package verification failed: %w", verifyErr)
+	}
+	if extractErr != nil {
+		return nil, extractErr
+	}
+	return payloadFiles, nil
+}
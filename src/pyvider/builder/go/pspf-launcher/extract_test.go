@@ -0,0 +1,185 @@
+package main
+
+import (
+	"archive/tar"
+	"bytes"
+	"crypto/rand"
+	"crypto/rsa"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/valyala/gozstd"
+)
+
+type tarEntry struct {
+	name, linkname string
+	// symlink, when set, makes the entry a symlink to it.
+	symlink string
+	data    []byte
+	mode    int64
+}
+
+func makeZstdTar(t *testing.T, entries []tarEntry) []byte {
+	var buf bytes.Buffer
+	zw := gozstd.NewWriter(&buf)
+	tw := tar.NewWriter(zw)
+	for _, e := range entries {
+		mode := e.mode
+		if mode == 0 {
+			mode = 0644
+		}
+		hdr := &tar.Header{Name: e.name, Mode: mode, Size: int64(len(e.data)), Typeflag: tar.TypeReg}
+		if e.linkname != "" {
+			hdr = &tar.Header{Name: e.name, Linkname: e.linkname, Mode: 0644, Typeflag: tar.TypeLink}
+		}
+		if e.symlink != "" {
+			hdr = &tar.Header{Name: e.name, Linkname: e.symlink, Mode: 0777, Typeflag: tar.TypeSymlink}
+		}
+		require.NoError(t, tw.WriteHeader(hdr))
+		if hdr.Typeflag == tar.TypeReg {
+			_, err := tw.Write(e.data)
+			require.NoError(t, err)
+		}
+	}
+	require.NoError(t, tw.Close())
+	require.NoError(t, zw.Close())
+	zw.Release()
+	return buf.Bytes()
+}
+
+func TestUnTar_PooledWritesAndHardLinks(t *testing.T) {
+	var entries []tarEntry
+	for i := 0; i < 200; i++ {
+		entries = append(entries, tarEntry{name: fmt.Sprintf("lib/mod%03d.py", i), data: []byte(fmt.Sprintf("VALUE = %d\n", i))})
+	}
+	large := bytes.Repeat([]byte("x"), inlineWriteThreshold+1)
+	entries = append(entries,
+		tarEntry{name: "lib/large.so", data: large},
+		tarEntry{name: "bin/python3", linkname: "lib/mod007.py"},
+	)
+
+	dest := t.TempDir()
+	files, err := unTar(bytes.NewReader(makeZstdTar(t, entries)), dest)
+	require.NoError(t, err)
+	assert.Len(t, files, 201)
+
+	for i := 0; i < 200; i++ {
+		data, err := os.ReadFile(filepath.Join(dest, fmt.Sprintf("lib/mod%03d.py", i)))
+		require.NoError(t, err)
+		assert.Equal(t, fmt.Sprintf("VALUE = %d\n", i), string(data))
+	}
+	largeData, err := os.ReadFile(filepath.Join(dest, "lib/large.so"))
+	require.NoError(t, err)
+	assert.Equal(t, large, largeData)
+	linked, err := os.ReadFile(filepath.Join(dest, "bin/python3"))
+	require.NoError(t, err)
+	assert.Equal(t, "VALUE = 7\n", string(linked))
+}
+
+func TestUnTar_HardLinkSlip(t *testing.T) {
+	archive := makeZstdTar(t, []tarEntry{{name: "escape", linkname: "../../etc/passwd"}})
+	_, err := unTar(bytes.NewReader(archive), t.TempDir())
+	assert.ErrorContains(t, err, "zip slip")
+}
+
+func TestUnTar_NeverWritesOutsideDest(t *testing.T) {
+	cases := map[string][]tarEntry{
+		"absolute symlink": {
+			{name: "x", symlink: "OUTSIDE"},
+			{name: "x/.bashrc", data: []byte("pwned")},
+		},
+		"relative symlink": {
+			{name: "lib/x", symlink: "../../outside"},
+			{name: "lib/x/.bashrc", data: []byte("pwned")},
+		},
+		"symlink to a directory inside": {
+			{name: "real/keep", data: []byte("ok")},
+			{name: "x", symlink: "real"},
+			{name: "x/.bashrc", data: []byte("pwned")},
+		},
+		"file replacing a symlink": {
+			{name: "x", symlink: "real"},
+			{name: "x", data: []byte("pwned")},
+		},
+	}
+	for name, entries := range cases {
+		t.Run(name, func(t *testing.T) {
+			outside := t.TempDir()
+			for i, e := range entries {
+				entries[i].symlink = strings.ReplaceAll(e.symlink, "OUTSIDE", outside)
+			}
+			dest := filepath.Join(t.TempDir(), "a", "dest")
+			require.NoError(t, os.MkdirAll(dest, 0755))
+			// The relative case resolves two levels up, next to dest.
+			escaped := filepath.Join(filepath.Dir(filepath.Dir(dest)), "outside")
+			require.NoError(t, os.MkdirAll(escaped, 0755))
+
+			_, err := unTar(bytes.NewReader(makeZstdTar(t, entries)), dest)
+			assert.Error(t, err)
+			assert.NoFileExists(t, filepath.Join(outside, ".bashrc"))
+			assert.NoFileExists(t, filepath.Join(escaped, ".bashrc"))
+			assert.NoFileExists(t, filepath.Join(dest, "real", ".bashrc"))
+		})
+	}
+}
+
+func TestVerifyAndExtract(t *testing.T) {
+	key, err := rsa.GenerateKey(rand.Reader, 2048)
+	require.NoError(t, err)
+	sections := [5][]byte{
+		[]byte("launcher"),
+		[]byte("uv-binary"),
+		makeZstdTar(t, []tarEntry{{name: "bin/python3", data: []byte("#!python")}}),
+		makeZstdTar(t, []tarEntry{{name: "config.json", data: []byte(`{"entry_point": "m:f"}`)}}),
+		makeZstdTar(t, []tarEntry{{name: "app-0.1-py3-none-any.whl", data: []byte("wheel")}}),
+	}
+	path := writeSignedPackage(t, key, sections)
+
+	extract := func(t *testing.T) (string, *sharedRuntime, []string, error) {
+		f, err := os.Open(path)
+		require.NoError(t, err)
+		defer f.Close()
+		footer, err := readAndVerifyFooter(f)
+		require.NoError(t, err)
+		workDir := filepath.Join(t.TempDir(), "work")
+		rt, err := openSharedRuntime(f, footer, filepath.Join(t.TempDir(), "store"))
+		require.NoError(t, err)
+		files, err := verifyAndExtract(f, footer, workDir, rt, nil)
+		return workDir, rt, files, err
+	}
+
+	for _, overlap := range []string{"", "1"} {
+		t.Run("overlap="+overlap, func(t *testing.T) {
+			t.Setenv("PSPF_OVERLAP_VERIFY", overlap)
+			workDir, rt, files, err := extract(t)
+			require.NoError(t, err)
+			assert.Equal(t, []string{"app-0.1-py3-none-any.whl"}, files)
+			assert.FileExists(t, filepath.Join(rt.pythonInstall.Dir, "bin", "python3"))
+			assert.FileExists(t, filepath.Join(workDir, "metadata_extracted", "config.json"))
+			uv, err := os.ReadFile(rt.uvExePath())
+			require.NoError(t, err)
+			assert.Equal(t, "uv-binary", string(uv))
+		})
+	}
+
+	// A tampered package must leave nothing behind, in the store included.
+	data, err := os.ReadFile(path)
+	require.NoError(t, err)
+	data[len("launcheruv-")] ^= 0xff
+	require.NoError(t, os.WriteFile(path, data, 0755))
+	for _, overlap := range []string{"", "1"} {
+		t.Run("tampered/overlap="+overlap, func(t *testing.T) {
+			t.Setenv("PSPF_OVERLAP_VERIFY", overlap)
+			workDir, rt, _, err := extract(t)
+			assert.ErrorContains(t, err, "verification failed")
+			assert.NoDirExists(t, workDir)
+			assert.NoDirExists(t, rt.uv.Dir)
+			assert.NoDirExists(t, rt.pythonInstall.Dir)
+		})
+	}
+}
@@ -0,0 +1,67 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+)
+
+// exeFingerprint identifies an executable file cheaply, without reading its
+// contents. It changes whenever the file is replaced (device/inode), resized,
+// rewritten (mtime) or repackaged (footer checksum).
+type exeFingerprint struct {
+	Device         uint64 `json:"device"`
+	Inode          uint64 `json:"inode"`
+	Size           int64  `json:"size"`
+	ModTimeNs      int64  `json:"mtime_ns"`
+	FooterChecksum uint32 `json:"footer_checksum"`
+}
+
+// fingerprintFile computes the fingerprint of the executable at exePath.
+func fingerprintFile(exePath string) (exeFingerprint, error) {
+	f, err := os.Open(exePath)
+	if err != nil {
+		return exeFingerprint{}, err
+	}
+	defer f.Close()
+
+	info, err := f.Stat()
+	if err != nil {
+		return exeFingerprint{}, err
+	}
+	footer, err := readAndVerifyFooter(f)
+	if err != nil {
+		return exeFingerprint{}, err
+	}
+	device, inode, err := fileIdentity(f, info)
+	if err != nil {
+		return exeFingerprint{}, err
+	}
+	return exeFingerprint{
+		Device:         device,
+		Inode:          inode,
+		Size:           info.Size(),
+		ModTimeNs:      info.ModTime().UnixNano(),
+		FooterChecksum: footer.FooterStructChecksum,
+	}, nil
+}
+
+// fingerprintMatches reports whether the fingerprint stored at path equals fp.
+func fingerprintMatches(path string, fp exeFingerprint) bool {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return false
+	}
+	var stored exeFingerprint
+	if err := json.Unmarshal(data, &stored); err != nil {
+		return false
+	}
+	return stored == fp
+}
+
+func writeFingerprint(path string, fp exeFingerprint) error {
+	data, err := json.Marshal(fp)
+	if err != nil {
+		return err
+	}
+	return os.WriteFile(path, data, 0644)
+}
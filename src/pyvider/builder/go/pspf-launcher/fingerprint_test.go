@@ -0,0 +1,67 @@
+package main
+
+import (
+	"bytes"
+	"encoding/binary"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"pspf-tools/go/pkg/pspf"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// writeFooterOnlyPackage writes a file that ends with a valid PSPF footer.
+func writeFooterOnlyPackage(t *testing.T, path string, payloadSize uint64) {
+	footer := pspf.Footer{PayloadTgzSize: payloadSize, PspfVersion: pspf.Version, InternalFooterMagic: pspf.InternalFooterMagic}
+	require.NoError(t, footer.CalculateChecksum())
+	var buf bytes.Buffer
+	buf.WriteString("launcher-bytes")
+	require.NoError(t, binary.Write(&buf, binary.LittleEndian, footer))
+	buf.WriteString(pspf.MagicEOFString)
+	require.NoError(t, os.WriteFile(path, buf.Bytes(), 0755))
+}
+
+func TestFingerprint_MatchesUntilFileChanges(t *testing.T) {
+	tmpDir := t.TempDir()
+	exePath := filepath.Join(tmpDir, "provider")
+	fingerprintPath := filepath.Join(tmpDir, ".fingerprint")
+	writeFooterOnlyPackage(t, exePath, 1)
+
+	fp, err := fingerprintFile(exePath)
+	require.NoError(t, err)
+	assert.False(t, fingerprintMatches(fingerprintPath, fp), "no fingerprint stored yet")
+
+	require.NoError(t, writeFingerprint(fingerprintPath, fp))
+	again, err := fingerprintFile(exePath)
+	require.NoError(t, err)
+	assert.True(t, fingerprintMatches(fingerprintPath, again))
+
+	// Touching the file invalidates the fingerprint.
+	future := time.Now().Add(time.Hour)
+	require.NoError(t, os.Chtimes(exePath, future, future))
+	touched, err := fingerprintFile(exePath)
+	require.NoError(t, err)
+	assert.False(t, fingerprintMatches(fingerprintPath, touched))
+
+	// So does repackaging, even with identical size and mtime.
+	info, err := os.Stat(exePath)
+	require.NoError(t, err)
+	writeFooterOnlyPackage(t, exePath, 2)
+	require.NoError(t, os.Chtimes(exePath, info.ModTime(), info.ModTime()))
+	require.NoError(t, writeFingerprint(fingerprintPath, touched))
+	repackaged, err := fingerprintFile(exePath)
+	require.NoError(t, err)
+	assert.NotEqual(t, touched.FooterChecksum, repackaged.FooterChecksum)
+	assert.False(t, fingerprintMatches(fingerprintPath, repackaged))
+}
+
+func TestFingerprint_RejectsNonPackage(t *testing.T) {
+	exePath := filepath.Join(t.TempDir(), "not-a-package")
+	require.NoError(t, os.WriteFile(exePath, bytes.Repeat([]byte{0}, 200), 0755))
+	_, err := fingerprintFile(exePath)
+	assert.Error(t, err)
+}
@@ -0,0 +1,18 @@
+//go:build unix
+
+package main
+
+import (
+	"fmt"
+	"os"
+	"syscall"
+)
+
+// fileIdentity returns the device and inode numbers of an open file.
+func fileIdentity(_ *os.File, info os.FileInfo) (uint64, uint64, error) {
+	st, ok := info.Sys().(*syscall.Stat_t)
+	if !ok {
+		return 0, 0, fmt.Errorf("unsupported stat type %T", info.Sys())
+	}
+	return uint64(st.Dev), uint64(st.Ino), nil
+}
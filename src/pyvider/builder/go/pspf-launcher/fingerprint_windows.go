@@ -0,0 +1,18 @@
+//go:build windows
+
+package main
+
+import (
+	"os"
+	"syscall"
+)
+
+// fileIdentity returns the volume serial number and file index of an open
+// file, Windows' equivalent of a device and inode number.
+func fileIdentity(f *os.File, _ os.FileInfo) (uint64, uint64, error) {
+	var info syscall.ByHandleFileInformation
+	if err := syscall.GetFileInformationByHandle(syscall.Handle(f.Fd()), &info); err != nil {
+		return 0, 0, err
+	}
+	return uint64(info.VolumeSerialNumber), uint64(info.FileIndexHigh)<<32 | uint64(info.FileIndexLow), nil
+}
@@ -0,0 +1,32 @@
+package main
+
+import "os"
+
+// lockFile locks path, creating the file if needed. Shared locks only
+// conflict with exclusive ones. If another process holds a conflicting lock,
+// onWait is called and lockFile blocks until it is released. The returned
+// function releases the lock.
+func lockFile(path string, shared bool, onWait func()) (func(), error) {
+	for {
+		f, err := os.OpenFile(path, os.O_CREATE|os.O_RDWR, 0644)
+		if err != nil {
+			return nil, err
+		}
+		if err := lockHandle(f, shared, onWait); err != nil {
+			f.Close()
+			return nil, err
+		}
+		// A lock file deleted while we waited (by `pyvbuild cache gc`)
+		// guards nothing any more; lock whatever is at path now instead.
+		held, err := f.Stat()
+		if err != nil {
+			f.Close()
+			return nil, err
+		}
+		if current, err := os.Stat(path); err == nil && os.SameFile(held, current) {
+			// Closing the file releases the lock.
+			return func() { f.Close() }, nil
+		}
+		f.Close()
+	}
+}
@@ -0,0 +1,52 @@
+package main
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestLockFile_RelocksAFileDeletedWhileWaiting(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "env.use")
+	release, err := lockFile(path, false, func() {})
+	require.NoError(t, err)
+
+	waiting := make(chan struct{})
+	acquired := make(chan func())
+	go func() {
+		release, err := lockFile(path, true, func() { close(waiting) })
+		assert.NoError(t, err)
+		acquired <- release
+	}()
+
+	<-waiting
+	// What `pyvbuild cache gc` does when it evicts an environment.
+	require.NoError(t, os.Remove(path))
+	release()
+
+	select {
+	case release := <-acquired:
+		assert.FileExists(t, path, "the waiter must lock a file that is still linked")
+		release()
+	case <-time.After(5 * time.Second):
+		t.Fatal("waiter never acquired the lock")
+	}
+}
+
+func TestMarkUsed_TouchesLastUsed(t *testing.T) {
+	workDir := t.TempDir()
+	path := filepath.Join(workDir, ".last-used")
+
+	require.NoError(t, markUsed(workDir))
+	old := time.Now().Add(-48 * time.Hour)
+	require.NoError(t, os.Chtimes(path, old, old))
+	require.NoError(t, markUsed(workDir))
+
+	info, err := os.Stat(path)
+	require.NoError(t, err)
+	assert.WithinDuration(t, time.Now(), info.ModTime(), time.Minute)
+}
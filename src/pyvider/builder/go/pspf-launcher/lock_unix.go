@@ -0,0 +1,23 @@
+//go:build !windows
+
+package main
+
+import (
+	"errors"
+	"os"
+	"syscall"
+)
+
+func lockHandle(f *os.File, shared bool, onWait func()) error {
+	how := syscall.LOCK_EX
+	if shared {
+		how = syscall.LOCK_SH
+	}
+	fd := int(f.Fd())
+	err := syscall.Flock(fd, how|syscall.LOCK_NB)
+	if errors.Is(err, syscall.EWOULDBLOCK) {
+		onWait()
+		err = syscall.Flock(fd, how)
+	}
+	return err
+}
@@ -0,0 +1,42 @@
+//go:build windows
+
+package main
+
+import (
+	"errors"
+	"os"
+	"syscall"
+	"unsafe"
+)
+
+var procLockFileEx = syscall.NewLazyDLL("kernel32.dll").NewProc("LockFileEx")
+
+const (
+	lockfileFailImmediately = 0x1
+	lockfileExclusiveLock   = 0x2
+	errorLockViolation      = syscall.Errno(33)
+)
+
+func lockFileEx(f *os.File, flags uint32) error {
+	var overlapped syscall.Overlapped
+	r, _, err := procLockFileEx.Call(f.Fd(), uintptr(flags), 0, 1, 0, uintptr(unsafe.Pointer(&overlapped)))
+	if r == 0 {
+		return err
+	}
+	return nil
+}
+
+// lockHandle locks the first byte of f, the same range Python's
+// msvcrt.locking uses, so `pyvbuild` sees the launcher's locks.
+func lockHandle(f *os.File, shared bool, onWait func()) error {
+	var flags uint32
+	if !shared {
+		flags = lockfileExclusiveLock
+	}
+	err := lockFileEx(f, flags|lockfileFailImmediately)
+	if errors.Is(err, errorLockViolation) {
+		onWait()
+		err = lockFileEx(f, flags)
+	}
+	return err
+}
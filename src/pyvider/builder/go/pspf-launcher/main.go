@@ -1,7 +1,6 @@
 package main
 
 import (
-	"archive/tar"
 	"bytes"
 	"crypto"
 	"crypto/rsa"
@@ -23,7 +22,6 @@ import (
 	"pspf-tools/go/pkg/pspf"    // Import the shared package
 
 	"github.com/spf13/cobra"
-	"github.com/valyala/gozstd"
 )
 
 const (
@@ -32,6 +30,33 @@ const (
 
 type ConfigFromMetadata struct {
 	EntryPoint string `json:"entry_point"`
+	// PayloadLayout is "site-packages" when dependencies were installed at
+	// build time; otherwise the payload holds wheels to install on first run.
+	PayloadLayout string `json:"payload_layout"`
+	// WarmServer, when set, serves sessions from a pre-imported worker.
+	WarmServer *WarmServerConfig `json:"warm_server,omitempty"`
+}
+
+// SitePackagesLayout marks a payload with a pre-installed site-packages tree.
+const SitePackagesLayout = "site-packages"
+
+// RuntimeInfo is written to runtime.json in the work directory by setup.
+type RuntimeInfo struct {
+	// Python is the embedded interpreter, used directly when there is no venv.
+	Python string `json:"python"`
+	// Store lists the shared store entries the environment depends on, so
+	// `pyvbuild cache gc` keeps them while the environment exists.
+	Store []string `json:"store,omitempty"`
+}
+
+func readProviderConfig(pspfWorkDir string) (ConfigFromMetadata, error) {
+	var cfg ConfigFromMetadata
+	cfgBytes, err := os.ReadFile(filepath.Join(pspfWorkDir, "metadata_extracted", "config.json"))
+	if err != nil {
+		return cfg, err
+	}
+	err = json.Unmarshal(cfgBytes, &cfg)
+	return cfg, err
 }
 
 var log logbowl.Logger
@@ -48,6 +73,7 @@ func main() {
 }
 
 func runProvider() {
+	timings = newStartupTimer(os.Getenv("PSPF_TIMINGS"))
 	exePath, err := os.Executable()
 	if err != nil {
 		log.Error("launcher", "init", "error", "Could not get executable path", "error", err)
@@ -61,13 +87,45 @@ func runProvider() {
 	}
 
 	pspfWorkDir := filepath.Join(userCacheDir, "pyvider", "providers", filepath.Base(exePath))
+	storeDir := filepath.Join(userCacheDir, "pyvider", "store")
+	if err := os.MkdirAll(filepath.Dir(pspfWorkDir), 0755); err != nil {
+		log.Error("env", "init", "error", "Could not create provider cache directory", "path", pspfWorkDir, "error", err)
+		os.Exit(1)
+	}
+	if err := lockForUse(pspfWorkDir); err != nil {
+		log.Warn("env", "init", "warning", "Could not lock the provider environment for use", "error", err)
+	}
 	if err := os.MkdirAll(pspfWorkDir, 0755); err != nil {
 		log.Error("env", "init", "error", "Could not create provider cache directory", "path", pspfWorkDir, "error", err)
 		os.Exit(1)
 	}
 
 	completionFilePath := filepath.Join(pspfWorkDir, ".complete")
+	fingerprintPath := filepath.Join(pspfWorkDir, ".fingerprint")
+
+	// Fast path: a matching stat fingerprint means this exact file was already
+	// hashed and extracted, so the full self-hash can be skipped.
+	// PSPF_STRICT_CACHE=1 always re-hashes the whole executable.
+	endFingerprint := timings.begin("fingerprint")
+	fingerprint, fingerprintErr := fingerprintFile(exePath)
+	if fingerprintErr != nil {
+		log.Debug("env", "verify", "skip", "Could not fingerprint executable", "error", fingerprintErr)
+	}
+	fingerprintOK := !envFlag("PSPF_STRICT_CACHE") && fingerprintErr == nil && fileExists(completionFilePath) && fingerprintMatches(fingerprintPath, fingerprint)
+	endFingerprint()
+	if fingerprintOK {
+		log.Info("env", "verify", "ok", "Executable fingerprint matches, reusing existing environment.")
+		timings.setCache("fingerprint")
+		if err := markUsed(pspfWorkDir); err != nil {
+			log.Debug("env", "verify", "warning", "Could not record last use", "error", err)
+		}
+		executePython(pspfWorkDir)
+		return
+	}
+
+	endSelfHash := timings.begin("self_hash")
 	currentExeHash, err := calculateSelfHash(exePath)
+	endSelfHash()
 	if err != nil {
 		log.Error("launcher", "init", "error", "Failed to calculate self hash", "error", err)
 		os.Exit(1)
@@ -76,22 +134,35 @@ func runProvider() {
 	cachedExeHashBytes, err := os.ReadFile(completionFilePath)
 	if err == nil && string(cachedExeHashBytes) == currentExeHash {
 		log.Info("env", "verify", "ok", "Cache is valid, reusing existing environment.")
-	} else {
-		log.Info("env", "init", "progress", "Cache invalid or not found. Starting one-time environment setup.")
-		if err := setupEnvironment(exePath, pspfWorkDir); err != nil {
-			log.Error("launcher", "init", "error", "Environment setup failed", "error", err)
-			os.Exit(1)
-		}
-		if err := os.WriteFile(completionFilePath, []byte(currentExeHash), 0644); err != nil {
-			log.Error("launcher", "finish", "error", "Failed to write completion file", "error", err)
-			os.Exit(1)
+		timings.setCache("hash")
+	} else if _, err := ensureEnvironment(exePath, pspfWorkDir, storeDir, currentExeHash); err != nil {
+		log.Error("launcher", "init", "error", "Environment setup failed", "error", err)
+		os.Exit(1)
+	}
+
+	if fingerprintErr == nil {
+		if err := writeFingerprint(fingerprintPath, fingerprint); err != nil {
+			log.Warn("env", "finish", "warning", "Failed to write executable fingerprint", "error", err)
 		}
-		log.Info("env", "finish", "ok", "One-time environment setup complete.")
+	}
+	if err := markUsed(pspfWorkDir); err != nil {
+		log.Debug("env", "finish", "warning", "Could not record last use", "error", err)
 	}
 
 	executePython(pspfWorkDir)
 }
 
+// envFlag reports whether an environment variable is set to "1" or "true".
+func envFlag(name string) bool {
+	value := os.Getenv(name)
+	return value == "1" || value == "true"
+}
+
+func fileExists(path string) bool {
+	_, err := os.Stat(path)
+	return err == nil
+}
+
 func calculateSelfHash(exePath string) (string, error) {
 	f, err := os.Open(exePath)
 	if err != nil {
@@ -128,92 +199,119 @@ func findExecutable(root, name1, name2 string) (string, error) {
 	return "", fmt.Errorf("executable '%s' or '%s' not found in %s", name1, name2, root)
 }
 
-func setupEnvironment(exePath, pspfWorkDir string) error {
+func setupEnvironment(exePath, pspfWorkDir, storeDir string) error {
 	file, err := os.Open(exePath)
 	if err != nil {
 		return err
 	}
 	defer file.Close()
+	endFooter := timings.begin("footer_read")
 	footer, err := readAndVerifyFooter(file)
+	endFooter()
 	if err != nil {
 		return err
 	}
 
 	log.Debug("launcher", "read", "info", "PSPF Footer data", "footer", footer)
 
-	launcherSize := footer.UvBinaryOffset
-	launcherBytes, err := readSection(file, 0, launcherSize)
-	if err != nil {
+	// The store lock is held shared until runtime.json records the entries
+	// this environment uses; `pyvbuild cache gc` takes it exclusively to
+	// sweep entries that no environment references.
+	if err := os.MkdirAll(storeDir, 0755); err != nil {
 		return err
 	}
-	uvBinBytes, err := readSection(file, footer.UvBinaryOffset, footer.UvBinarySize)
+	endStoreLock := timings.begin("store_lock")
+	unlockStore, err := lockFile(storeDir+".lock", true, func() {
+		log.Info("env", "init", "waiting", "Waiting for a cache cleanup to finish.")
+	})
+	endStoreLock()
 	if err != nil {
-		return err
+		return fmt.Errorf("could not lock the shared store: %w", err)
 	}
-	pythonTgzBytes, err := readSection(file, footer.PythonInstallTgzOffset, footer.PythonInstallTgzSize)
+	defer unlockStore()
+
+	rt, err := openSharedRuntime(file, footer, storeDir)
 	if err != nil {
 		return err
 	}
-	metadataTgzBytes, err := readSection(file, footer.MetadataTgzOffset, footer.MetadataTgzSize)
+
+	// Sections unchanged since the previous environment are linked from it
+	// rather than extracted again.
+	endDigests := timings.begin("section_digests")
+	digests, err := computeSectionDigests(file, footer, rt)
+	endDigests()
 	if err != nil {
 		return err
 	}
-	payloadTgzBytes, err := readSection(file, footer.PayloadTgzOffset, footer.PayloadTgzSize)
-	if err != nil {
-		return err
+	// A new version has a work directory of its own, so it reuses the
+	// previous version's trees instead. Holding that environment's use lock
+	// keeps `pyvbuild cache gc` from evicting it while its trees are linked.
+	reuseDir := pspfWorkDir
+	if readSectionDigests(pspfWorkDir) == nil {
+		if dir := previousVersionDir(pspfWorkDir); dir != "" {
+			release, err := lockFile(dir+".use", true, func() {})
+			if err == nil {
+				defer release()
+				reuseDir = dir
+			}
+		}
 	}
-	signatureBytes, err := readSection(file, footer.PackageSignatureOffset, footer.PackageSignatureSize)
-	if err != nil {
-		return err
+	reuse := planReuse(pspfWorkDir, reuseDir, digests)
+	if reuse != nil {
+		log.Info("env", "init", "reusing", "Reusing unchanged parts of the previous environment.", "trees", reuse.trees)
 	}
-	publicKeyPEMBytes, err := readSection(file, footer.PublicKeyPEMOffset, footer.PublicKeyPEMSize)
+
+	// Extract into a private sibling and swap it in whole, so no other
+	// launcher ever sees a half-extracted tree. The venv and runtime.json
+	// record absolute paths, so they are created after the swap; a reused
+	// venv keeps working because the work directory's path is unchanged.
+	staging := stagingDir(pspfWorkDir, "setup")
+	allExtractedFiles, err := verifyAndExtract(file, footer, staging, rt, reuse)
 	if err != nil {
+		os.RemoveAll(staging)
 		return err
 	}
-
-	var contentToVerify bytes.Buffer
-	contentToVerify.Write(launcherBytes)
-	contentToVerify.Write(uvBinBytes)
-	contentToVerify.Write(pythonTgzBytes)
-	contentToVerify.Write(metadataTgzBytes)
-	contentToVerify.Write(payloadTgzBytes)
-	if err := verifySignaturePSS(contentToVerify.Bytes(), signatureBytes, publicKeyPEMBytes); err != nil {
-		return err
+	if err := replaceDir(staging, pspfWorkDir); err != nil {
+		os.RemoveAll(staging)
+		return fmt.Errorf("failed to move the extracted environment into place: %w", err)
 	}
+	uvExePath := rt.uvExePath()
+	payloadExtractDir := filepath.Join(pspfWorkDir, "payload_extracted")
 
-	os.RemoveAll(pspfWorkDir)
-	os.MkdirAll(pspfWorkDir, 0755)
+	pythonExePath, err := findExecutable(rt.pythonInstall.Dir, "python3", "python")
+	if err != nil {
+		return fmt.Errorf("could not find python executable in embedded archive: %w", err)
+	}
 
-	if _, err := unTar(bytes.NewReader(metadataTgzBytes), filepath.Join(pspfWorkDir, "metadata_extracted")); err != nil {
-		return err
+	cfg, err := readProviderConfig(pspfWorkDir)
+	if err != nil {
+		return fmt.Errorf("failed to read config.json: %w", err)
 	}
-	payloadExtractDir := filepath.Join(pspfWorkDir, "payload_extracted")
-	allExtractedFiles, err := unTar(bytes.NewReader(payloadTgzBytes), payloadExtractDir)
+	runtimeJSON, err := json.Marshal(RuntimeInfo{
+		Python: pythonExePath,
+		Store:  []string{rt.pythonInstall.Dir, rt.uv.Dir},
+	})
 	if err != nil {
 		return err
 	}
-	pythonInstallDir := filepath.Join(pspfWorkDir, "python")
-	if _, err := unTar(bytes.NewReader(pythonTgzBytes), pythonInstallDir); err != nil {
+	if err := os.WriteFile(filepath.Join(pspfWorkDir, "runtime.json"), runtimeJSON, 0644); err != nil {
 		return err
 	}
-
-	suffix := ""
-	if runtime.GOOS == "windows" {
-		suffix = ".exe"
-	}
-	uvExePath := filepath.Join(pspfWorkDir, "uv_embedded"+suffix)
-	if err := os.WriteFile(uvExePath, uvBinBytes, 0755); err != nil {
+	if err := writeSectionDigests(pspfWorkDir, digests); err != nil {
 		return err
 	}
-
-	pythonExePath, err := findExecutable(pythonInstallDir, "python3", "python")
-	if err != nil {
-		return fmt.Errorf("could not find python executable in embedded archive: %w", err)
+	if cfg.PayloadLayout == SitePackagesLayout || reuse.has(".venv") {
+		// Dependencies were installed at build time, or by the setup whose
+		// venv was reused; no venv or install step.
+		return nil
 	}
 
 	venvDir := filepath.Join(pspfWorkDir, ".venv")
+	endVenv := timings.begin("venv_create")
 	cmd := exec.Command(uvExePath, "venv", venvDir, "--python", pythonExePath)
-	if out, err := cmd.CombinedOutput(); err != nil {
+	out, err := cmd.CombinedOutput()
+	endVenv()
+	if err != nil {
 		return fmt.Errorf("venv creation failed: %w\nOutput:\n%s", err, string(out))
 	}
 
@@ -234,7 +332,10 @@ func setupEnvironment(exePath, pspfWorkDir string) error {
 		installArgs := append([]string{"pip", "install"}, wheelsToInstall...)
 		cmd = exec.Command(uvExePath, installArgs...)
 		cmd.Env = append(os.Environ(), fmt.Sprintf("VIRTUAL_ENV=%s", venvDir))
-		if out, err := cmd.CombinedOutput(); err != nil {
+		endInstall := timings.begin("wheel_install")
+		out, err := cmd.CombinedOutput()
+		endInstall()
+		if err != nil {
 			return fmt.Errorf("wheel installation failed: %w\nOutput:\n%s", err, string(out))
 		}
 	}
@@ -242,40 +343,36 @@ func setupEnvironment(exePath, pspfWorkDir string) error {
 }
 
 func executePython(pspfWorkDir string) {
-	cfgBytes, err := os.ReadFile(filepath.Join(pspfWorkDir, "metadata_extracted", "config.json"))
+	providerConfig, err := readProviderConfig(pspfWorkDir)
 	if err != nil {
 		log.Error("launcher", "execute", "error", "Failed to read config.json", "error", err)
 		os.Exit(1)
 	}
 
-	var providerConfig ConfigFromMetadata
-	json.Unmarshal(cfgBytes, &providerConfig)
-
-	suffix := ""
-	if runtime.GOOS == "windows" {
-		suffix = ".exe"
-	}
-	venvPython := filepath.Join(pspfWorkDir, ".venv", "bin", "python"+suffix)
-	if runtime.GOOS == "windows" {
-		venvPython = filepath.Join(pspfWorkDir, ".venv", "Scripts", "python.exe")
+	pythonCmd, err := providerCommand(pspfWorkDir, providerConfig)
+	if err != nil {
+		log.Error("launcher", "execute", "error", "Failed to prepare the Python interpreter", "error", err)
+		os.Exit(1)
 	}
 
-	pyCmdString := fmt.Sprintf("import sys; import asyncio; import importlib; mod_name, func_name = '%s'.split(':', 1); mod = importlib.import_module(mod_name); sys.exit(asyncio.run(getattr(mod, func_name)()))", providerConfig.EntryPoint)
-
-	pythonCmd := exec.Command(venvPython, "-c", pyCmdString)
-
-	payloadExtractDir := filepath.Join(pspfWorkDir, "payload_extracted")
-	existingPath := os.Getenv("PYTHONPATH")
-	newPath := payloadExtractDir
-	if existingPath != "" {
-		newPath = newPath + string(os.PathListSeparator) + existingPath
+	if warmEnabled(providerConfig, os.Getenv("PSPF_WARM_SERVER")) {
+		if exitCode, ok := runWarm(pspfWorkDir, pythonCmd.Env, [3]*os.File{os.Stdin, os.Stdout, os.Stderr}); ok {
+			os.Exit(exitCode)
+		}
+		// No worker yet: start one for the next session and run this one cold.
+		if err := startWarmWorker(pspfWorkDir, providerConfig); err != nil {
+			log.Warn("launcher", "warm", "warning", "Could not start the warm provider worker", "error", err)
+		}
 	}
-	pythonCmd.Env = append(os.Environ(), "PYTHONPATH="+newPath)
-
 	pythonCmd.Stdout = os.Stdout
 	pythonCmd.Stderr = os.Stderr
 
-	if err := pythonCmd.Run(); err != nil {
+	err = pythonCmd.Start()
+	if err == nil {
+		timings.execStarted("cold")
+		err = pythonCmd.Wait()
+	}
+	if err != nil {
 		if exitErr, ok := err.(*exec.ExitError); ok {
 			os.Exit(exitErr.ExitCode())
 		}
@@ -284,6 +381,54 @@ func executePython(pspfWorkDir string) {
 	os.Exit(0)
 }
 
+// providerCommand builds the command that runs the provider entry point:
+// the venv interpreter for wheel payloads, or the embedded interpreter with
+// the pre-installed site-packages on PYTHONPATH.
+func providerCommand(pspfWorkDir string, providerConfig ConfigFromMetadata) (*exec.Cmd, error) {
+	interpreter, args, env, err := providerInterpreter(pspfWorkDir, providerConfig)
+	if err != nil {
+		return nil, err
+	}
+	pyCmdString := fmt.Sprintf("import sys; import asyncio; import importlib; mod_name, func_name = '%s'.split(':', 1); mod = importlib.import_module(mod_name); sys.exit(asyncio.run(getattr(mod, func_name)()))", providerConfig.EntryPoint)
+	pythonCmd := exec.Command(interpreter, append(args, "-c", pyCmdString)...)
+	pythonCmd.Env = env
+	return pythonCmd, nil
+}
+
+// providerInterpreter returns the interpreter that runs the provider, its
+// leading arguments and the environment to run it in.
+func providerInterpreter(pspfWorkDir string, providerConfig ConfigFromMetadata) (string, []string, []string, error) {
+	payloadExtractDir := filepath.Join(pspfWorkDir, "payload_extracted")
+	pythonPath := []string{payloadExtractDir}
+	var interpreter string
+	var args []string
+
+	if providerConfig.PayloadLayout == SitePackagesLayout {
+		runtimeJSON, err := os.ReadFile(filepath.Join(pspfWorkDir, "runtime.json"))
+		if err != nil {
+			return "", nil, nil, err
+		}
+		var info RuntimeInfo
+		if err := json.Unmarshal(runtimeJSON, &info); err != nil {
+			return "", nil, nil, err
+		}
+		interpreter = info.Python
+		// -s keeps the user site directory out, as a venv would.
+		args = append(args, "-s")
+		pythonPath = append([]string{filepath.Join(payloadExtractDir, SitePackagesLayout)}, pythonPath...)
+	} else if runtime.GOOS == "windows" {
+		interpreter = filepath.Join(pspfWorkDir, ".venv", "Scripts", "python.exe")
+	} else {
+		interpreter = filepath.Join(pspfWorkDir, ".venv", "bin", "python")
+	}
+
+	if existingPath := os.Getenv("PYTHONPATH"); existingPath != "" {
+		pythonPath = append(pythonPath, existingPath)
+	}
+	env := append(os.Environ(), "PYTHONPATH="+strings.Join(pythonPath, string(os.PathListSeparator)))
+	return interpreter, args, env, nil
+}
+
 func readAndVerifyFooter(f *os.File) (*pspf.Footer, error) {
 	fileInfo, err := f.Stat()
 	if err != nil {
@@ -342,7 +487,66 @@ func readSection(f *os.File, offset, size uint64) ([]byte, error) {
 	return data, nil
 }
 
-func verifySignaturePSS(data []byte, signature []byte, publicKeyPEMBytes []byte) error {
+// verifyHashChunkSize is the buffer used to stream the signed sections
+// through SHA-256; it bounds verification memory regardless of package size.
+const verifyHashChunkSize = 1024 * 1024
+
+type sectionRange struct {
+	name         string
+	offset, size uint64
+}
+
+// signedSections lists the signed sections in file order.
+func signedSections(footer *pspf.Footer) []sectionRange {
+	return []sectionRange{
+		{"launcher", 0, footer.UvBinaryOffset},
+		{"uv", footer.UvBinaryOffset, footer.UvBinarySize},
+		{"python_install", footer.PythonInstallTgzOffset, footer.PythonInstallTgzSize},
+		{"metadata", footer.MetadataTgzOffset, footer.MetadataTgzSize},
+		{"payload", footer.PayloadTgzOffset, footer.PayloadTgzSize},
+	}
+}
+
+func sectionReader(f *os.File, offset, size uint64) *io.SectionReader {
+	return io.NewSectionReader(f, int64(offset), int64(size))
+}
+
+// hashSignedSections streams the signed sections from the file through
+// SHA-256 and returns the digest.
+func hashSignedSections(f *os.File, footer *pspf.Footer) ([]byte, error) {
+	h := sha256.New()
+	buf := make([]byte, verifyHashChunkSize)
+	for _, section := range signedSections(footer) {
+		n, err := io.CopyBuffer(h, sectionReader(f, section.offset, section.size), buf)
+		if err != nil {
+			return nil, fmt.Errorf("failed to hash %s section: %w", section.name, err)
+		}
+		if uint64(n) != section.size {
+			return nil, fmt.Errorf("package is truncated inside the %s section (read %d of %d bytes)", section.name, n, section.size)
+		}
+	}
+	return h.Sum(nil), nil
+}
+
+// verifyPackage checks the package signature against the embedded public key
+// without holding any signed section in memory.
+func verifyPackage(f *os.File, footer *pspf.Footer) error {
+	signatureBytes, err := readSection(f, footer.PackageSignatureOffset, footer.PackageSignatureSize)
+	if err != nil {
+		return err
+	}
+	publicKeyPEMBytes, err := readSection(f, footer.PublicKeyPEMOffset, footer.PublicKeyPEMSize)
+	if err != nil {
+		return err
+	}
+	digest, err := hashSignedSections(f, footer)
+	if err != nil {
+		return err
+	}
+	return verifySignatureDigestPSS(digest, signatureBytes, publicKeyPEMBytes)
+}
+
+func verifySignatureDigestPSS(digest []byte, signature []byte, publicKeyPEMBytes []byte) error {
 	block, _ := pem.Decode(publicKeyPEMBytes)
 	if block == nil {
 		return fmt.Errorf("failed to decode public key PEM block")
@@ -356,61 +560,8 @@ func verifySignaturePSS(data []byte, signature []byte, publicKeyPEMBytes []byte)
 		return fmt.Errorf("public key is not an RSA public key")
 	}
 
-	hashed := sha256.Sum256(data)
 	opts := &rsa.PSSOptions{SaltLength: rsa.PSSSaltLengthAuto, Hash: crypto.SHA256}
-	return rsa.VerifyPSS(rsaPub, crypto.SHA256, hashed[:], signature, opts)
-}
-
-func unTar(r io.Reader, dest string) ([]string, error) {
-	zr := gozstd.NewReader(r)
-	defer zr.Release()
-	tr := tar.NewReader(zr)
-	var files []string
-	for {
-		header, err := tr.Next()
-		if err == io.EOF {
-			break
-		}
-		if err != nil {
-			return nil, err
-		}
-		target := filepath.Join(dest, header.Name)
-		if !strings.HasPrefix(filepath.Clean(target), filepath.Clean(dest)) {
-			return nil, fmt.Errorf("zip slip detected in tar archive")
-		}
-
-		switch header.Typeflag {
-		case tar.TypeDir:
-			if err := os.MkdirAll(target, 0755); err != nil {
-				return nil, err
-			}
-		case tar.TypeReg:
-			files = append(files, header.Name)
-			if err := os.MkdirAll(filepath.Dir(target), 0755); err != nil {
-				return nil, err
-			}
-			f, err := os.OpenFile(target, os.O_CREATE|os.O_RDWR, os.FileMode(header.Mode))
-			if err != nil {
-				return nil, err
-			}
-			if _, err := io.Copy(f, tr); err != nil {
-				f.Close()
-				return nil, err
-			}
-			f.Close()
-		case tar.TypeSymlink:
-			if err := os.MkdirAll(filepath.Dir(target), 0755); err != nil {
-				if lstatInfo, lstatErr := os.Lstat(filepath.Dir(target)); lstatErr == nil && lstatInfo.Mode()&os.ModeSymlink != 0 {
-				} else {
-					return nil, err
-				}
-			}
-			if err := os.Symlink(header.Linkname, target); err != nil {
-				return nil, err
-			}
-		}
-	}
-	return files, nil
+	return rsa.VerifyPSS(rsaPub, crypto.SHA256, digest, signature, opts)
 }
 
 var rootCmd = &cobra.Command{Use: "pspf-launcher", Short: "Pyvider Interactive Launcher"}
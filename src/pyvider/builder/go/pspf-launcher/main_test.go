@@ -8,11 +8,18 @@ import (
 	"path/filepath"
 	"testing"
 
+	"pspf-tools/go/pkg/logbowl"
+
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 	"github.com/valyala/gozstd"
 )
 
+func TestMain(m *testing.M) {
+	log = logbowl.Create("pspf-launcher-test")
+	os.Exit(m.Run())
+}
+
 // TestMainAsSubprocess is a true black-box integration test.
 // It builds the launcher binary and then runs it as a subprocess with different
 // environment variables to test its interactive commands and logging output.
@@ -0,0 +1,41 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestProviderCommand_SitePackagesLayout(t *testing.T) {
+	workDir := t.TempDir()
+	runtimeJSON, err := json.Marshal(RuntimeInfo{Python: "/embedded/bin/python3"})
+	require.NoError(t, err)
+	require.NoError(t, os.WriteFile(filepath.Join(workDir, "runtime.json"), runtimeJSON, 0644))
+	t.Setenv("PYTHONPATH", "/existing")
+
+	cmd, err := providerCommand(workDir, ConfigFromMetadata{EntryPoint: "pkg.main:serve", PayloadLayout: SitePackagesLayout})
+	require.NoError(t, err)
+
+	assert.Equal(t, "/embedded/bin/python3", cmd.Path)
+	assert.Equal(t, "-s", cmd.Args[1])
+	payloadDir := filepath.Join(workDir, "payload_extracted")
+	expected := strings.Join([]string{filepath.Join(payloadDir, "site-packages"), payloadDir, "/existing"}, string(os.PathListSeparator))
+	assert.Contains(t, cmd.Env, "PYTHONPATH="+expected)
+}
+
+func TestProviderCommand_WheelsLayoutUsesVenv(t *testing.T) {
+	workDir := t.TempDir()
+	t.Setenv("PYTHONPATH", "")
+
+	cmd, err := providerCommand(workDir, ConfigFromMetadata{EntryPoint: "pkg.main:serve"})
+	require.NoError(t, err)
+
+	assert.Contains(t, cmd.Args[0], ".venv")
+	assert.Equal(t, "-c", cmd.Args[1])
+	assert.Contains(t, cmd.Env, "PYTHONPATH="+filepath.Join(workDir, "payload_extracted"))
+}
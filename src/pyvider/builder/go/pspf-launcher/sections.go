@@ -0,0 +1,222 @@
+package main
+
+import (
+	"encoding/hex"
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"regexp"
+	"strings"
+	"time"
+
+	"pspf-tools/go/pkg/pspf"
+)
+
+// sectionDigestsName records, in the work directory, the SHA-256 of each
+// section the environment was set up from.
+const sectionDigestsName = ".sections.json"
+
+// sectionDigests maps a section name to the hex SHA-256 of its bytes.
+type sectionDigests map[string]string
+
+func computeSectionDigests(f *os.File, footer *pspf.Footer, rt *sharedRuntime) (sectionDigests, error) {
+	digests := sectionDigests{
+		"python_install": hex.EncodeToString(rt.pythonInstall.digest),
+		"uv":             hex.EncodeToString(rt.uv.digest),
+	}
+	for _, section := range signedSections(footer) {
+		if section.name != "metadata" && section.name != "payload" {
+			continue
+		}
+		digest, err := sectionDigest(f, section.offset, section.size)
+		if err != nil {
+			return nil, fmt.Errorf("failed to hash %s section: %w", section.name, err)
+		}
+		digests[section.name] = hex.EncodeToString(digest)
+	}
+	return digests, nil
+}
+
+// readSectionDigests returns the digests a completed environment in
+// pspfWorkDir was set up from, or nil if there is no such environment.
+func readSectionDigests(pspfWorkDir string) sectionDigests {
+	if !fileExists(filepath.Join(pspfWorkDir, ".complete")) {
+		return nil
+	}
+	data, err := os.ReadFile(filepath.Join(pspfWorkDir, sectionDigestsName))
+	if err != nil {
+		return nil
+	}
+	var digests sectionDigests
+	if json.Unmarshal(data, &digests) != nil {
+		return nil
+	}
+	return digests
+}
+
+func writeSectionDigests(pspfWorkDir string, digests sectionDigests) error {
+	data, err := json.Marshal(digests)
+	if err != nil {
+		return err
+	}
+	return os.WriteFile(filepath.Join(pspfWorkDir, sectionDigestsName), data, 0644)
+}
+
+// treeReuse names the work directory trees that a new setup carries over
+// from the previous environment in from instead of rebuilding them.
+type treeReuse struct {
+	from  string
+	trees []string
+}
+
+func (r *treeReuse) has(tree string) bool {
+	if r == nil {
+		return false
+	}
+	for _, t := range r.trees {
+		if t == tree {
+			return true
+		}
+	}
+	return false
+}
+
+// versionSuffix matches the version Terraform puts in provider executable
+// names (terraform-provider-NAME_vX.Y.Z, maybe followed by _x5 and .exe).
+var versionSuffix = regexp.MustCompile(`_v\d[^_]*(_x\d+)?(\.exe)?$`)
+
+// previousVersionDir returns the completed work directory of the most
+// recently used other version of the provider whose work directory is
+// pspfWorkDir, or "" if there is none. Each version's executable name, and
+// so its work directory, differs only in its version suffix.
+func previousVersionDir(pspfWorkDir string) string {
+	parent, name := filepath.Split(pspfWorkDir)
+	identity := versionSuffix.ReplaceAllString(name, "")
+	if identity == name {
+		return ""
+	}
+	entries, err := os.ReadDir(parent)
+	if err != nil {
+		return ""
+	}
+	var best string
+	var bestUsed time.Time
+	for _, entry := range entries {
+		other := entry.Name()
+		if other == name || !entry.IsDir() || strings.Contains(other, ".setup-") || strings.Contains(other, ".old-") {
+			continue
+		}
+		if versionSuffix.ReplaceAllString(other, "") != identity {
+			continue
+		}
+		dir := filepath.Join(parent, other)
+		info, err := os.Stat(filepath.Join(dir, ".last-used"))
+		if err != nil || !fileExists(filepath.Join(dir, ".complete")) {
+			continue
+		}
+		if best == "" || info.ModTime().After(bestUsed) {
+			best, bestUsed = dir, info.ModTime()
+		}
+	}
+	return best
+}
+
+// planReuse compares the section digests of the environment in from, either
+// pspfWorkDir itself or another version's work directory, with current. Each
+// extracted archive whose section is unchanged is reused, and so is the venv
+// when neither the payload it was installed from nor the interpreter it
+// points at changed. The venv records its absolute path, so it is only
+// reused from pspfWorkDir itself. It returns nil if nothing can be reused.
+func planReuse(pspfWorkDir, from string, current sectionDigests) *treeReuse {
+	previous := readSectionDigests(from)
+	if previous == nil {
+		return nil
+	}
+	same := func(section string) bool {
+		return previous[section] != "" && previous[section] == current[section]
+	}
+	r := &treeReuse{from: from}
+	if same("metadata") {
+		r.trees = append(r.trees, "metadata_extracted")
+	}
+	if same("payload") {
+		r.trees = append(r.trees, "payload_extracted")
+		if from == pspfWorkDir && same("python_install") && fileExists(filepath.Join(from, ".venv")) {
+			r.trees = append(r.trees, ".venv")
+		}
+	}
+	if len(r.trees) == 0 {
+		return nil
+	}
+	return r
+}
+
+// link recreates tree from the previous environment under workDir.
+func (r *treeReuse) link(tree, workDir string) error {
+	defer timings.begin("reuse:" + tree)()
+	return linkTree(filepath.Join(r.from, tree), filepath.Join(workDir, tree))
+}
+
+// linkTree recreates the tree at src under dst, hard-linking regular files
+// (or copying them where links are not supported) and copying symlinks.
+func linkTree(src, dst string) error {
+	return filepath.Walk(src, func(path string, info os.FileInfo, err error) error {
+		if err != nil {
+			return err
+		}
+		rel, err := filepath.Rel(src, path)
+		if err != nil {
+			return err
+		}
+		target := filepath.Join(dst, rel)
+		switch {
+		case info.IsDir():
+			return os.MkdirAll(target, info.Mode().Perm())
+		case info.Mode()&os.ModeSymlink != 0:
+			link, err := os.Readlink(path)
+			if err != nil {
+				return err
+			}
+			return os.Symlink(link, target)
+		case info.Mode().IsRegular():
+			if os.Link(path, target) == nil {
+				return nil
+			}
+			return copyRegularFile(path, target, info.Mode().Perm())
+		}
+		return nil
+	})
+}
+
+func copyRegularFile(src, dst string, mode os.FileMode) error {
+	in, err := os.Open(src)
+	if err != nil {
+		return err
+	}
+	defer in.Close()
+	out, err := os.OpenFile(dst, os.O_CREATE|os.O_EXCL|os.O_WRONLY, mode)
+	if err != nil {
+		return err
+	}
+	if _, err := io.Copy(out, in); err != nil {
+		out.Close()
+		return err
+	}
+	return out.Close()
+}
+
+// regularFiles returns the paths, relative to dir, of the regular files under it.
+func regularFiles(dir string) ([]string, error) {
+	var files []string
+	err := filepath.Walk(dir, func(path string, info os.FileInfo, err error) error {
+		if err != nil || !info.Mode().IsRegular() {
+			return err
+		}
+		rel, err := filepath.Rel(dir, path)
+		files = append(files, rel)
+		return err
+	})
+	return files, err
+}
@@ -0,0 +1,104 @@
+package main
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"time"
+)
+
+// ensureEnvironment sets up pspfWorkDir for the executable with hash exeHash,
+// using the shared store in storeDir for the Python install and uv, while
+// holding an exclusive lock on a sibling lock file. A launcher that had
+// to wait for the lock reuses the environment the holder just finished
+// instead of extracting it again. It reports whether this call ran setup.
+func ensureEnvironment(exePath, pspfWorkDir, storeDir, exeHash string) (bool, error) {
+	endLock := timings.begin("setup_lock")
+	unlock, err := lockFile(pspfWorkDir+".lock", false, func() {
+		log.Info("env", "init", "waiting", "Waiting for a concurrent launcher to finish environment setup.")
+	})
+	endLock()
+	if err != nil {
+		return false, fmt.Errorf("could not lock the provider cache directory: %w", err)
+	}
+	defer unlock()
+
+	completionFilePath := filepath.Join(pspfWorkDir, ".complete")
+	if cached, err := os.ReadFile(completionFilePath); err == nil && string(cached) == exeHash {
+		log.Info("env", "verify", "ok", "Environment was set up by a concurrent launcher, reusing it.")
+		timings.setCache("concurrent_setup")
+		return false, nil
+	}
+
+	log.Info("env", "init", "progress", "Cache invalid or not found. Starting one-time environment setup.")
+	timings.setCache("setup")
+	removeStaleSetupDirs(pspfWorkDir)
+	if err := setupEnvironment(exePath, pspfWorkDir, storeDir); err != nil {
+		return false, err
+	}
+	// .complete is written last, so an interrupted setup is never trusted.
+	if err := os.WriteFile(completionFilePath, []byte(exeHash), 0644); err != nil {
+		return false, fmt.Errorf("failed to write completion file: %w", err)
+	}
+	log.Info("env", "finish", "ok", "One-time environment setup complete.")
+	return true, nil
+}
+
+// stagingDir returns a private sibling of dir for a setup in progress.
+func stagingDir(dir, kind string) string {
+	return fmt.Sprintf("%s.%s-%d", dir, kind, os.Getpid())
+}
+
+// removeStaleSetupDirs deletes staging directories left behind by launchers
+// that died mid-setup. The caller must hold the setup lock.
+func removeStaleSetupDirs(dir string) {
+	for _, kind := range []string{"setup", "old"} {
+		stale, _ := filepath.Glob(dir + "." + kind + "-*")
+		for _, path := range stale {
+			os.RemoveAll(path)
+		}
+	}
+}
+
+// replaceDir moves newDir to dir. An existing dir is first renamed aside and
+// then deleted, so dir never holds a mix of old and new files.
+func replaceDir(newDir, dir string) error {
+	old := stagingDir(dir, "old")
+	if err := os.Rename(dir, old); err != nil && !os.IsNotExist(err) {
+		return err
+	}
+	if err := os.Rename(newDir, dir); err != nil {
+		return err
+	}
+	if err := os.RemoveAll(old); err != nil {
+		log.Warn("env", "init", "warning", "Could not remove the previous environment", "path", old, "error", err)
+	}
+	return nil
+}
+
+// releaseUseLock keeps the use lock's file reachable, and so open, for the
+// life of the process.
+var releaseUseLock func()
+
+// lockForUse takes a shared lock on <pspfWorkDir>.use, held until the
+// launcher exits, so `pyvbuild cache gc` never evicts a running provider's
+// environment.
+func lockForUse(pspfWorkDir string) error {
+	release, err := lockFile(pspfWorkDir+".use", true, func() {
+		log.Info("env", "init", "waiting", "Waiting for a cache cleanup to finish.")
+	})
+	releaseUseLock = release
+	return err
+}
+
+// markUsed records the time of this start in .last-used, which
+// `pyvbuild cache gc` evicts environments by.
+func markUsed(pspfWorkDir string) error {
+	path := filepath.Join(pspfWorkDir, ".last-used")
+	now := time.Now()
+	err := os.Chtimes(path, now, now)
+	if os.IsNotExist(err) {
+		err = os.WriteFile(path, nil, 0644)
+	}
+	return err
+}
@@ -0,0 +1,204 @@
+package main
+
+import (
+	"crypto/rand"
+	"crypto/rsa"
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// writeSitePackagesPackage writes a signed package whose setup needs no uv
+// invocation, so the whole of setupEnvironment can run in a test.
+func writeSitePackagesPackage(t *testing.T, providerSource string) string {
+	return writeSitePackagesPackageWithConfig(t, providerSource, `{"entry_point": "pkg:serve", "payload_layout": "site-packages"}`)
+}
+
+func writeSitePackagesPackageWithConfig(t *testing.T, providerSource, config string) string {
+	key, err := rsa.GenerateKey(rand.Reader, 2048)
+	require.NoError(t, err)
+	return writeSignedPackage(t, key, [5][]byte{
+		[]byte("launcher"),
+		[]byte("uv"),
+		makeZstdTar(t, []tarEntry{{name: "bin/python3", data: []byte("#!/bin/sh\n"), mode: 0755}}),
+		makeZstdTar(t, []tarEntry{{name: "config.json", data: []byte(config)}}),
+		makeZstdTar(t, []tarEntry{{name: "site-packages/pkg.py", data: []byte(providerSource)}}),
+	})
+}
+
+func TestEnsureEnvironment_ConcurrentLaunchersSetUpOnce(t *testing.T) {
+	exePath := writeSitePackagesPackage(t, "async def serve(): return 0\n")
+	workDir := filepath.Join(t.TempDir(), "provider")
+	storeDir := filepath.Join(t.TempDir(), "store")
+	require.NoError(t, os.MkdirAll(workDir, 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(workDir, "stale.txt"), []byte("old"), 0644))
+
+	var wg sync.WaitGroup
+	var setups atomic.Int32
+	for i := 0; i < 8; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			ranSetup, err := ensureEnvironment(exePath, workDir, storeDir, "hash-1")
+			assert.NoError(t, err)
+			if ranSetup {
+				setups.Add(1)
+			}
+		}()
+	}
+	wg.Wait()
+
+	assert.Equal(t, int32(1), setups.Load())
+	assert.NoFileExists(t, filepath.Join(workDir, "stale.txt"))
+	assert.FileExists(t, filepath.Join(workDir, "payload_extracted", "site-packages", "pkg.py"))
+	assert.FileExists(t, filepath.Join(workDir, "runtime.json"))
+	complete, err := os.ReadFile(filepath.Join(workDir, ".complete"))
+	require.NoError(t, err)
+	assert.Equal(t, "hash-1", string(complete))
+
+	leftovers, err := filepath.Glob(workDir + ".*-*")
+	require.NoError(t, err)
+	assert.Empty(t, leftovers)
+}
+
+func TestEnsureEnvironment_FailedSetupLeavesNoCompletionFile(t *testing.T) {
+	exePath := filepath.Join(t.TempDir(), "not-a-package")
+	require.NoError(t, os.WriteFile(exePath, []byte("garbage"), 0755))
+	workDir := filepath.Join(t.TempDir(), "provider")
+
+	_, err := ensureEnvironment(exePath, workDir, filepath.Join(t.TempDir(), "store"), "hash-1")
+	require.Error(t, err)
+	assert.NoFileExists(t, filepath.Join(workDir, ".complete"))
+}
+
+func TestEnsureEnvironment_ProvidersShareTheStoredRuntime(t *testing.T) {
+	storeDir := filepath.Join(t.TempDir(), "store")
+
+	var pythons []string
+	for i, source := range []string{"async def serve(): return 0\n", "async def serve(): return 1\n"} {
+		exePath := writeSitePackagesPackage(t, source)
+		workDir := filepath.Join(t.TempDir(), "provider")
+		ranSetup, err := ensureEnvironment(exePath, workDir, storeDir, fmt.Sprintf("hash-%d", i))
+		require.NoError(t, err)
+		require.True(t, ranSetup)
+
+		runtimeJSON, err := os.ReadFile(filepath.Join(workDir, "runtime.json"))
+		require.NoError(t, err)
+		var info RuntimeInfo
+		require.NoError(t, json.Unmarshal(runtimeJSON, &info))
+		pythons = append(pythons, info.Python)
+		assert.Len(t, info.Store, 2, "runtime.json lists the python_install and uv entries")
+		assert.NoDirExists(t, filepath.Join(workDir, "python"))
+	}
+
+	assert.Equal(t, pythons[0], pythons[1])
+	assert.True(t, strings.HasPrefix(pythons[0], filepath.Join(storeDir, "python_install")+string(filepath.Separator)))
+	entries, err := filepath.Glob(filepath.Join(storeDir, "python_install", "*"))
+	require.NoError(t, err)
+	assert.Len(t, entries, 2, "one entry plus its lock file")
+}
+
+func TestEnsureEnvironment_UpgradeReusesUnchangedSections(t *testing.T) {
+	workDir := filepath.Join(t.TempDir(), "provider")
+	storeDir := filepath.Join(t.TempDir(), "store")
+	providerFile := filepath.Join(workDir, "payload_extracted", "site-packages", "pkg.py")
+	configFile := filepath.Join(workDir, "metadata_extracted", "config.json")
+
+	v1 := writeSitePackagesPackage(t, "async def serve(): return 0\n")
+	_, err := ensureEnvironment(v1, workDir, storeDir, "hash-1")
+	require.NoError(t, err)
+	before, err := os.Stat(providerFile)
+	require.NoError(t, err)
+
+	// Only the metadata changes: the payload is linked, not extracted again.
+	v2 := writeSitePackagesPackageWithConfig(t, "async def serve(): return 0\n",
+		`{"entry_point": "pkg:serve", "payload_layout": "site-packages", "version": "2"}`)
+	_, err = ensureEnvironment(v2, workDir, storeDir, "hash-2")
+	require.NoError(t, err)
+	after, err := os.Stat(providerFile)
+	require.NoError(t, err)
+	assert.True(t, os.SameFile(before, after), "the unchanged payload is reused")
+	config, err := os.ReadFile(configFile)
+	require.NoError(t, err)
+	assert.Contains(t, string(config), `"version": "2"`)
+
+	digests := readSectionDigests(workDir)
+	require.NotNil(t, digests)
+	assert.Len(t, digests, 4)
+
+	// A changed payload is extracted afresh.
+	v3 := writeSitePackagesPackage(t, "async def serve(): return 3\n")
+	_, err = ensureEnvironment(v3, workDir, storeDir, "hash-3")
+	require.NoError(t, err)
+	source, err := os.ReadFile(providerFile)
+	require.NoError(t, err)
+	assert.Equal(t, "async def serve(): return 3\n", string(source))
+	config, err = os.ReadFile(configFile)
+	require.NoError(t, err)
+	assert.NotContains(t, string(config), "version")
+	assert.NotEqual(t, digests["payload"], readSectionDigests(workDir)["payload"])
+}
+
+func TestEnsureEnvironment_NewVersionReusesThePreviousVersion(t *testing.T) {
+	providersDir := t.TempDir()
+	storeDir := filepath.Join(t.TempDir(), "store")
+	v1Dir := filepath.Join(providersDir, "terraform-provider-demo_v1.0.0_x5")
+	v2Dir := filepath.Join(providersDir, "terraform-provider-demo_v1.1.0_x5")
+	payloadFile := filepath.Join("payload_extracted", "site-packages", "pkg.py")
+
+	v1 := writeSitePackagesPackage(t, "async def serve(): return 0\n")
+	_, err := ensureEnvironment(v1, v1Dir, storeDir, "hash-1")
+	require.NoError(t, err)
+	require.NoError(t, markUsed(v1Dir))
+	// Neither another provider nor a staging directory is a previous version.
+	require.NoError(t, os.MkdirAll(filepath.Join(providersDir, "terraform-provider-other_v2.0.0"), 0755))
+	require.NoError(t, os.MkdirAll(v2Dir+".setup-1", 0755))
+	assert.Equal(t, v1Dir, previousVersionDir(v2Dir))
+	assert.Empty(t, previousVersionDir(filepath.Join(providersDir, "provider")), "unversioned names have no other versions")
+
+	v2 := writeSitePackagesPackageWithConfig(t, "async def serve(): return 0\n",
+		`{"entry_point": "pkg:serve", "payload_layout": "site-packages", "version": "2"}`)
+	_, err = ensureEnvironment(v2, v2Dir, storeDir, "hash-2")
+	require.NoError(t, err)
+
+	before, err := os.Stat(filepath.Join(v1Dir, payloadFile))
+	require.NoError(t, err)
+	after, err := os.Stat(filepath.Join(v2Dir, payloadFile))
+	require.NoError(t, err)
+	assert.True(t, os.SameFile(before, after), "the unchanged payload is linked from v1")
+	assert.FileExists(t, filepath.Join(v1Dir, ".complete"), "v1 is left intact")
+}
+
+func TestPlanReuse_VenvNeedsPayloadAndPythonUnchanged(t *testing.T) {
+	workDir := t.TempDir()
+	require.NoError(t, os.MkdirAll(filepath.Join(workDir, ".venv"), 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(workDir, ".complete"), []byte("hash-1"), 0644))
+	previous := sectionDigests{"metadata": "m1", "payload": "p1", "python_install": "py1", "uv": "uv1"}
+	require.NoError(t, writeSectionDigests(workDir, previous))
+
+	reuse := planReuse(workDir, workDir, sectionDigests{"metadata": "m2", "payload": "p1", "python_install": "py1", "uv": "uv2"})
+	require.NotNil(t, reuse)
+	assert.Equal(t, []string{"payload_extracted", ".venv"}, reuse.trees)
+
+	reuse = planReuse(workDir, workDir, sectionDigests{"metadata": "m1", "payload": "p1", "python_install": "py2", "uv": "uv1"})
+	require.NotNil(t, reuse)
+	assert.Equal(t, []string{"metadata_extracted", "payload_extracted"}, reuse.trees)
+
+	assert.Nil(t, planReuse(workDir, workDir, sectionDigests{"metadata": "m2", "payload": "p2", "python_install": "py1", "uv": "uv1"}))
+
+	reuse = planReuse(filepath.Join(t.TempDir(), "provider_v2"), workDir, previous)
+	require.NotNil(t, reuse)
+	assert.Equal(t, []string{"metadata_extracted", "payload_extracted"}, reuse.trees,
+		"another version's venv records its own path")
+
+	require.NoError(t, os.Remove(filepath.Join(workDir, ".complete")))
+	assert.Nil(t, planReuse(workDir, workDir, previous), "an unfinished setup is never reused")
+}
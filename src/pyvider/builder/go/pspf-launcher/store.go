@@ -0,0 +1,141 @@
+package main
+
+import (
+	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"runtime"
+
+	"pspf-tools/go/pkg/pspf"
+)
+
+// storeEntry is a package section that is extracted once into the shared,
+// content-addressed store under the SHA-256 of its bytes. Every provider and
+// version that embeds the same Python install or uv binary reuses the entry.
+type storeEntry struct {
+	// Dir is <store>/<section>/<hex SHA-256 of the section>.
+	Dir          string
+	digest       []byte
+	offset, size uint64
+}
+
+func sectionDigest(f *os.File, offset, size uint64) ([]byte, error) {
+	h := sha256.New()
+	if _, err := io.CopyBuffer(h, sectionReader(f, offset, size), make([]byte, verifyHashChunkSize)); err != nil {
+		return nil, err
+	}
+	return h.Sum(nil), nil
+}
+
+func newStoreEntry(f *os.File, storeDir, section string, offset, size uint64) (*storeEntry, error) {
+	digest, err := sectionDigest(f, offset, size)
+	if err != nil {
+		return nil, fmt.Errorf("failed to hash %s section: %w", section, err)
+	}
+	return &storeEntry{
+		Dir:    filepath.Join(storeDir, section, hex.EncodeToString(digest)),
+		digest: digest,
+		offset: offset,
+		size:   size,
+	}, nil
+}
+
+// populate extracts the section into the store unless the entry already
+// exists. extract writes the section read from r into dir. The entry is
+// renamed into place only if the bytes extracted hash to its key, so a
+// published entry always matches its name, whichever package wrote it, and,
+// when verified is set, only once it reports the package's signature valid.
+func (e *storeEntry) populate(f *os.File, verified func() error, extract func(r io.Reader, dir string) error) error {
+	if fileExists(e.Dir) {
+		return nil
+	}
+	if err := os.MkdirAll(filepath.Dir(e.Dir), 0755); err != nil {
+		return err
+	}
+	unlock, err := lockFile(e.Dir+".lock", false, func() {
+		log.Info("env", "init", "waiting", "Waiting for a concurrent launcher to populate the shared store.", "path", e.Dir)
+	})
+	if err != nil {
+		return fmt.Errorf("could not lock the shared store entry: %w", err)
+	}
+	defer unlock()
+	if fileExists(e.Dir) {
+		return nil
+	}
+
+	removeStaleSetupDirs(e.Dir)
+	staging := stagingDir(e.Dir, "setup")
+	if err := os.MkdirAll(staging, 0755); err != nil {
+		return err
+	}
+	h := sha256.New()
+	r := io.TeeReader(sectionReader(f, e.offset, e.size), h)
+	err = extract(r, staging)
+	if err == nil {
+		// The decoder may stop before the end of the section.
+		_, err = io.Copy(io.Discard, r)
+	}
+	if err == nil && !bytes.Equal(h.Sum(nil), e.digest) {
+		err = fmt.Errorf("section changed while it was being extracted")
+	}
+	if err == nil && verified != nil {
+		err = verified()
+	}
+	if err == nil {
+		err = os.Rename(staging, e.Dir)
+	}
+	if err != nil {
+		os.RemoveAll(staging)
+		return err
+	}
+	log.Info("env", "init", "ok", "Added section to the shared store.", "path", e.Dir)
+	return nil
+}
+
+// sharedRuntime locates the store entries holding a package's Python install
+// and uv binary.
+type sharedRuntime struct {
+	pythonInstall *storeEntry
+	uv            *storeEntry
+	// verified, when set, waits for the signature check running alongside
+	// extraction; entries are not published before it succeeds.
+	verified func() error
+}
+
+func openSharedRuntime(f *os.File, footer *pspf.Footer, storeDir string) (*sharedRuntime, error) {
+	pythonInstall, err := newStoreEntry(f, storeDir, "python_install", footer.PythonInstallTgzOffset, footer.PythonInstallTgzSize)
+	if err != nil {
+		return nil, err
+	}
+	uv, err := newStoreEntry(f, storeDir, "uv", footer.UvBinaryOffset, footer.UvBinarySize)
+	if err != nil {
+		return nil, err
+	}
+	return &sharedRuntime{pythonInstall: pythonInstall, uv: uv}, nil
+}
+
+func (rt *sharedRuntime) uvExePath() string {
+	name := "uv_embedded"
+	if runtime.GOOS == "windows" {
+		name += ".exe"
+	}
+	return filepath.Join(rt.uv.Dir, name)
+}
+
+func (rt *sharedRuntime) populatePythonInstall(f *os.File) error {
+	return rt.pythonInstall.populate(f, rt.verified, func(r io.Reader, dir string) error {
+		_, err := unTar(r, dir)
+		return err
+	})
+}
+
+func (rt *sharedRuntime) populateUv(f *os.File) error {
+	exeName := filepath.Base(rt.uvExePath())
+	return rt.uv.populate(f, rt.verified, func(r io.Reader, dir string) error {
+		return writeStream(r, filepath.Join(dir, exeName), 0755)
+	})
+}
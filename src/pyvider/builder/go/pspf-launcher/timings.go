@@ -0,0 +1,101 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"sync"
+	"time"
+)
+
+// launchTime approximates process start; startup phases are measured from it.
+var launchTime = time.Now()
+
+// timings records startup phases when PSPF_TIMINGS names a report file. It is
+// nil otherwise, and every method is then a no-op.
+var timings *startupTimer
+
+// startupPhase is one timed phase, in milliseconds since launch.
+type startupPhase struct {
+	Name       string  `json:"name"`
+	StartMs    float64 `json:"start_ms"`
+	DurationMs float64 `json:"duration_ms"`
+}
+
+// startupReport is the JSON written to PSPF_TIMINGS. Cache is how the
+// environment was found: "fingerprint" or "hash" for a valid cache,
+// "concurrent_setup" when another launcher had just set it up, or "setup".
+type startupReport struct {
+	CacheHit     bool           `json:"cache_hit"`
+	Cache        string         `json:"cache"`
+	Exec         string         `json:"exec"`
+	TimeToExecMs float64        `json:"time_to_exec_ms"`
+	Phases       []startupPhase `json:"phases"`
+}
+
+type startupTimer struct {
+	path string
+
+	mu      sync.Mutex
+	report  startupReport
+	written bool
+}
+
+func newStartupTimer(path string) *startupTimer {
+	if path == "" {
+		return nil
+	}
+	return &startupTimer{path: path}
+}
+
+func sinceLaunchMs(t time.Time) float64 {
+	return float64(t.Sub(launchTime).Microseconds()) / 1000
+}
+
+// begin starts timing a phase; the returned function ends it. Phases may run
+// concurrently.
+func (t *startupTimer) begin(name string) func() {
+	if t == nil {
+		return func() {}
+	}
+	start := time.Now()
+	return func() {
+		phase := startupPhase{Name: name, StartMs: sinceLaunchMs(start), DurationMs: float64(time.Since(start).Microseconds()) / 1000}
+		t.mu.Lock()
+		t.report.Phases = append(t.report.Phases, phase)
+		t.mu.Unlock()
+	}
+}
+
+// setCache records how the environment was found.
+func (t *startupTimer) setCache(kind string) {
+	if t == nil {
+		return
+	}
+	t.mu.Lock()
+	t.report.Cache = kind
+	t.report.CacheHit = kind != "setup"
+	t.mu.Unlock()
+}
+
+// execStarted records that the provider is now running, cold or from the
+// warm worker, and writes the report.
+func (t *startupTimer) execStarted(mode string) {
+	if t == nil {
+		return
+	}
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	if t.written {
+		return
+	}
+	t.written = true
+	t.report.Exec = mode
+	t.report.TimeToExecMs = sinceLaunchMs(time.Now())
+	data, err := json.MarshalIndent(t.report, "", "  ")
+	if err == nil {
+		err = os.WriteFile(t.path, data, 0644)
+	}
+	if err != nil {
+		log.Warn("launcher", "timings", "warning", "Could not write the startup timing report", "path", t.path, "error", err)
+	}
+}
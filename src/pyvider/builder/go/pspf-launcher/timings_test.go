@@ -0,0 +1,60 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func readStartupReport(t *testing.T, path string) startupReport {
+	data, err := os.ReadFile(path)
+	require.NoError(t, err)
+	var report startupReport
+	require.NoError(t, json.Unmarshal(data, &report))
+	return report
+}
+
+func phaseNames(report startupReport) map[string]bool {
+	names := map[string]bool{}
+	for _, phase := range report.Phases {
+		names[phase.Name] = true
+	}
+	return names
+}
+
+func TestStartupTimer_NilIsNoOp(t *testing.T) {
+	var timer *startupTimer
+	timer.begin("self_hash")()
+	timer.setCache("hash")
+	timer.execStarted("cold")
+	assert.Nil(t, newStartupTimer(""))
+}
+
+func TestStartupTimer_RecordsSetupPhases(t *testing.T) {
+	reportPath := filepath.Join(t.TempDir(), "timings.json")
+	timings = newStartupTimer(reportPath)
+	defer func() { timings = nil }()
+
+	exePath := writeSitePackagesPackage(t, "async def serve(): return 0\n")
+	workDir := filepath.Join(t.TempDir(), "provider")
+	_, err := ensureEnvironment(exePath, workDir, filepath.Join(t.TempDir(), "store"), "hash-1")
+	require.NoError(t, err)
+	timings.execStarted("cold")
+	timings.execStarted("warm")
+
+	report := readStartupReport(t, reportPath)
+	assert.False(t, report.CacheHit)
+	assert.Equal(t, "setup", report.Cache)
+	assert.Equal(t, "cold", report.Exec, "only the first exec is reported")
+	names := phaseNames(report)
+	for _, name := range []string{"setup_lock", "footer_read", "verify_signature", "extract:metadata", "extract:payload", "extract:python_install", "extract:uv"} {
+		assert.True(t, names[name], "missing phase %s", name)
+	}
+	for _, phase := range report.Phases {
+		assert.True(t, phase.StartMs >= 0 && phase.StartMs+phase.DurationMs <= report.TimeToExecMs, phase.Name)
+	}
+}
@@ -0,0 +1,85 @@
+package main
+
+import (
+	"bytes"
+	"crypto"
+	"crypto/rand"
+	"crypto/rsa"
+	"crypto/sha256"
+	"crypto/x509"
+	"encoding/binary"
+	"encoding/pem"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"pspf-tools/go/pkg/pspf"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// writeSignedPackage assembles a minimal signed package from raw section
+// bytes and returns its path.
+func writeSignedPackage(t *testing.T, key *rsa.PrivateKey, sections [5][]byte) string {
+	var buf bytes.Buffer
+	offsets := make([]uint64, 5)
+	for i, section := range sections {
+		offsets[i] = uint64(buf.Len())
+		buf.Write(section)
+	}
+	digest := sha256.Sum256(buf.Bytes())
+	signature, err := rsa.SignPSS(rand.Reader, key, crypto.SHA256, digest[:], &rsa.PSSOptions{SaltLength: rsa.PSSSaltLengthAuto, Hash: crypto.SHA256})
+	require.NoError(t, err)
+	pubDER, err := x509.MarshalPKIXPublicKey(&key.PublicKey)
+	require.NoError(t, err)
+	pubPEM := pem.EncodeToMemory(&pem.Block{Type: "PUBLIC KEY", Bytes: pubDER})
+
+	signatureOffset := uint64(buf.Len())
+	buf.Write(signature)
+	publicKeyOffset := uint64(buf.Len())
+	buf.Write(pubPEM)
+
+	footer := pspf.Footer{
+		UvBinaryOffset: offsets[1], UvBinarySize: uint64(len(sections[1])),
+		PythonInstallTgzOffset: offsets[2], PythonInstallTgzSize: uint64(len(sections[2])),
+		MetadataTgzOffset: offsets[3], MetadataTgzSize: uint64(len(sections[3])),
+		PayloadTgzOffset: offsets[4], PayloadTgzSize: uint64(len(sections[4])),
+		PackageSignatureOffset: signatureOffset, PackageSignatureSize: uint64(len(signature)),
+		PublicKeyPEMOffset: publicKeyOffset, PublicKeyPEMSize: uint64(len(pubPEM)),
+		PspfVersion: pspf.Version, InternalFooterMagic: pspf.InternalFooterMagic,
+	}
+	require.NoError(t, footer.CalculateChecksum())
+	require.NoError(t, binary.Write(&buf, binary.LittleEndian, footer))
+	buf.WriteString(pspf.MagicEOFString)
+
+	path := filepath.Join(t.TempDir(), "provider")
+	require.NoError(t, os.WriteFile(path, buf.Bytes(), 0755))
+	return path
+}
+
+func openAndVerify(t *testing.T, path string) error {
+	f, err := os.Open(path)
+	require.NoError(t, err)
+	defer f.Close()
+	footer, err := readAndVerifyFooter(f)
+	require.NoError(t, err)
+	return verifyPackage(f, footer)
+}
+
+func TestVerifyPackage_StreamsSignedSections(t *testing.T) {
+	key, err := rsa.GenerateKey(rand.Reader, 2048)
+	require.NoError(t, err)
+	large := bytes.Repeat([]byte("python"), verifyHashChunkSize/3)
+	sections := [5][]byte{[]byte("launcher"), []byte("uv"), large, []byte("metadata"), []byte("payload")}
+
+	path := writeSignedPackage(t, key, sections)
+	assert.NoError(t, openAndVerify(t, path))
+
+	// Flip one byte in the middle of the Python install section.
+	data, err := os.ReadFile(path)
+	require.NoError(t, err)
+	data[len("launcheruv")+len(large)/2] ^= 0xff
+	require.NoError(t, os.WriteFile(path, data, 0755))
+	assert.Error(t, openAndVerify(t, path))
+}
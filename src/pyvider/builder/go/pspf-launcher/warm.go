@@ -0,0 +1,38 @@
+package main
+
+import "strings"
+
+// WarmServerConfig enables the warm provider worker. It is read from the
+// "warm_server" object in config.json.
+type WarmServerConfig struct {
+	// IdleTimeout is how many seconds the worker lingers without a session.
+	IdleTimeout int `json:"idle_timeout"`
+}
+
+const (
+	warmSocketName         = "warm.sock"
+	warmWorkerName         = "warm_worker.py"
+	warmLogName            = "warm.log"
+	defaultWarmIdleTimeout = 300
+)
+
+// warmEnabled reports whether sessions should go through a warm worker.
+// PSPF_WARM_SERVER=0 forces a cold start.
+func warmEnabled(providerConfig ConfigFromMetadata, envValue string) bool {
+	if providerConfig.WarmServer == nil {
+		return false
+	}
+	return envValue != "0" && !strings.EqualFold(envValue, "false")
+}
+
+// envMap turns a KEY=VALUE list into a map; later entries win, as they do
+// for exec.Cmd.Env.
+func envMap(env []string) map[string]string {
+	m := make(map[string]string, len(env))
+	for _, kv := range env {
+		if key, value, ok := strings.Cut(kv, "="); ok {
+			m[key] = value
+		}
+	}
+	return m
+}
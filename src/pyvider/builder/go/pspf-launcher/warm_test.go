@@ -0,0 +1,22 @@
+package main
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestWarmEnabled(t *testing.T) {
+	warm := ConfigFromMetadata{WarmServer: &WarmServerConfig{IdleTimeout: 60}}
+
+	assert.True(t, warmEnabled(warm, ""))
+	assert.True(t, warmEnabled(warm, "1"))
+	assert.False(t, warmEnabled(warm, "0"))
+	assert.False(t, warmEnabled(warm, "false"))
+	assert.False(t, warmEnabled(ConfigFromMetadata{}, "1"))
+}
+
+func TestEnvMap_LaterEntriesWin(t *testing.T) {
+	env := envMap([]string{"A=1", "PYTHONPATH=/old", "B=x=y", "PYTHONPATH=/new"})
+	assert.Equal(t, map[string]string{"A": "1", "B": "x=y", "PYTHONPATH": "/new"}, env)
+}
@@ -0,0 +1,162 @@
+//go:build !windows
+
+package main
+
+import (
+	"bufio"
+	_ "embed"
+	"encoding/json"
+	"fmt"
+	"net"
+	"os"
+	"os/exec"
+	"os/signal"
+	"path/filepath"
+	"strconv"
+	"syscall"
+	"time"
+)
+
+//go:embed warm_worker.py
+var warmWorkerSource []byte
+
+const (
+	// maxUnixSocketPath is the portable limit on a socket path (sun_path is
+	// 104 bytes on macOS, including the terminating NUL).
+	maxUnixSocketPath = 103
+	// warmStartTimeout bounds the wait for the worker to fork a session.
+	warmStartTimeout = 5 * time.Second
+)
+
+type warmRequest struct {
+	Env map[string]string `json:"env"`
+	Cwd string            `json:"cwd"`
+}
+
+type warmReply struct {
+	Pid      int  `json:"pid"`
+	ExitCode *int `json:"exit_code"`
+}
+
+func readWarmReply(r *bufio.Reader, reply *warmReply) error {
+	line, err := r.ReadBytes('\n')
+	if err != nil {
+		return err
+	}
+	return json.Unmarshal(line, reply)
+}
+
+// runWarm hands this session to the work directory's warm worker, passing it
+// the given stdio descriptors and environment, and waits for the provider to
+// exit. ok is false when no worker took the session; nothing has run then, so
+// a cold start is safe.
+func runWarm(pspfWorkDir string, env []string, stdio [3]*os.File) (exitCode int, ok bool) {
+	socketPath := filepath.Join(pspfWorkDir, warmSocketName)
+	if len(socketPath) > maxUnixSocketPath {
+		return 0, false
+	}
+	conn, err := net.DialUnix("unix", nil, &net.UnixAddr{Name: socketPath, Net: "unix"})
+	if err != nil {
+		return 0, false
+	}
+	defer conn.Close()
+
+	cwd, err := os.Getwd()
+	if err != nil {
+		return 0, false
+	}
+	request, err := json.Marshal(warmRequest{Env: envMap(env), Cwd: cwd})
+	if err != nil {
+		return 0, false
+	}
+	request = append(request, '\n')
+	rights := syscall.UnixRights(int(stdio[0].Fd()), int(stdio[1].Fd()), int(stdio[2].Fd()))
+	n, _, err := conn.WriteMsgUnix(request, rights, nil)
+	if err == nil && n < len(request) {
+		_, err = conn.Write(request[n:])
+	}
+	if err != nil {
+		log.Debug("launcher", "warm", "skip", "Warm worker did not accept the session", "error", err)
+		return 0, false
+	}
+
+	reader := bufio.NewReader(conn)
+	var started warmReply
+	_ = conn.SetReadDeadline(time.Now().Add(warmStartTimeout))
+	if err := readWarmReply(reader, &started); err != nil || started.Pid <= 0 {
+		log.Debug("launcher", "warm", "skip", "Warm worker did not start the session", "error", err)
+		return 0, false
+	}
+	_ = conn.SetReadDeadline(time.Time{})
+	log.Info("launcher", "warm", "ok", "Provider session forked from warm worker", "pid", started.Pid)
+	timings.execStarted("warm")
+
+	// The provider is not our child, so pass on the signals that would
+	// otherwise only reach the launcher.
+	signals := make(chan os.Signal, 1)
+	signal.Notify(signals, syscall.SIGINT, syscall.SIGTERM, syscall.SIGHUP)
+	defer func() {
+		signal.Stop(signals)
+		close(signals)
+	}()
+	go func() {
+		for sig := range signals {
+			_ = syscall.Kill(started.Pid, sig.(syscall.Signal))
+		}
+	}()
+
+	var finished warmReply
+	if err := readWarmReply(reader, &finished); err != nil || finished.ExitCode == nil {
+		log.Error("launcher", "warm", "error", "Lost the connection to the warm provider worker", "error", err)
+		return 1, true
+	}
+	return *finished.ExitCode, true
+}
+
+// startWarmWorker launches a detached warm worker for later sessions. It
+// returns as soon as the worker has been started; the worker itself exits
+// straight away if another one already serves the work directory.
+func startWarmWorker(pspfWorkDir string, providerConfig ConfigFromMetadata) error {
+	socketPath := filepath.Join(pspfWorkDir, warmSocketName)
+	if len(socketPath) > maxUnixSocketPath {
+		return fmt.Errorf("socket path %s is longer than %d bytes", socketPath, maxUnixSocketPath)
+	}
+	interpreter, args, env, err := providerInterpreter(pspfWorkDir, providerConfig)
+	if err != nil {
+		return err
+	}
+
+	scriptPath := filepath.Join(pspfWorkDir, warmWorkerName)
+	partialPath := fmt.Sprintf("%s.%d.partial", scriptPath, os.Getpid())
+	if err := os.WriteFile(partialPath, warmWorkerSource, 0644); err != nil {
+		return err
+	}
+	if err := os.Rename(partialPath, scriptPath); err != nil {
+		os.Remove(partialPath)
+		return err
+	}
+
+	logFile, err := os.OpenFile(filepath.Join(pspfWorkDir, warmLogName), os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0644)
+	if err != nil {
+		return err
+	}
+	defer logFile.Close()
+
+	idleTimeout := providerConfig.WarmServer.IdleTimeout
+	if idleTimeout <= 0 {
+		idleTimeout = defaultWarmIdleTimeout
+	}
+	args = append(args, scriptPath, socketPath, providerConfig.EntryPoint, strconv.Itoa(idleTimeout))
+	cmd := exec.Command(interpreter, args...)
+	cmd.Env = env
+	cmd.Dir = pspfWorkDir
+	cmd.Stdout = logFile
+	cmd.Stderr = logFile
+	// A session of its own keeps the worker out of Terraform's process group.
+	cmd.SysProcAttr = &syscall.SysProcAttr{Setsid: true}
+	if err := cmd.Start(); err != nil {
+		return err
+	}
+	log.Info("launcher", "warm", "progress", "Started warm provider worker", "pid", cmd.Process.Pid, "idle_timeout", idleTimeout)
+	return cmd.Process.Release()
+}
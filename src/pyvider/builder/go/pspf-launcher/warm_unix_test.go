@@ -0,0 +1,69 @@
+//go:build !windows
+
+package main
+
+import (
+	"io"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"syscall"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestWarmWorker_ServesSessionsOnPassedStdio(t *testing.T) {
+	python, err := exec.LookPath("python3")
+	if err != nil {
+		t.Skip("python3 is required to run the warm worker")
+	}
+
+	workDir := t.TempDir()
+	if len(filepath.Join(workDir, warmSocketName)) > maxUnixSocketPath {
+		t.Skip("temporary directory path is too long for a Unix socket")
+	}
+	venvBin := filepath.Join(workDir, ".venv", "bin")
+	payloadDir := filepath.Join(workDir, "payload_extracted")
+	require.NoError(t, os.MkdirAll(venvBin, 0755))
+	require.NoError(t, os.MkdirAll(payloadDir, 0755))
+	require.NoError(t, os.Symlink(python, filepath.Join(venvBin, "python")))
+	provider := "import os, sys\n\nasync def serve():\n    sys.stdout.write(os.environ['PSPF_TEST_GREETING'])\n    return 7\n"
+	require.NoError(t, os.WriteFile(filepath.Join(payloadDir, "warmprov.py"), []byte(provider), 0644))
+
+	cfg := ConfigFromMetadata{EntryPoint: "warmprov:serve", WarmServer: &WarmServerConfig{IdleTimeout: 2}}
+	_, ok := runWarm(workDir, os.Environ(), [3]*os.File{os.Stdin, os.Stdout, os.Stderr})
+	require.False(t, ok, "no worker is running yet")
+	require.NoError(t, startWarmWorker(workDir, cfg))
+
+	socketPath := filepath.Join(workDir, warmSocketName)
+	require.Eventually(t, func() bool { return fileExists(socketPath) }, 10*time.Second, 20*time.Millisecond)
+
+	for _, greeting := range []string{"first", "second"} {
+		r, w, err := os.Pipe()
+		require.NoError(t, err)
+		env := append(os.Environ(), "PSPF_TEST_GREETING="+greeting)
+		exitCode, ok := runWarm(workDir, env, [3]*os.File{os.Stdin, w, os.Stderr})
+		require.NoError(t, w.Close())
+		output, err := io.ReadAll(r)
+		require.NoError(t, err)
+		r.Close()
+
+		require.True(t, ok, "session should be served by the warm worker")
+		assert.Equal(t, 7, exitCode)
+		assert.Equal(t, greeting, string(output))
+	}
+
+	// The worker exits once it has been idle for the configured timeout.
+	lockPath := socketPath + ".lock"
+	require.Eventually(t, func() bool {
+		f, err := os.OpenFile(lockPath, os.O_WRONLY, 0)
+		if err != nil {
+			return false
+		}
+		defer f.Close()
+		return syscall.Flock(int(f.Fd()), syscall.LOCK_EX|syscall.LOCK_NB) == nil
+	}, 10*time.Second, 100*time.Millisecond)
+}
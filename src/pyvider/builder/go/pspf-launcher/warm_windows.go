@@ -0,0 +1,12 @@
+//go:build windows
+
+package main
+
+import "os"
+
+// Warm workers rely on Unix sockets, descriptor passing and fork, so Windows
+// always starts the provider cold.
+
+func runWarm(string, []string, [3]*os.File) (int, bool) { return 0, false }
+
+func startWarmWorker(string, ConfigFromMetadata) error { return nil }
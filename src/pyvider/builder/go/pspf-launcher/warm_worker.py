@@ -0,0 +1,247 @@
+"""
+Warm provider worker started by the PSPF launcher.
+
+The worker imports the provider's entry-point module once, then serves
+launcher sessions on a Unix socket. A launcher sends its environment and
+working directory as one JSON line, along with its stdin, stdout and stderr
+file descriptors (SCM_RIGHTS). The worker forks; the child adopts those
+descriptors and runs the entry point exactly as a cold start would, so the
+go-plugin handshake goes straight to Terraform. The worker replies with the
+child's pid and, once it exits, its exit code.
+
+It runs under the embedded interpreter, so it only imports the stdlib.
+
+Usage: python warm_worker.py SOCKET_PATH ENTRY_POINT IDLE_TIMEOUT_SECONDS
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+import contextlib
+import fcntl
+import importlib
+import json
+import os
+from pathlib import Path
+import selectors
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Any, NoReturn, TextIO
+
+MAX_REQUEST_SIZE = 1024 * 1024
+REQUEST_TIMEOUT = 5.0
+
+EntryPoint = Callable[[], Coroutine[Any, Any, object]]
+
+
+def exit_status(code: object) -> int:
+    """Maps a `sys.exit` argument to a process exit status."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def read_request(conn: socket.socket) -> tuple[dict[str, Any], list[int]]:
+    conn.settimeout(REQUEST_TIMEOUT)
+    data, fds, _, _ = socket.recv_fds(conn, MAX_REQUEST_SIZE, 3)
+    try:
+        while not data.endswith(b"\n"):
+            chunk = conn.recv(MAX_REQUEST_SIZE)
+            if not chunk or len(data) > MAX_REQUEST_SIZE:
+                raise ConnectionError("incomplete session request")
+            data += chunk
+        if len(fds) != 3:
+            raise ConnectionError("session request is missing stdio descriptors")
+        request: dict[str, Any] = json.loads(data)
+        return request, fds
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def run_session(entry: EntryPoint, request: dict[str, Any], fds: list[int]) -> NoReturn:
+    """Runs in the forked child; never returns."""
+    code = 1
+    try:
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        code = exit_status(asyncio.run(entry()))
+    except SystemExit as e:
+        code = exit_status(e.code)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            with contextlib.suppress(Exception):
+                stream.flush()
+        os._exit(code)
+
+
+def send(conn: socket.socket, message: dict[str, int]) -> None:
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+class WarmWorker:
+    """Accepts launcher sessions and forks a provider process for each."""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        entry: EntryPoint,
+        idle_timeout: float,
+        lock_file: TextIO,
+    ) -> None:
+        self.socket_path = socket_path
+        self.entry = entry
+        self.idle_timeout = idle_timeout
+        self.lock_file = lock_file
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.selector = selectors.DefaultSelector()
+        # Child pid -> launcher connection (None once it has gone).
+        self.sessions: dict[int, socket.socket | None] = {}
+        self.deadline = time.monotonic() + idle_timeout
+        self.socket_inode = 0
+
+    def listen(self) -> None:
+        # The caller holds the lock, so a socket left behind by a crashed
+        # worker can safely be replaced.
+        self.socket_path.unlink(missing_ok=True)
+        self.server.bind(str(self.socket_path))
+        self.socket_path.chmod(0o600)
+        self.server.listen()
+        self.socket_inode = self.socket_path.stat().st_ino
+        self.selector.register(self.server, selectors.EVENT_READ)
+
+    def _still_accepting(self) -> bool:
+        """Stops accepting once idle or once a new setup has replaced the work dir."""
+        if self.server.fileno() == -1:
+            return False
+        try:
+            replaced = self.socket_path.stat().st_ino != self.socket_inode
+        except FileNotFoundError:
+            replaced = True
+        if replaced or (not self.sessions and time.monotonic() >= self.deadline):
+            self.selector.unregister(self.server)
+            self.server.close()
+            return False
+        return True
+
+    def accept(self) -> None:
+        conn, _ = self.server.accept()
+        try:
+            request, fds = read_request(conn)
+        except (OSError, ValueError) as e:
+            print(f"pspf warm worker: rejected session: {e}", file=sys.stderr)
+            conn.close()
+            return
+        self.fork(conn, request, fds)
+
+    def fork(
+        self, conn: socket.socket, request: dict[str, Any], fds: list[int]
+    ) -> None:
+        """Starts a session's provider process and tells the launcher its pid."""
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            self.selector.close()
+            self.lock_file.close()
+            self.server.close()
+            conn.close()
+            for other in self.sessions.values():
+                if other is not None:
+                    other.close()
+            run_session(self.entry, request, fds)
+        for fd in fds:
+            os.close(fd)
+        session: socket.socket | None = conn
+        try:
+            conn.settimeout(None)
+            send(conn, {"pid": pid})
+        except OSError:
+            os.kill(pid, signal.SIGTERM)
+            conn.close()
+            session = None
+        self.sessions[pid] = session
+        if session is not None:
+            self.selector.register(session, selectors.EVENT_READ, pid)
+
+    def disconnect(self, key: selectors.SelectorKey) -> None:
+        # The launcher never writes after its request, so readability means
+        # it has gone away; take its provider down with it.
+        pid: int = key.data
+        conn = self.sessions[pid]
+        self.selector.unregister(key.fileobj)
+        if conn is not None:
+            conn.close()
+        self.sessions[pid] = None
+        os.kill(pid, signal.SIGTERM)
+
+    def reap(self) -> None:
+        """Reports the exit code of every finished provider to its launcher."""
+        while self.sessions:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            conn = self.sessions.pop(pid, None)
+            code = os.waitstatus_to_exitcode(status)
+            if code < 0:
+                code = 128 - code
+            if conn is not None:
+                self.selector.unregister(conn)
+                with contextlib.suppress(OSError):
+                    send(conn, {"exit_code": code})
+                conn.close()
+            if not self.sessions:
+                self.deadline = time.monotonic() + self.idle_timeout
+
+    def serve(self) -> None:
+        """Serves sessions until idle, replaced, and every provider has exited."""
+        while True:
+            if not self._still_accepting() and not self.sessions:
+                return
+            for key, _ in self.selector.select(1.0):
+                if key.fileobj is self.server:
+                    self.accept()
+                else:
+                    self.disconnect(key)
+            self.reap()
+
+
+def main() -> None:
+    socket_path = Path(sys.argv[1])
+    entry_point, idle_timeout = sys.argv[2], float(sys.argv[3])
+
+    # Only one worker serves a work directory; the lock is held for life.
+    lock_path = socket_path.with_name(socket_path.name + ".lock")
+    with lock_path.open("w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return
+
+        module_name, func_name = entry_point.split(":", 1)
+        entry = getattr(importlib.import_module(module_name), func_name)
+
+        worker = WarmWorker(socket_path, entry, idle_timeout, lock_file)
+        worker.listen()
+        worker.serve()
+
+
+if __name__ == "__main__":
+    main()
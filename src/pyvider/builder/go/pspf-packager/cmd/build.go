@@ -4,6 +4,7 @@ import (
 	"bytes"
 	"crypto/sha256"
 	"encoding/hex"
+	"fmt"
 	"io"
 	"os"
 	"os/exec"
@@ -13,22 +14,31 @@ import (
 )
 
 var (
-	buildPayloadDir       string
-	buildPackageKeyPath   string
-	buildOutPath          string
-	buildLauncherBin      string
-	buildConfigFile       string
-	buildUvPath           string
-	buildPublicKeyPath    string
-	buildPythonInstallDir string
-	buildExcludePatterns  []string
-	buildDependencies     []string // New flag to accept dependencies
+	buildPayloadDir         string
+	buildPackageKeyPath     string
+	buildOutPath            string
+	buildLauncherBin        string
+	buildConfigFile         string
+	buildUvPath             string
+	buildPublicKeyPath      string
+	buildPythonInstallDir   string
+	buildExcludePatterns    []string
+	buildDependencies       []string // New flag to accept dependencies
+	buildSectionsDir        string
+	buildCompression        []string
+	buildTimingsPath        string
+	buildPythonInstallIndex string
 )
 
 var buildCmd = &cobra.Command{
 	Use:   "build",
 	Short: "Builds a self-contained PSPF package.",
 	Run: func(cmdCobra *cobra.Command, args []string) {
+		if buildSectionsDir != "" {
+			runSectionsBuild()
+			return
+		}
+
 		if buildOutPath == "" || buildLauncherBin == "" || buildPackageKeyPath == "" || buildPublicKeyPath == "" || buildPythonInstallDir == "" {
 			log.Error("builder", "validate", "error", "All required flags must be provided.")
 			os.Exit(1)
@@ -49,7 +59,7 @@ var buildCmd = &cobra.Command{
 			os.Exit(1)
 		}
 
-		pythonInstallTgzBytes, err := createSourceArchive(log, buildPythonInstallDir, buildExcludePatterns)
+		pythonInstallTgzBytes, pythonInstallMembers, err := createSourceArchive(log, buildPythonInstallDir, buildExcludePatterns)
 		if err != nil {
 			log.Error("builder", "archive", "error", "Failed to archive Python installation dir", "error", err)
 			os.Exit(1)
@@ -99,7 +109,7 @@ var buildCmd = &cobra.Command{
 		}
 
 		uvHashSum := sha256.Sum256(uvBinBytes)
-		pythonCodeTgzBytes, metadataTgzBytes, err := preparePayloadArtifacts(log, finalPayloadDir, configJsonBytes, hex.EncodeToString(uvHashSum[:]), buildExcludePatterns)
+		pythonCodeTgzBytes, metadataTgzBytes, err := preparePayloadArtifacts(log, finalPayloadDir, configJsonBytes, hex.EncodeToString(uvHashSum[:]), buildExcludePatterns, map[string][]ArchiveMember{"python_install": pythonInstallMembers})
 		if err != nil {
 			log.Error("builder", "process", "error", "Failed to prepare payload artifacts.", "error", err)
 			os.Exit(1)
@@ -146,6 +156,92 @@ func init() {
 	buildCmd.Flags().StringVar(&buildPythonInstallDir, "python-install-dir", "", "Path to the Python installation directory to embed.")
 	buildCmd.Flags().StringArrayVar(&buildExcludePatterns, "exclude", []string{}, "Glob patterns to exclude from archives.")
 	buildCmd.Flags().StringArrayVar(&buildDependencies, "dependency", []string{}, "Python dependency to package (local path or PyPI specifier).")
+	buildCmd.Flags().StringVar(&buildSectionsDir, "sections-dir", "", "Write the archive sections to this directory instead of assembling a signed package.")
+	buildCmd.Flags().StringArrayVar(&buildCompression, "compression", []string{}, "Per-section zstd settings as section:level[:threads] (threads 0 = all CPUs).")
+	buildCmd.Flags().StringVar(&buildPythonInstallIndex, "python-install-index", "", "With --sections-dir and no --python-install-dir, the member index saved with the caller's Python install section.")
+	buildCmd.Flags().StringVar(&buildTimingsPath, "timings", "", "With --sections-dir, write the duration of each build phase to this JSON file.")
+}
+
+// runSectionsBuild streams the Python install, payload and metadata archives
+// to files in --sections-dir. Signing and assembly are left to the caller,
+// so no section is ever held in memory. Without --python-install-dir the
+// Python install section is not written; the caller provides it.
+func runSectionsBuild() {
+	compression, err := parseCompressionFlags(buildCompression)
+	if err != nil {
+		log.Error("builder", "validate", "error", "Invalid --compression flag", "error", err)
+		os.Exit(1)
+	}
+
+	actualUvPath := buildUvPath
+	if actualUvPath == "" {
+		resolvedPath, _ := exec.LookPath("uv")
+		actualUvPath = resolvedPath
+	}
+	uvHashHex, err := hashFile(actualUvPath)
+	if err != nil {
+		log.Error("builder", "read", "error", "Failed to hash 'uv' binary", "path", actualUvPath, "error", err)
+		os.Exit(1)
+	}
+
+	configJsonBytes := []byte(`{"entry_point": "pyvider.provider_core:setup_provider"}`)
+	if buildConfigFile != "" {
+		configJsonBytes, err = os.ReadFile(buildConfigFile)
+		if err != nil {
+			log.Error("builder", "read", "error", "Failed to read config file", "path", buildConfigFile, "error", err)
+			os.Exit(1)
+		}
+	}
+
+	var timer *phaseTimer
+	if buildTimingsPath != "" {
+		timer = &phaseTimer{}
+	}
+
+	var wheelDir string
+	err = timer.time("dependencies", func() (err error) {
+		wheelDir, err = buildWheelsFromDependencies(log, buildDependencies)
+		return err
+	})
+	if err != nil {
+		log.Error("builder", "deps", "error", "Failed to build Python wheels from dependencies", "error", err)
+		os.Exit(1)
+	}
+	defer os.RemoveAll(wheelDir)
+
+	finalPayloadDir, err := os.MkdirTemp("", "pspf-final-payload-")
+	if err != nil {
+		log.Error("builder", "temp", "error", "Failed to create final payload directory", "error", err)
+		os.Exit(1)
+	}
+	defer os.RemoveAll(finalPayloadDir)
+	err = timer.time("stage_payload", func() error {
+		if err := copyDirContents(wheelDir, finalPayloadDir); err != nil {
+			return fmt.Errorf("failed to stage wheels: %w", err)
+		}
+		if buildPayloadDir != "" {
+			if err := copyDirContents(buildPayloadDir, finalPayloadDir); err != nil {
+				return fmt.Errorf("failed to stage payload assets: %w", err)
+			}
+		}
+		return nil
+	})
+	if err != nil {
+		log.Error("builder", "process", "error", "Failed to stage the payload", "error", err)
+		os.Exit(1)
+	}
+
+	if err := writeSectionFiles(log, buildSectionsDir, buildPythonInstallDir, buildPythonInstallIndex, finalPayloadDir, configJsonBytes, uvHashHex, buildExcludePatterns, compression, timer); err != nil {
+		log.Error("builder", "archive", "error", "Failed to write package sections", "error", err)
+		os.Exit(1)
+	}
+	if timer != nil {
+		if err := timer.write(buildTimingsPath); err != nil {
+			log.Error("builder", "timings", "error", "Failed to write phase timings", "path", buildTimingsPath, "error", err)
+			os.Exit(1)
+		}
+	}
+	log.Info("builder", "finish", "success", "Package sections written.", "sectionsDir", buildSectionsDir)
 }
 
 func copyDirContents(src, dst string) error {
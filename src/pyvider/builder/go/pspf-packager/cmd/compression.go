@@ -0,0 +1,184 @@
+package cmd
+
+import (
+	"fmt"
+	"io"
+	"runtime"
+	"strconv"
+	"strings"
+	"sync"
+
+	"github.com/valyala/gozstd"
+)
+
+const (
+	// DefaultZstdLevel matches gozstd's default compression level.
+	DefaultZstdLevel = 3
+	// ZstdFrameSize is the amount of uncompressed input per independent zstd
+	// frame when a section is compressed with more than one thread.
+	ZstdFrameSize = 4 * 1024 * 1024
+)
+
+// CompressionSettings describes how one section archive is compressed. It is
+// recorded in manifests.json so readers know the codec and frame layout.
+type CompressionSettings struct {
+	Codec     string `json:"codec"`
+	Level     int    `json:"level"`
+	Threads   int    `json:"threads"`
+	FrameSize int    `json:"frame_size,omitempty"`
+}
+
+// DefaultCompression is single-threaded zstd at the default level, producing
+// a single frame.
+var DefaultCompression = CompressionSettings{Codec: "zstd", Level: DefaultZstdLevel, Threads: 1}
+
+// parseCompressionFlags turns `section:level[:threads]` specs into settings
+// keyed by section name. A thread count of 0 means one per CPU.
+func parseCompressionFlags(specs []string) (map[string]CompressionSettings, error) {
+	settings := make(map[string]CompressionSettings)
+	for _, spec := range specs {
+		parts := strings.Split(spec, ":")
+		if len(parts) < 2 || len(parts) > 3 {
+			return nil, fmt.Errorf("invalid compression spec %q, expected section:level[:threads]", spec)
+		}
+		switch parts[0] {
+		case "python_install", "metadata", "payload":
+		default:
+			return nil, fmt.Errorf("unknown section %q in compression spec %q", parts[0], spec)
+		}
+		level, err := strconv.Atoi(parts[1])
+		if err != nil || level < 1 || level > 22 {
+			return nil, fmt.Errorf("invalid zstd level in compression spec %q (expected 1-22)", spec)
+		}
+		threads := 1
+		if len(parts) == 3 {
+			threads, err = strconv.Atoi(parts[2])
+			if err != nil || threads < 0 {
+				return nil, fmt.Errorf("invalid thread count in compression spec %q", spec)
+			}
+		}
+		if threads == 0 {
+			threads = runtime.NumCPU()
+		}
+		s := CompressionSettings{Codec: "zstd", Level: level, Threads: threads}
+		if threads > 1 {
+			s.FrameSize = ZstdFrameSize
+		}
+		settings[parts[0]] = s
+	}
+	return settings, nil
+}
+
+// compressionFor returns the settings for a section, or the default.
+func compressionFor(settings map[string]CompressionSettings, section string) CompressionSettings {
+	if s, ok := settings[section]; ok {
+		return s
+	}
+	return DefaultCompression
+}
+
+// newCompressingWriter wraps w in a zstd compressor configured by s. Closing
+// the returned writer flushes the stream but does not close w.
+func newCompressingWriter(w io.Writer, s CompressionSettings) io.WriteCloser {
+	if s.Threads > 1 {
+		return newParallelZstdWriter(w, s.Level, s.Threads, s.FrameSize)
+	}
+	return &zstdStreamWriter{gozstd.NewWriterLevel(w, s.Level)}
+}
+
+// zstdStreamWriter releases the cgo encoder once the stream is closed.
+type zstdStreamWriter struct{ *gozstd.Writer }
+
+func (z *zstdStreamWriter) Close() error {
+	defer z.Writer.Release()
+	return z.Writer.Close()
+}
+
+// parallelZstdWriter splits its input into fixed-size blocks and compresses
+// each as an independent zstd frame on its own goroutine. Frames are written
+// in input order; any zstd decoder reads the concatenation as one stream. At
+// most `threads` frames are in flight, which bounds memory use.
+type parallelZstdWriter struct {
+	w         io.Writer
+	level     int
+	frameSize int
+	buf       []byte
+	pending   chan chan []byte
+	done      chan struct{}
+
+	mu  sync.Mutex
+	err error
+}
+
+func newParallelZstdWriter(w io.Writer, level, threads, frameSize int) *parallelZstdWriter {
+	if frameSize <= 0 {
+		frameSize = ZstdFrameSize
+	}
+	p := &parallelZstdWriter{
+		w:         w,
+		level:     level,
+		frameSize: frameSize,
+		buf:       make([]byte, 0, frameSize),
+		pending:   make(chan chan []byte, threads-1),
+		done:      make(chan struct{}),
+	}
+	go p.writeFrames()
+	return p
+}
+
+func (p *parallelZstdWriter) writeFrames() {
+	defer close(p.done)
+	for result := range p.pending {
+		frame := <-result
+		if p.failed() != nil {
+			continue
+		}
+		if _, err := p.w.Write(frame); err != nil {
+			p.mu.Lock()
+			p.err = err
+			p.mu.Unlock()
+		}
+	}
+}
+
+func (p *parallelZstdWriter) failed() error {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+	return p.err
+}
+
+func (p *parallelZstdWriter) submit(block []byte) {
+	result := make(chan []byte, 1)
+	p.pending <- result
+	go func() { result <- gozstd.CompressLevel(nil, block, p.level) }()
+}
+
+func (p *parallelZstdWriter) Write(b []byte) (int, error) {
+	if err := p.failed(); err != nil {
+		return 0, err
+	}
+	n := len(b)
+	for len(b) > 0 {
+		take := p.frameSize - len(p.buf)
+		if take > len(b) {
+			take = len(b)
+		}
+		p.buf = append(p.buf, b[:take]...)
+		b = b[take:]
+		if len(p.buf) == p.frameSize {
+			p.submit(p.buf)
+			p.buf = make([]byte, 0, p.frameSize)
+		}
+	}
+	return n, nil
+}
+
+func (p *parallelZstdWriter) Close() error {
+	if len(p.buf) > 0 {
+		p.submit(p.buf)
+		p.buf = nil
+	}
+	close(p.pending)
+	<-p.done
+	return p.failed()
+}
@@ -0,0 +1,99 @@
+package cmd
+
+import (
+	"bytes"
+	"encoding/json"
+	"io"
+	"os"
+	"path/filepath"
+	"runtime"
+	"testing"
+
+	"pspf-tools/go/pkg/logbowl"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/valyala/gozstd"
+)
+
+func TestParseCompressionFlags(t *testing.T) {
+	settings, err := parseCompressionFlags([]string{"python_install:19", "payload:1:0"})
+	require.NoError(t, err)
+	assert.Equal(t, CompressionSettings{Codec: "zstd", Level: 19, Threads: 1}, settings["python_install"])
+	assert.Equal(t, runtime.NumCPU(), settings["payload"].Threads)
+	assert.Equal(t, DefaultCompression, compressionFor(settings, "metadata"))
+
+	for _, bad := range []string{"payload", "payload:0", "payload:23", "payload:3:-1", "launcher:3", "payload:3:1:1"} {
+		_, err := parseCompressionFlags([]string{bad})
+		assert.Error(t, err, bad)
+	}
+}
+
+func TestParallelZstdWriter_RoundTrip(t *testing.T) {
+	input := make([]byte, 3*1024+17)
+	for i := range input {
+		input[i] = byte(i % 251)
+	}
+
+	var compressed bytes.Buffer
+	zw := newCompressingWriter(&compressed, CompressionSettings{Codec: "zstd", Level: 1, Threads: 4, FrameSize: 1024})
+	// Uneven writes exercise frame boundaries that fall mid-write.
+	for off := 0; off < len(input); off += 700 {
+		end := off + 700
+		if end > len(input) {
+			end = len(input)
+		}
+		_, err := zw.Write(input[off:end])
+		require.NoError(t, err)
+	}
+	require.NoError(t, zw.Close())
+
+	zr := gozstd.NewReader(&compressed)
+	defer zr.Release()
+	output, err := io.ReadAll(zr)
+	require.NoError(t, err)
+	assert.Equal(t, input, output)
+}
+
+func TestWriteSectionFiles_RecordsCompression(t *testing.T) {
+	tmpDir := t.TempDir()
+	log := logbowl.Create("test-sections-compression")
+
+	payloadDir := filepath.Join(tmpDir, "payload")
+	require.NoError(t, os.MkdirAll(payloadDir, 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(payloadDir, "app.py"), []byte("print('hi')"), 0644))
+	pythonInstallDir := filepath.Join(tmpDir, "python")
+	require.NoError(t, os.MkdirAll(pythonInstallDir, 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(pythonInstallDir, "os.py"), []byte("# os"), 0644))
+
+	compression, err := parseCompressionFlags([]string{"payload:1:2", "python_install:19:4"})
+	require.NoError(t, err)
+
+	// A cold build archives the Python install; a warm one reuses a cached section.
+	manifestsFor := func(name, pythonDir string) []byte {
+		sectionsDir := filepath.Join(tmpDir, name)
+		require.NoError(t, writeSectionFiles(log, sectionsDir, pythonDir, "", payloadDir, []byte(`{}`), "abc123", nil, compression, nil))
+
+		payloadBytes, err := os.ReadFile(filepath.Join(sectionsDir, PayloadSectionFile))
+		require.NoError(t, err)
+		assert.Contains(t, getFilesInTarGz(t, payloadBytes), "app.py")
+
+		metadataDir := filepath.Join(tmpDir, name+"-metadata")
+		metadataBytes, err := os.ReadFile(filepath.Join(sectionsDir, MetadataSectionFile))
+		require.NoError(t, err)
+		_, err = unTar(bytes.NewReader(metadataBytes), metadataDir)
+		require.NoError(t, err)
+		manifestBytes, err := os.ReadFile(filepath.Join(metadataDir, "manifests.json"))
+		require.NoError(t, err)
+		return manifestBytes
+	}
+	cold := manifestsFor("cold", pythonInstallDir)
+	warm := manifestsFor("warm", "")
+	assert.Equal(t, string(cold), string(warm))
+
+	var manifests Manifests
+	require.NoError(t, json.Unmarshal(warm, &manifests))
+	assert.Equal(t, compression["payload"], manifests.Compression["payload"])
+	assert.Equal(t, compression["python_install"], manifests.Compression["python_install"])
+	assert.Equal(t, DefaultCompression, manifests.Compression["metadata"])
+}
@@ -0,0 +1,84 @@
+package cmd
+
+import (
+	"archive/tar"
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+)
+
+// IndexFile is the member index written into the metadata archive.
+const IndexFile = "index.json"
+
+// PythonInstallIndexFile is written next to the Python install section by
+// `build --sections-dir`, so a caller that caches the section can hand its
+// index back through --python-install-index.
+const PythonInstallIndexFile = "python_install.index.json"
+
+// ArchiveMember is one member of a section archive. Offset is where the
+// member's tar header starts in the uncompressed tar stream; Sha256 is only
+// set for regular files.
+type ArchiveMember struct {
+	Path   string `json:"path"`
+	Type   string `json:"type"`
+	Size   int64  `json:"size"`
+	Mode   int64  `json:"mode"`
+	Sha256 string `json:"sha256,omitempty"`
+	Offset int64  `json:"offset"`
+}
+
+// ArchiveIndex lists the members of each indexed section archive.
+type ArchiveIndex struct {
+	Version  int                        `json:"version"`
+	Sections map[string][]ArchiveMember `json:"sections"`
+}
+
+func memberType(typeflag byte) string {
+	switch typeflag {
+	case tar.TypeReg:
+		return "file"
+	case tar.TypeDir:
+		return "dir"
+	case tar.TypeSymlink:
+		return "symlink"
+	case tar.TypeLink:
+		return "hardlink"
+	}
+	return "other"
+}
+
+// countingWriter counts the bytes written through it, which gives the
+// offset of each tar member in the uncompressed stream.
+type countingWriter struct {
+	w io.Writer
+	n int64
+}
+
+func (c *countingWriter) Write(b []byte) (int, error) {
+	n, err := c.w.Write(b)
+	c.n += int64(n)
+	return n, err
+}
+
+// writeMemberIndex saves members as the stand-alone index of one section.
+func writeMemberIndex(path string, members []ArchiveMember) error {
+	data, err := json.Marshal(members)
+	if err != nil {
+		return err
+	}
+	return os.WriteFile(path, data, 0644)
+}
+
+// readMemberIndex loads an index saved by writeMemberIndex.
+func readMemberIndex(path string) ([]ArchiveMember, error) {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return nil, err
+	}
+	var members []ArchiveMember
+	if err := json.Unmarshal(data, &members); err != nil {
+		return nil, fmt.Errorf("invalid member index %s: %w", path, err)
+	}
+	return members, nil
+}
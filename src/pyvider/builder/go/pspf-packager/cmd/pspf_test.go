@@ -7,6 +7,7 @@ import (
 	"testing"
 
 	"pspf-tools/go/pkg/logbowl"
+	"pspf-tools/go/pkg/pspf"
 
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
@@ -62,6 +63,6 @@ func TestBuildAndVerifyPSPF(t *testing.T) {
 	assert.Equal(t, uint64(len(payloadTgzBytes)), footer.PayloadTgzSize)
 	assert.Equal(t, uint64(len(signatureBytes)), footer.PackageSignatureSize)
 	assert.Equal(t, uint64(len(pubKeyPEM)), footer.PublicKeyPEMSize)
-	assert.Equal(t, PspfVersion, footer.PspfVersion)
-	assert.Equal(t, PspfInternalFooterMagic, footer.InternalFooterMagic)
+	assert.Equal(t, pspf.Version, footer.PspfVersion)
+	assert.Equal(t, pspf.InternalFooterMagic, footer.InternalFooterMagic)
 }
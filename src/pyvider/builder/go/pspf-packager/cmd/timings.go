@@ -0,0 +1,46 @@
+package cmd
+
+import (
+	"encoding/json"
+	"os"
+	"sync"
+	"time"
+)
+
+// phaseSpan is one timed phase of a build. Start is in Unix microseconds so
+// the orchestrator can place it on its own timeline.
+type phaseSpan struct {
+	Name       string `json:"name"`
+	StartUs    int64  `json:"start_us"`
+	DurationUs int64  `json:"duration_us"`
+}
+
+// phaseTimer records the phases of a sections build for `--timings`. A nil
+// timer just runs the phases.
+type phaseTimer struct {
+	mu    sync.Mutex
+	spans []phaseSpan
+}
+
+func (t *phaseTimer) time(name string, phase func() error) error {
+	if t == nil {
+		return phase()
+	}
+	start := time.Now()
+	err := phase()
+	t.mu.Lock()
+	t.spans = append(t.spans, phaseSpan{Name: name, StartUs: start.UnixMicro(), DurationUs: time.Since(start).Microseconds()})
+	t.mu.Unlock()
+	return err
+}
+
+// write saves the recorded spans as a JSON array.
+func (t *phaseTimer) write(path string) error {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	data, err := json.Marshal(t.spans)
+	if err != nil {
+		return err
+	}
+	return os.WriteFile(path, data, 0644)
+}
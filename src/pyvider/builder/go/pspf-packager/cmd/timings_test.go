@@ -0,0 +1,44 @@
+package cmd
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/require"
+
+	"pspf-tools/go/pkg/logbowl"
+)
+
+func TestWriteSectionFiles_RecordsPhaseTimings(t *testing.T) {
+	tmp := t.TempDir()
+	log := logbowl.Create("test-sections-timings")
+	payloadDir := filepath.Join(tmp, "payload")
+	require.NoError(t, os.MkdirAll(payloadDir, 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(payloadDir, "app.py"), []byte("print('hi')"), 0644))
+
+	timer := &phaseTimer{}
+	require.NoError(t, writeSectionFiles(log, filepath.Join(tmp, "sections"), "", "", payloadDir, []byte(`{}`), "abc123", nil, nil, timer))
+	timingsPath := filepath.Join(tmp, "timings.json")
+	require.NoError(t, timer.write(timingsPath))
+
+	data, err := os.ReadFile(timingsPath)
+	require.NoError(t, err)
+	var spans []phaseSpan
+	require.NoError(t, json.Unmarshal(data, &spans))
+	var names []string
+	for _, span := range spans {
+		names = append(names, span.Name)
+		require.True(t, span.StartUs > 0)
+		require.True(t, span.DurationUs >= 0)
+	}
+	require.Equal(t, []string{"archive:payload", "archive:metadata"}, names)
+}
+
+func TestPhaseTimer_NilTimerRunsPhase(t *testing.T) {
+	var timer *phaseTimer
+	ran := false
+	require.NoError(t, timer.time("phase", func() error { ran = true; return nil }))
+	require.True(t, ran)
+}
@@ -81,12 +81,25 @@ type ManifestFileEntry struct {
 type Manifests struct {
 	UvBinarySha256 string `json:"uv_binary_sha256"`
 	Files []ManifestFileEntry `json:"files"`
+	Compression map[string]CompressionSettings `json:"compression,omitempty"`
 }
 
-func createSourceArchive(log logbowl.Logger, sourceDir string, excludePatterns []string) ([]byte, error) {
+// createSourceArchive returns the zstd-compressed tar of sourceDir as bytes,
+// along with its member index.
+func createSourceArchive(log logbowl.Logger, sourceDir string, excludePatterns []string) ([]byte, []ArchiveMember, error) {
     var buf bytes.Buffer
-    zw := gozstd.NewWriter(&buf)
-    tw := tar.NewWriter(zw)
+    members, err := writeSourceArchive(log, &buf, sourceDir, excludePatterns, DefaultCompression)
+    if err != nil { return nil, nil, err }
+    return buf.Bytes(), members, nil
+}
+
+// writeSourceArchive streams a zstd-compressed tar of sourceDir into w without
+// buffering the archive in memory, and returns an index of its members.
+func writeSourceArchive(log logbowl.Logger, w io.Writer, sourceDir string, excludePatterns []string, compression CompressionSettings) ([]ArchiveMember, error) {
+    zw := newCompressingWriter(w, compression)
+    counter := &countingWriter{w: zw}
+    tw := tar.NewWriter(counter)
+    var members []ArchiveMember
 
     err := filepath.Walk(sourceDir, func(path string, info os.FileInfo, err error) error {
         if err != nil { return err }
@@ -112,53 +125,154 @@ func createSourceArchive(log logbowl.Logger, sourceDir string, excludePatterns [
         if err != nil { return err }
         hdr.Name = filepath.ToSlash(relPath)
 
+        // Flushing pads the previous member, so the count is where this header starts.
+        if err := tw.Flush(); err != nil { return err }
+        member := ArchiveMember{Path: hdr.Name, Type: memberType(hdr.Typeflag), Size: hdr.Size, Mode: hdr.Mode, Offset: counter.n}
         if err := tw.WriteHeader(hdr); err != nil { return err }
 
         if realInfo.Mode().IsRegular() {
             file, err := os.Open(path)
             if err != nil { return err }
             defer file.Close()
-            if _, err := io.Copy(tw, file); err != nil { return err }
+            h := sha256.New()
+            if _, err := io.Copy(io.MultiWriter(tw, h), file); err != nil { return err }
+            member.Sha256 = hex.EncodeToString(h.Sum(nil))
         }
+        members = append(members, member)
         return nil
     })
 
-    if err != nil { return nil, err }
-    if err := tw.Close(); err != nil { return nil, err }
-    if err := zw.Close(); err != nil { return nil, err }
-    return buf.Bytes(), nil
+    if err != nil { zw.Close(); return nil, err }
+    if err := tw.Close(); err != nil { zw.Close(); return nil, err }
+    return members, zw.Close()
 }
 
-func preparePayloadArtifacts(log logbowl.Logger, payloadDir string, configJsonBytes []byte, uvBinHashHex string, excludePatterns []string) (pythonCodeTgzBytes, metadataTgzBytes []byte, err error) {
-	pythonCodeTgzBytes, err = createSourceArchive(log, payloadDir, excludePatterns)
-	if err != nil { return nil, nil, err }
-	
-	metadataAssemblyDir, err := os.MkdirTemp("", "pspf-metadata-assembly-")
-	if err != nil { return nil, nil, err }
-	defer os.RemoveAll(metadataAssemblyDir)
+// writeSourceArchiveFile streams the archive of sourceDir into a new file at
+// outPath and returns its member index.
+func writeSourceArchiveFile(log logbowl.Logger, outPath, sourceDir string, excludePatterns []string, compression CompressionSettings) ([]ArchiveMember, error) {
+	out, err := os.Create(outPath)
+	if err != nil { return nil, err }
+	members, err := writeSourceArchive(log, out, sourceDir, excludePatterns, compression)
+	if err != nil { out.Close(); return nil, err }
+	return members, out.Close()
+}
 
+// assembleMetadataDir writes config.json and manifests.json into dir. The
+// compression settings of the package's sections, if given, are recorded in
+// manifests.json, and the member index of each archived section in index.json.
+func assembleMetadataDir(dir string, configJsonBytes []byte, uvBinHashHex string, compression map[string]CompressionSettings, index map[string][]ArchiveMember) error {
 	var metadataManifestEntries []ManifestFileEntry
 	if len(configJsonBytes) > 0 {
-		configPath := filepath.Join(metadataAssemblyDir, "config.json")
-		if err = os.WriteFile(configPath, configJsonBytes, 0644); err != nil { return nil, nil, err }
+		if err := os.WriteFile(filepath.Join(dir, "config.json"), configJsonBytes, 0644); err != nil { return err }
 		hash := sha256.Sum256(configJsonBytes)
 		metadataManifestEntries = append(metadataManifestEntries, ManifestFileEntry{
 			PathInArchive: "config.json", Sha256: hex.EncodeToString(hash[:]), ArchiveContainer: "metadata.tgz",
 		})
 	}
 
-	manifestData := Manifests{ UvBinarySha256: uvBinHashHex, Files: metadataManifestEntries }
+	manifestData := Manifests{ UvBinarySha256: uvBinHashHex, Files: metadataManifestEntries, Compression: compression }
 	manifestJsonBytes, err := json.MarshalIndent(manifestData, "", "  ")
+	if err != nil { return err }
+	if err := os.WriteFile(filepath.Join(dir, "manifests.json"), manifestJsonBytes, 0644); err != nil { return err }
+
+	if len(index) == 0 { return nil }
+	indexJsonBytes, err := json.Marshal(ArchiveIndex{Version: 1, Sections: index})
+	if err != nil { return err }
+	return os.WriteFile(filepath.Join(dir, IndexFile), indexJsonBytes, 0644)
+}
+
+// preparePayloadArtifacts archives the payload and the metadata. index holds
+// the member indexes of sections archived elsewhere; the payload's is added.
+func preparePayloadArtifacts(log logbowl.Logger, payloadDir string, configJsonBytes []byte, uvBinHashHex string, excludePatterns []string, index map[string][]ArchiveMember) (pythonCodeTgzBytes, metadataTgzBytes []byte, err error) {
+	pythonCodeTgzBytes, payloadMembers, err := createSourceArchive(log, payloadDir, excludePatterns)
 	if err != nil { return nil, nil, err }
-	manifestPath := filepath.Join(metadataAssemblyDir, "manifests.json")
-	if err = os.WriteFile(manifestPath, manifestJsonBytes, 0644); err != nil { return nil, nil, err }
+	index["payload"] = payloadMembers
+	
+	metadataAssemblyDir, err := os.MkdirTemp("", "pspf-metadata-assembly-")
+	if err != nil { return nil, nil, err }
+	defer os.RemoveAll(metadataAssemblyDir)
 
-	metadataTgzBytes, err = createSourceArchive(log, metadataAssemblyDir, excludePatterns)
+	if err = assembleMetadataDir(metadataAssemblyDir, configJsonBytes, uvBinHashHex, nil, index); err != nil { return nil, nil, err }
+
+	metadataTgzBytes, _, err = createSourceArchive(log, metadataAssemblyDir, excludePatterns)
 	if err != nil { return nil, nil, err }
 
 	return pythonCodeTgzBytes, metadataTgzBytes, nil
 }
 
+// Section file names written by `build --sections-dir`. The Python
+// orchestrator assembles and signs the final package from these files.
+const (
+	PythonInstallSectionFile = "python_install.tar.zst"
+	MetadataSectionFile      = "metadata.tar.zst"
+	PayloadSectionFile       = "payload.tar.zst"
+)
+
+// writeSectionFiles streams the Python install, payload and metadata archives
+// into sectionsDir, one file per section. An empty pythonInstallDir skips the
+// Python install section, for callers that supply a cached or pre-built one.
+// Each section is compressed with its entry in compression, or the default.
+// Archiving and compressing a section is one streamed phase of timer.
+// The metadata records the member index of the payload and Python install
+// archives. An archived Python install's index is also saved beside it as
+// PythonInstallIndexFile; for a section supplied by the caller, the index
+// saved with it can be passed as pythonInstallIndex.
+func writeSectionFiles(log logbowl.Logger, sectionsDir, pythonInstallDir, pythonInstallIndex, payloadDir string, configJsonBytes []byte, uvBinHashHex string, excludePatterns []string, compression map[string]CompressionSettings, timer *phaseTimer) error {
+	if err := os.MkdirAll(sectionsDir, 0755); err != nil { return err }
+
+	// The python_install settings are recorded even when the section comes
+	// from a cache or a pre-built archive, so cold and warm builds of the
+	// same input write the same metadata.
+	written := map[string]CompressionSettings{
+		"python_install": compressionFor(compression, "python_install"),
+		"metadata":       compressionFor(compression, "metadata"),
+		"payload":        compressionFor(compression, "payload"),
+	}
+	index := make(map[string][]ArchiveMember)
+	archive := func(section, outFile, sourceDir string) error {
+		return timer.time("archive:"+section, func() error {
+			members, err := writeSourceArchiveFile(log, filepath.Join(sectionsDir, outFile), sourceDir, excludePatterns, written[section])
+			index[section] = members
+			return err
+		})
+	}
+	if pythonInstallDir == "" {
+		log.Info("builder", "archive", "skip", "No Python installation directory given; skipping its section.")
+		if pythonInstallIndex != "" {
+			members, err := readMemberIndex(pythonInstallIndex)
+			if err != nil { return err }
+			index["python_install"] = members
+		}
+	} else {
+		if err := archive("python_install", PythonInstallSectionFile, pythonInstallDir); err != nil {
+			return fmt.Errorf("failed to archive Python installation: %w", err)
+		}
+		if err := writeMemberIndex(filepath.Join(sectionsDir, PythonInstallIndexFile), index["python_install"]); err != nil { return err }
+	}
+	if err := archive("payload", PayloadSectionFile, payloadDir); err != nil {
+		return fmt.Errorf("failed to archive payload: %w", err)
+	}
+
+	metadataAssemblyDir, err := os.MkdirTemp("", "pspf-metadata-assembly-")
+	if err != nil { return err }
+	defer os.RemoveAll(metadataAssemblyDir)
+	if err := assembleMetadataDir(metadataAssemblyDir, configJsonBytes, uvBinHashHex, written, index); err != nil { return err }
+	if err := archive("metadata", MetadataSectionFile, metadataAssemblyDir); err != nil {
+		return fmt.Errorf("failed to archive metadata: %w", err)
+	}
+	return nil
+}
+
+// hashFile returns the hex SHA-256 of a file, streamed from disk.
+func hashFile(path string) (string, error) {
+	f, err := os.Open(path)
+	if err != nil { return "", err }
+	defer f.Close()
+	h := sha256.New()
+	if _, err := io.Copy(h, f); err != nil { return "", err }
+	return hex.EncodeToString(h.Sum(nil)), nil
+}
+
 func unTar(r io.Reader, dest string) ([]string, error) {
 	zr := gozstd.NewReader(r); defer zr.Release(); tr := tar.NewReader(zr)
 	var files []string
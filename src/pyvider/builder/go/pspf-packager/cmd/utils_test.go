@@ -3,6 +3,9 @@ package cmd
 import (
 	"archive/tar"
 	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
 	"io"
 	"os"
 	"path/filepath"
@@ -81,7 +84,7 @@ func TestCreateSourceArchive(t *testing.T) {
 
 
 	// Test without excludes
-	archiveBytes, err := createSourceArchive(log, sourceDir, []string{})
+	archiveBytes, _, err := createSourceArchive(log, sourceDir, []string{})
 	require.NoError(t, err)
 	assert.NotEmpty(t, archiveBytes)
 
@@ -94,7 +97,7 @@ func TestCreateSourceArchive(t *testing.T) {
 
 	// Test with excludes
 	excludePatterns := []string{"**/.venv/**"}
-	archiveBytesExcluded, err := createSourceArchive(log, sourceDir, excludePatterns)
+	archiveBytesExcluded, _, err := createSourceArchive(log, sourceDir, excludePatterns)
 	require.NoError(t, err)
 	assert.NotEmpty(t, archiveBytesExcluded)
 
@@ -124,3 +127,105 @@ func getFilesInTarGz(t *testing.T, data []byte) map[string]bool {
 	}
 	return files
 }
+
+func TestWriteSectionFiles(t *testing.T) {
+	tmpDir := t.TempDir()
+	log := logbowl.Create("test-sections")
+
+	pythonDir := filepath.Join(tmpDir, "python")
+	require.NoError(t, os.MkdirAll(filepath.Join(pythonDir, "bin"), 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(pythonDir, "bin", "python3"), []byte("#!python"), 0755))
+
+	payloadDir := filepath.Join(tmpDir, "payload")
+	require.NoError(t, os.Mkdir(payloadDir, 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(payloadDir, "pkg-0.1.0-py3-none-any.whl"), []byte("wheel"), 0644))
+
+	sectionsDir := filepath.Join(tmpDir, "sections")
+	err := writeSectionFiles(log, sectionsDir, pythonDir, "", payloadDir, []byte(`{"entry_point": "main:run"}`), "abc123", nil, nil, nil)
+	require.NoError(t, err)
+
+	pythonBytes, err := os.ReadFile(filepath.Join(sectionsDir, PythonInstallSectionFile))
+	require.NoError(t, err)
+	assert.Contains(t, getFilesInTarGz(t, pythonBytes), "bin/python3")
+
+	payloadBytes, err := os.ReadFile(filepath.Join(sectionsDir, PayloadSectionFile))
+	require.NoError(t, err)
+	assert.Contains(t, getFilesInTarGz(t, payloadBytes), "pkg-0.1.0-py3-none-any.whl")
+
+	metadataBytes, err := os.ReadFile(filepath.Join(sectionsDir, MetadataSectionFile))
+	require.NoError(t, err)
+	metadataFiles := getFilesInTarGz(t, metadataBytes)
+	assert.Contains(t, metadataFiles, "config.json")
+	assert.Contains(t, metadataFiles, "manifests.json")
+}
+
+func TestWriteSectionFiles_SkipsPythonInstall(t *testing.T) {
+	tmpDir := t.TempDir()
+	log := logbowl.Create("test-sections-skip")
+
+	payloadDir := filepath.Join(tmpDir, "payload")
+	require.NoError(t, os.Mkdir(payloadDir, 0755))
+
+	sectionsDir := filepath.Join(tmpDir, "sections")
+	require.NoError(t, writeSectionFiles(log, sectionsDir, "", "", payloadDir, []byte(`{}`), "abc123", nil, nil, nil))
+
+	assert.NoFileExists(t, filepath.Join(sectionsDir, PythonInstallSectionFile))
+	assert.FileExists(t, filepath.Join(sectionsDir, PayloadSectionFile))
+	assert.FileExists(t, filepath.Join(sectionsDir, MetadataSectionFile))
+}
+
+func TestWriteSectionFiles_RecordsMemberIndex(t *testing.T) {
+	tmpDir := t.TempDir()
+	log := logbowl.Create("test-sections-index")
+
+	pythonDir := filepath.Join(tmpDir, "python")
+	require.NoError(t, os.MkdirAll(filepath.Join(pythonDir, "bin"), 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(pythonDir, "bin", "python3"), []byte("#!python"), 0755))
+	payloadDir := filepath.Join(tmpDir, "payload")
+	require.NoError(t, os.MkdirAll(filepath.Join(payloadDir, "pkg"), 0755))
+	require.NoError(t, os.WriteFile(filepath.Join(payloadDir, "pkg", "a.py"), bytes.Repeat([]byte("a"), 700), 0644))
+	require.NoError(t, os.WriteFile(filepath.Join(payloadDir, "pkg", "b.py"), []byte("b"), 0600))
+
+	readIndex := func(sectionsDir string) ArchiveIndex {
+		metadataBytes, err := os.ReadFile(filepath.Join(sectionsDir, MetadataSectionFile))
+		require.NoError(t, err)
+		metadataDir := filepath.Join(t.TempDir(), "metadata")
+		_, err = unTar(bytes.NewReader(metadataBytes), metadataDir)
+		require.NoError(t, err)
+		indexBytes, err := os.ReadFile(filepath.Join(metadataDir, IndexFile))
+		require.NoError(t, err)
+		var index ArchiveIndex
+		require.NoError(t, json.Unmarshal(indexBytes, &index))
+		return index
+	}
+
+	sectionsDir := filepath.Join(tmpDir, "sections")
+	require.NoError(t, writeSectionFiles(log, sectionsDir, pythonDir, "", payloadDir, []byte(`{}`), "abc123", nil, nil, nil))
+	index := readIndex(sectionsDir)
+	assert.Equal(t, 1, index.Version)
+	require.Contains(t, index.Sections, "python_install")
+
+	payloadBytes, err := os.ReadFile(filepath.Join(sectionsDir, PayloadSectionFile))
+	require.NoError(t, err)
+	tarBytes, err := gozstd.Decompress(nil, payloadBytes)
+	require.NoError(t, err)
+	byPath := make(map[string]ArchiveMember)
+	for _, member := range index.Sections["payload"] {
+		byPath[member.Path] = member
+		// Each offset is the start of the member's header in the tar stream.
+		header, err := tar.NewReader(bytes.NewReader(tarBytes[member.Offset:])).Next()
+		require.NoError(t, err)
+		assert.Equal(t, member.Path, header.Name)
+	}
+	assert.Equal(t, "dir", byPath["pkg"].Type)
+	sum := sha256.Sum256(bytes.Repeat([]byte("a"), 700))
+	assert.Equal(t, ArchiveMember{Path: "pkg/a.py", Type: "file", Size: 700, Mode: 0644, Sha256: hex.EncodeToString(sum[:]), Offset: byPath["pkg/a.py"].Offset}, byPath["pkg/a.py"])
+	assert.Equal(t, int64(0600), byPath["pkg/b.py"].Mode)
+
+	// A cached Python install section's saved index is carried into the metadata.
+	savedIndex := filepath.Join(sectionsDir, PythonInstallIndexFile)
+	require.FileExists(t, savedIndex)
+	rebuiltDir := filepath.Join(tmpDir, "rebuilt")
+	require.NoError(t, writeSectionFiles(log, rebuiltDir, "", savedIndex, payloadDir, []byte(`{}`), "abc123", nil, nil, nil))
+	assert.Equal(t, index.Sections["python_install"], readIndex(rebuiltDir).Sections["python_install"])
+}
@@ -0,0 +1,45 @@
+"""
+Advisory, cross-process file locks used to coordinate shared caches.
+"""
+
+from collections.abc import Iterator
+import contextlib
+import os
+from pathlib import Path
+import sys
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextlib.contextmanager
+def file_lock(
+    path: Path, *, shared: bool = False, blocking: bool = True
+) -> Iterator[None]:
+    """
+    Holds an advisory lock on `path` (created if missing) for the duration
+    of the `with` block.
+
+    Shared locks are only honoured on POSIX; Windows always locks
+    exclusively. With `blocking=False`, `BlockingIOError` is raised if the
+    lock is held elsewhere.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if sys.platform == "win32":  # pragma: no cover
+            mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+            try:
+                msvcrt.locking(fd, mode, 1)
+            except OSError as e:
+                raise BlockingIOError(f"Lock on {path} is held elsewhere.") from e
+        else:
+            operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            if not blocking:
+                operation |= fcntl.LOCK_NB
+            fcntl.flock(fd, operation)
+        yield
+    finally:
+        os.close(fd)
@@ -19,6 +19,37 @@ if FOOTER_SIZE != 108:
         f"Calculated PSPF footer size is {FOOTER_SIZE}, expected 108."
     )
 
+# Section names, in file order. The signature covers the first five.
+PSPF_SECTIONS = (
+    "launcher",
+    "uv",
+    "python_install",
+    "metadata",
+    "payload",
+    "signature",
+    "public_key",
+)
+SIGNED_SECTIONS = PSPF_SECTIONS[:5]
+# The sections that hold zstd-compressed tar archives.
+ARCHIVE_SECTIONS = ("python_install", "metadata", "payload")
+
+
+@define(frozen=True, slots=True)
+class ArchiveMember:
+    """
+    One member of a section archive, as listed in the metadata's member
+    index. `offset` is where the member's tar header starts in the
+    uncompressed tar stream; `sha256` is only set for regular files.
+    """
+
+    section: str
+    path: str
+    type: str
+    size: int
+    mode: int
+    offset: int
+    sha256: str | None = None
+
 
 @define(frozen=True, slots=True)
 class PspfFooter:
@@ -83,6 +114,26 @@ class PspfFooter:
             self.internal_footer_magic,
         )
 
+    def section_range(self, name: str) -> tuple[int, int]:
+        """Returns the `(offset, size)` of a named section in the package."""
+        ranges = {
+            "launcher": (0, self.uv_binary_offset),
+            "uv": (self.uv_binary_offset, self.uv_binary_size),
+            "python_install": (
+                self.python_install_tgz_offset,
+                self.python_install_tgz_size,
+            ),
+            "metadata": (self.metadata_tgz_offset, self.metadata_tgz_size),
+            "payload": (self.payload_tgz_offset, self.payload_tgz_size),
+            "signature": (self.package_signature_offset, self.package_signature_size),
+            "public_key": (self.public_key_pem_offset, self.public_key_pem_size),
+        }
+        if name not in ranges:
+            raise ValueError(
+                f"Unknown PSPF section '{name}'. Expected one of: {', '.join(PSPF_SECTIONS)}."
+            )
+        return ranges[name]
+
     @classmethod
     def unpack(cls, buffer: bytes) -> Self:
         if len(buffer) != FOOTER_SIZE:
@@ -0,0 +1,95 @@
+"""Building several provider manifests in one `pyvbuild package` run."""
+
+from collections.abc import Callable, Iterable, Mapping
+import glob
+import os
+from pathlib import Path
+
+from attrs import define, field
+
+from ..exceptions import BuildError
+
+
+@define(frozen=True, slots=True)
+class BatchResult:
+    """The outcome of building one manifest of a batch."""
+
+    manifest: Path
+    duration: float
+    output: Path | None = None
+    error: str | None = None
+    phases: Mapping[str, float] = field(factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def slowest_phase(self) -> tuple[str, float] | None:
+        if not self.phases:
+            return None
+        return max(self.phases.items(), key=lambda item: item[1])
+
+
+def expand_manifests(patterns: Iterable[str]) -> list[Path]:
+    """
+    Resolves `--manifest` values, expanding glob patterns such as
+    `providers/*/pyproject.toml`, into a de-duplicated list of files.
+    """
+    manifests: list[Path] = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            # Path.glob only takes relative patterns, so glob from the anchor.
+            anchor = Path(pattern).anchor
+            base = Path(anchor) if anchor else Path()
+            matches = sorted(str(p) for p in base.glob(pattern[len(anchor) :]))
+            if not matches:
+                raise BuildError(f"No manifest matches '{pattern}'.")
+        else:
+            matches = [pattern]
+        for match in matches:
+            path = Path(match).resolve()
+            if not path.is_file():
+                raise BuildError(f"File '{match}' does not exist.")
+            if path not in manifests:
+                manifests.append(path)
+    return manifests
+
+
+def default_workers(target_count: int) -> int:
+    return max(1, min(target_count, os.cpu_count() or 1))
+
+
+def run_batch[OptionsT](
+    build: Callable[[Path, OptionsT], BatchResult],
+    manifests: list[Path],
+    options: OptionsT,
+    *,
+    workers: int,
+) -> list[BatchResult]:
+    """
+    Builds every manifest with `build` in a pool of `workers` processes,
+    returning the results in manifest order. A target whose worker fails
+    outright is reported as a failed result, like any other failed build.
+
+    The builds share the on-disk wheel, Python install section and Go binary
+    caches. Their per-entry locks make a section or wheel that several
+    targets need get built by one of them while the others wait and reuse it.
+    """
+    # Imported here: it loads multiprocessing, which single builds never use.
+    from concurrent.futures import ProcessPoolExecutor
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(build, manifest, options) for manifest in manifests]
+        for manifest, future in zip(manifests, futures, strict=True):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(
+                    BatchResult(
+                        manifest=manifest,
+                        duration=0.0,
+                        error=f"{type(e).__name__}: {e}",
+                    )
+                )
+    return results
@@ -0,0 +1,45 @@
+"""Ahead-of-time bytecode compilation of the payload and embedded stdlib."""
+
+from collections.abc import Callable, Iterable
+import fnmatch
+from pathlib import Path
+
+from pyvider.telemetry import logger
+
+RunCommand = Callable[[list[str]], object]
+
+# Probes for the exclude patterns that would strip compiled bytecode back out
+# of the archives.
+_BYTECODE_PROBES = ("pkg/__pycache__/mod.cpython-313.pyc", "pkg/mod.pyc", "pkg/mod.pyo")
+
+
+def strip_bytecode_excludes(exclude_patterns: Iterable[str]) -> list[str]:
+    """Drops the exclude patterns that match `__pycache__` or `.pyc` files."""
+    return [
+        pattern
+        for pattern in exclude_patterns
+        if not any(fnmatch.fnmatch(probe, pattern) for probe in _BYTECODE_PROBES)
+    ]
+
+
+def compile_tree(
+    python_executable: Path, tree: Path, *, jobs: int, run: RunCommand
+) -> None:
+    """
+    Compiles every module under `tree` with the target interpreter.
+
+    The pycs use the unchecked-hash invalidation mode, so the interpreter
+    loads them without comparing them to the source's mtime, which the
+    launcher's extraction does not preserve. They are only ever replaced by
+    a new build.
+    """
+    logger.info("Compiling bytecode", tree=str(tree), jobs=jobs)
+    run(
+        [
+            str(python_executable), "-m", "compileall",
+            "-q", "-f",
+            "-j", str(jobs),
+            "--invalidation-mode", "unchecked-hash",
+            str(tree),
+        ]
+    )
@@ -0,0 +1,96 @@
+"""Content-addressed build caches shared between `pyvbuild` invocations."""
+
+from collections.abc import Iterable, Iterator
+import contextlib
+import fnmatch
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import tempfile
+
+from ..compiler import _get_cache_dir
+from ..locking import file_lock
+
+# Never part of a dependency's source: VCS metadata, virtualenvs, bytecode and
+# the by-products a wheel build leaves behind in the source tree.
+DEFAULT_HASH_EXCLUDES = (".git", ".venv", "__pycache__", "*.pyc", "*.egg-info")
+TOP_LEVEL_HASH_EXCLUDES = ("build", "dist")
+
+
+def cache_subdir(name: str) -> Path:
+    """Returns (and creates) a named directory in the pyvider-builder cache."""
+    path = _get_cache_dir() / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _is_excluded(rel_path: str, name: str, patterns: Iterable[str]) -> bool:
+    return any(
+        fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(name, pattern)
+        for pattern in patterns
+    )
+
+
+def hash_tree(
+    root: Path, exclude_patterns: Iterable[str] = (), extra: Iterable[str] = ()
+) -> str:
+    """
+    Returns a SHA-256 over the relative paths, modes and contents of every
+    file under `root`, skipping anything matched by `exclude_patterns`
+    (with the same relative-path-or-name semantics as the package archives).
+    `extra` strings are folded in to key on inputs outside the tree.
+    """
+    patterns = [*DEFAULT_HASH_EXCLUDES, *exclude_patterns]
+    digest = hashlib.sha256()
+    for dir_path_str, dir_names, file_names in os.walk(root):
+        dir_path = Path(dir_path_str)
+        rel_dir = dir_path.relative_to(root)
+        dir_names[:] = sorted(
+            name
+            for name in dir_names
+            if not _is_excluded((rel_dir / name).as_posix(), name, patterns)
+            and not (rel_dir == Path() and name in TOP_LEVEL_HASH_EXCLUDES)
+        )
+        for name in sorted(file_names):
+            rel_path = (rel_dir / name).as_posix()
+            if _is_excluded(rel_path, name, patterns):
+                continue
+            path = dir_path / name
+            digest.update(rel_path.encode())
+            digest.update(b"\0")
+            digest.update(oct(path.stat().st_mode & 0o777).encode())
+            with path.open("rb") as f:
+                digest.update(hashlib.file_digest(f, "sha256").digest())
+    for value in extra:
+        digest.update(b"\0")
+        digest.update(value.encode())
+    return digest.hexdigest()
+
+
+@contextlib.contextmanager
+def cache_entry(cache_dir: Path, key: str) -> Iterator[tuple[Path, Path | None]]:
+    """
+    Yields `(entry_path, staging_dir)` for a cache entry.
+
+    If the entry already exists, `staging_dir` is None and the entry can be
+    read immediately. Otherwise the caller populates `staging_dir`, which is
+    renamed to `entry_path` when the block exits without an error. A per-key
+    lock makes concurrent builders of the same entry wait for the first.
+    """
+    entry_path = cache_dir / key
+    if entry_path.is_dir():
+        yield entry_path, None
+        return
+
+    with file_lock(cache_dir / f".{key}.lock"):
+        if entry_path.is_dir():
+            yield entry_path, None
+            return
+
+        staging_dir = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=cache_dir))
+        try:
+            yield entry_path, staging_dir
+            staging_dir.replace(entry_path)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
@@ -0,0 +1,94 @@
+"""Per-section zstd compression settings for the package archives."""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from attrs import define, evolve
+
+from ..exceptions import BuildError
+
+# Sections the packager writes as zstd-compressed tar archives.
+COMPRESSED_SECTIONS = ("python_install", "metadata", "payload")
+
+DEFAULT_LEVEL = 3
+MAX_LEVEL = 22
+
+
+@define(frozen=True, slots=True)
+class SectionCompression:
+    """zstd level and worker-thread count for one section (0 threads = all CPUs)."""
+
+    level: int = DEFAULT_LEVEL
+    threads: int = 1
+
+    def __attrs_post_init__(self) -> None:
+        if not 1 <= self.level <= MAX_LEVEL:
+            raise BuildError(
+                f"Invalid zstd compression level {self.level}; expected 1-{MAX_LEVEL}."
+            )
+        if self.threads < 0:
+            raise BuildError(
+                f"Invalid compression thread count {self.threads}; use 0 for all CPUs."
+            )
+
+    def flag(self, section: str) -> str:
+        """Formats the settings as a packager `--compression` value."""
+        return f"{section}:{self.level}:{self.threads}"
+
+
+def _apply(base: SectionCompression, table: Mapping[str, Any]) -> SectionCompression:
+    changes = {key: table[key] for key in ("level", "threads") if key in table}
+    if not all(isinstance(value, int) for value in changes.values()):
+        raise BuildError(f"Compression 'level' and 'threads' must be integers: {table}")
+    return evolve(base, **changes)
+
+
+def resolve_compression(
+    config: Mapping[str, Any],
+    *,
+    level: int | None = None,
+    threads: int | None = None,
+    overrides: Iterable[str] = (),
+) -> dict[str, SectionCompression]:
+    """
+    Resolves the settings for each compressed section.
+
+    `config` is the `[tool.pyvider.build.compression]` table: top-level
+    `level`/`threads` keys apply to every section and a sub-table per
+    section (e.g. `payload = { level = 1, threads = 0 }`) refines them.
+    The `level`/`threads` arguments then apply to every section, and each
+    `section:level[:threads]` override wins over everything else.
+    """
+    unknown = set(config) - {"level", "threads", *COMPRESSED_SECTIONS}
+    if unknown:
+        raise BuildError(
+            f"Unknown keys in [tool.pyvider.build.compression]: {', '.join(sorted(unknown))}."
+        )
+
+    default = _apply(SectionCompression(), config)
+    settings = {}
+    for section in COMPRESSED_SECTIONS:
+        resolved = _apply(default, config.get(section, {}))
+        if level is not None:
+            resolved = evolve(resolved, level=level)
+        if threads is not None:
+            resolved = evolve(resolved, threads=threads)
+        settings[section] = resolved
+
+    for spec in overrides:
+        section, _, rest = spec.partition(":")
+        level_str, _, threads_str = rest.partition(":")
+        if section not in settings or not level_str:
+            raise BuildError(
+                f"Invalid compression override '{spec}'; expected "
+                f"SECTION:LEVEL[:THREADS] with SECTION one of {', '.join(COMPRESSED_SECTIONS)}."
+            )
+        try:
+            settings[section] = evolve(
+                settings[section],
+                level=int(level_str),
+                threads=int(threads_str) if threads_str else settings[section].threads,
+            )
+        except ValueError as e:
+            raise BuildError(f"Invalid compression override '{spec}': {e}") from e
+    return settings
@@ -0,0 +1,281 @@
+"""
+Binary deltas between two versions of a PSPF package.
+
+A delta describes the new package as a sequence of operations: copy a byte
+range of the old package, or take the next bytes of literal data stored in
+the delta. A section whose bytes are unchanged (usually the launcher, uv and
+the Python install) becomes a single copy of its range in the old package,
+wherever the old footer placed it. A changed section is cut into
+content-defined chunks: a chunk ends after the first `_CHUNK_MARKER` at
+least `DELTA_MIN_CHUNK` bytes in, or after `DELTA_MAX_CHUNK` bytes. The cut
+points depend only on nearby bytes, so data shifted by an insertion or a
+deletion is still cut into the same chunks, and each chunk found anywhere in
+the old section is copied from there. Everything else ships as literal data.
+
+File layout: `DELTA_MAGIC`, a little-endian uint32 header length, the JSON
+header (the old and new package SHA-256s and sizes, plus the operations),
+then the literal data in operation order.
+"""
+
+from collections.abc import Iterator
+import hashlib
+import json
+from pathlib import Path
+import re
+import struct
+from typing import Any, BinaryIO
+
+from attrs import define
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from ..exceptions import BuildError, VerificationError
+from ..models import PSPF_SECTIONS
+from .reader import VERIFY_CHUNK_SIZE, PspfReader
+
+DELTA_MAGIC = b"PSPFDLT\x01"
+# Bounds on the chunks that changed sections are matched in. In compressed
+# data the two-byte marker occurs every 64 KiB on average.
+DELTA_MIN_CHUNK = 4 * 1024
+DELTA_MAX_CHUNK = 256 * 1024
+
+_CHUNK_MARKER = re.compile(b"\x9c\xe3")
+
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+@define(frozen=True, slots=True)
+class DeltaStats:
+    reused_sections: tuple[str, ...]
+    new_size: int
+    delta_size: int
+    copied: int
+
+    @property
+    def literal(self) -> int:
+        return self.new_size - self.copied
+
+
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _chunk_hash(data: memoryview) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _chunks(view: memoryview) -> Iterator[tuple[int, int]]:
+    """Yields the `(start, end)` content-defined chunks of `view`."""
+    start = 0
+    while start < len(view):
+        marker = _CHUNK_MARKER.search(
+            view, start + DELTA_MIN_CHUNK, start + DELTA_MAX_CHUNK
+        )
+        end = marker.end() if marker else min(start + DELTA_MAX_CHUNK, len(view))
+        yield start, end
+        start = end
+
+
+def _append(ops: list[list[Any]], op: str, offset: int, length: int) -> None:
+    """Adds an operation, merging it into the previous one when contiguous."""
+    if not length:
+        return
+    # Literal data is always read in order, so data ops are always contiguous.
+    if ops and ops[-1][0] == op and (op == "data" or sum(ops[-1][1:]) == offset):
+        ops[-1][2] += length
+    else:
+        ops.append([op, offset, length])
+
+
+def _diff_section(
+    ops: list[list[Any]],
+    old: memoryview,
+    old_offset: int,
+    new: memoryview,
+    new_offset: int,
+) -> None:
+    """Copies the chunks of `new` that also occur in `old`, at any offset."""
+    index: dict[bytes, int] = {}
+    for start, end in _chunks(old):
+        index.setdefault(_chunk_hash(old[start:end]), start)
+    for start, end in _chunks(new):
+        chunk = new[start:end]
+        match = index.get(_chunk_hash(chunk))
+        if match is not None and old[match : match + len(chunk)] == chunk:
+            _append(ops, "copy", old_offset + match, len(chunk))
+        else:
+            _append(ops, "data", new_offset + start, end - start)
+
+
+def _plan(old: PspfReader, new: PspfReader) -> tuple[list[list[Any]], list[str]]:
+    """
+    Returns the operations rebuilding `new` from `old`. Literal data is
+    recorded as `["data", offset in new, length]` until it is written out.
+    """
+    old_by_digest: dict[str, tuple[int, int]] = {}
+    for name in PSPF_SECTIONS:
+        offset, size = old.footer.section_range(name)
+        with old.section(name) as view:
+            old_by_digest.setdefault(hashlib.sha256(view).hexdigest(), (offset, size))
+
+    ops: list[list[Any]] = []
+    reused: list[str] = []
+    position = 0
+    for name in PSPF_SECTIONS:
+        offset, size = new.footer.section_range(name)
+        if offset != position:
+            raise BuildError(f"Section '{name}' of the new package is not contiguous.")
+        with new.section(name) as view:
+            match = old_by_digest.get(hashlib.sha256(view).hexdigest())
+            if match is not None and size:
+                _append(ops, "copy", match[0], size)
+                reused.append(name)
+            else:
+                old_offset = old.footer.section_range(name)[0]
+                with old.section(name) as old_view:
+                    _diff_section(ops, old_view, old_offset, view, offset)
+        position = offset + size
+    # The footer and EOF magic that follow the public key.
+    _append(ops, "data", position, new.package_path.stat().st_size - position)
+    return ops, reused
+
+
+def create_delta(old_path: Path, new_path: Path, delta_path: Path) -> DeltaStats:
+    """Writes a delta that rebuilds the package at `new_path` from `old_path`."""
+    with PspfReader(old_path) as old, PspfReader(new_path) as new:
+        ops, reused = _plan(old, new)
+        new_size = new.package_path.stat().st_size
+        header = {
+            "old_sha256": _file_sha256(old_path),
+            "old_size": old_path.stat().st_size,
+            "new_sha256": _file_sha256(new_path),
+            "new_size": new_size,
+            "ops": [
+                [op, offset, length] if op == "copy" else [op, length]
+                for op, offset, length in ops
+            ],
+        }
+        header_bytes = json.dumps(header, separators=(",", ":")).encode()
+        with delta_path.open("wb") as out, new_path.open("rb") as source:
+            out.write(DELTA_MAGIC)
+            out.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            out.write(header_bytes)
+            for op, offset, length in ops:
+                if op == "data":
+                    source.seek(offset)
+                    _copy(source, out, length)
+    return DeltaStats(
+        reused_sections=tuple(reused),
+        new_size=new_size,
+        delta_size=delta_path.stat().st_size,
+        copied=sum(length for op, _, length in ops if op == "copy"),
+    )
+
+
+def _copy(source: BinaryIO, target: BinaryIO, length: int, digest: Any = None) -> None:
+    for chunk in _read_exactly(source, length):
+        target.write(chunk)
+        if digest is not None:
+            digest.update(chunk)
+
+
+def _read_exactly(source: BinaryIO, length: int) -> Iterator[bytes]:
+    while length:
+        chunk = source.read(min(length, VERIFY_CHUNK_SIZE))
+        if not chunk:
+            raise VerificationError("Delta or package is truncated.")
+        length -= len(chunk)
+        yield chunk
+
+
+_HEADER_FIELDS = {"old_sha256": str, "new_sha256": str, "ops": list}
+_OP_ARITY = {"copy": 3, "data": 2}
+
+
+def _is_op(op: object) -> bool:
+    if not isinstance(op, list) or not op or not isinstance(op[0], str):
+        return False
+    arity = _OP_ARITY.get(op[0])
+    return len(op) == arity and all(type(arg) is int and arg >= 0 for arg in op[1:])
+
+
+def _read_header(delta: BinaryIO) -> dict[str, Any]:
+    if delta.read(len(DELTA_MAGIC)) != DELTA_MAGIC:
+        raise VerificationError("Not a PSPF delta file.")
+    try:
+        (length,) = _HEADER_LENGTH.unpack(delta.read(_HEADER_LENGTH.size))
+        header = json.loads(delta.read(length))
+    except (struct.error, ValueError) as e:
+        raise VerificationError(f"Corrupt delta header: {e}") from e
+    if not isinstance(header, dict):
+        raise VerificationError("Corrupt delta header: not a JSON object.")
+    missing = [
+        key
+        for key, kind in _HEADER_FIELDS.items()
+        if not isinstance(header.get(key), kind)
+    ]
+    if missing:
+        raise VerificationError(
+            f"Corrupt delta header: missing or invalid {', '.join(missing)}."
+        )
+    for op in header["ops"]:
+        if not _is_op(op):
+            raise VerificationError(f"Corrupt delta header: invalid operation {op!r}.")
+    return header
+
+
+def embedded_public_key(reader: PspfReader) -> rsa.RSAPublicKey:
+    """Loads the public key a package carries in its `public_key` section."""
+    with reader.section("public_key") as view:
+        key = serialization.load_pem_public_key(bytes(view))
+    if not isinstance(key, rsa.RSAPublicKey):
+        raise VerificationError("The package's embedded key is not an RSA key.")
+    return key
+
+
+def apply_delta(
+    old_path: Path,
+    delta_path: Path,
+    out_path: Path,
+    public_key: rsa.RSAPublicKey | None = None,
+) -> None:
+    """
+    Rebuilds the new package from `old_path` and a delta, checks that it is
+    byte-identical to the package the delta was made from, and verifies its
+    signature against `public_key`. By default that is the key embedded in
+    the old package, so an upgrade must be signed by the same key as the
+    installed version. The output is only moved into place once every check
+    has passed.
+    """
+    if public_key is None:
+        with PspfReader(old_path) as old_reader:
+            public_key = embedded_public_key(old_reader)
+    partial_path = out_path.with_name(f".{out_path.name}.partial")
+    with delta_path.open("rb") as delta:
+        header = _read_header(delta)
+        if _file_sha256(old_path) != header["old_sha256"]:
+            raise VerificationError(
+                f"{old_path} is not the package this delta was created from."
+            )
+        digest = hashlib.sha256()
+        try:
+            with old_path.open("rb") as old, partial_path.open("wb") as out:
+                for op, *args in header["ops"]:
+                    if op == "copy":
+                        offset, length = args
+                        old.seek(offset)
+                        _copy(old, out, length, digest)
+                    else:
+                        _copy(delta, out, args[0], digest)
+            if digest.hexdigest() != header["new_sha256"]:
+                raise VerificationError(
+                    "The rebuilt package does not match the delta's target."
+                )
+            with PspfReader(partial_path) as reader:
+                reader.verify(public_key)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+    partial_path.chmod(0o755)
+    partial_path.replace(out_path)
@@ -1,23 +1,163 @@
 """Core logic for building PSPF packages by orchestrating the Go packager CLI."""
 
-from collections.abc import Callable, Iterable
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 import fnmatch
 import json
-import os
 from pathlib import Path
 import shutil
-import subprocess
 import tempfile
 from typing import Any
 import sys
 import importlib
 
+from attrs import define
 from pyvider.telemetry import logger
 
 from ..compiler import ensure_go_binary
+from ..crypto import load_private_key
 from ..exceptions import BuildError
+from .bytecode import compile_tree, strip_bytecode_excludes
+from .cache import cache_entry, cache_subdir
+from .compression import SectionCompression, resolve_compression
+from .pipeline import BuildPipeline
+from .python_install import (
+    PYTHON_INSTALL_CACHE_DIR,
+    python_install_cache_key,
+    validate_python_archive,
+)
+from .timing import BuildTimer
+from .wheels import build_local_wheels, local_dependency_dir, resolve_jobs
+from .writer import PspfWriter
 from pyvider.schema import PvsSchema
 
+# How dependencies reach the target machine: as wheels installed into a venv
+# on first run, or as a site-packages tree installed at build time.
+INSTALL_MODES = ("wheels", "site-packages")
+SITE_PACKAGES_DIR = "site-packages"
+
+# Seconds a warm provider worker lingers without a session.
+DEFAULT_WARM_IDLE_TIMEOUT = 300
+
+
+def resolve_warm_server(
+    value: bool | Mapping[str, Any] | None,
+) -> dict[str, int] | None:
+    """
+    Turns the `warm_server` build setting (`true` or a table with
+    `idle_timeout`) into its config.json form, or None when disabled.
+    """
+    if not value:
+        return None
+    if value is True:
+        value = {}
+    if not isinstance(value, Mapping) or set(value) - {"idle_timeout"}:
+        raise BuildError(
+            f"Invalid warm_server setting {value!r}; use true or "
+            "{ idle_timeout = SECONDS }."
+        )
+    idle_timeout = value.get("idle_timeout", DEFAULT_WARM_IDLE_TIMEOUT)
+    if type(idle_timeout) is not int or idle_timeout < 1:
+        raise BuildError(
+            f"Invalid warm_server idle_timeout {idle_timeout!r}; expected seconds >= 1."
+        )
+    return {"idle_timeout": idle_timeout}
+
+
+# Files written by `pspf-packager build --sections-dir`, keyed by section name.
+SECTION_FILES = {
+    "python_install": "python_install.tar.zst",
+    "metadata": "metadata.tar.zst",
+    "payload": "payload.tar.zst",
+}
+# Member index the packager saves beside an archived Python install section.
+PYTHON_INSTALL_INDEX_FILE = "python_install.index.json"
+
+# Stderr lines of a command kept for its error message; all of them are logged.
+STDERR_TAIL_LINES = 200
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+async def _stream_lines(
+    stream: asyncio.StreamReader | None,
+    sink: list[str] | deque[str],
+    program: str,
+    name: str,
+) -> None:
+    """Logs each line of a command's output as it arrives and adds it to `sink`."""
+    if stream is None:
+        return
+    pending = b""
+    while chunk := await stream.read(STREAM_CHUNK_SIZE):
+        *lines, pending = (pending + chunk).split(b"\n")
+        for raw in lines:
+            line = raw.decode(errors="replace").rstrip("\r")
+            sink.append(line)
+            logger.debug("Command output", command=program, stream=name, line=line)
+    if pending:
+        line = pending.decode(errors="replace").rstrip("\r")
+        sink.append(line)
+        logger.debug("Command output", command=program, stream=name, line=line)
+
+
+@define(frozen=True, slots=True)
+class BuildLayout:
+    """One build's settings and where it keeps its intermediate files."""
+
+    temp_dir: Path
+    uv_path: str
+    install_mode: str
+    local_dirs: tuple[Path, ...]
+    remote_deps: tuple[str, ...]
+    exclude_patterns: tuple[str, ...]
+    archive_excludes: tuple[str, ...]
+    warm_server: dict[str, int] | None
+    python_archive: str | None
+    compile_bytecode: bool
+
+    @property
+    def wheel_dir(self) -> Path:
+        return self.temp_dir / "wheels"
+
+    @property
+    def remote_wheel_dir(self) -> Path:
+        return self.temp_dir / "remote-wheels"
+
+    @property
+    def sections_dir(self) -> Path:
+        return self.temp_dir / "sections"
+
+    @property
+    def site_packages_root(self) -> Path:
+        return self.temp_dir / "payload"
+
+    @property
+    def site_packages(self) -> bool:
+        return self.install_mode == "site-packages"
+
+    @property
+    def compile_payload(self) -> bool:
+        return self.site_packages and self.compile_bytecode
+
+    @property
+    def payload_dir(self) -> Path | None:
+        if self.site_packages:
+            return self.site_packages_root
+        return self.wheel_dir if self.local_dirs or self.remote_deps else None
+
+
+# A build step, given the build's layout and the results of earlier steps.
+BuildStep = Callable[[BuildLayout, Mapping[str, Any]], Awaitable[Any]]
+
+
+def _merge_wheels(source: Path, wheel_dir: Path) -> None:
+    """Moves downloaded wheels into `wheel_dir`, keeping any already there."""
+    wheel_dir.mkdir(parents=True, exist_ok=True)
+    for wheel in source.iterdir():
+        if not (wheel_dir / wheel.name).exists():
+            wheel.replace(wheel_dir / wheel.name)
+
 
 def create_ignore_func(
     root: Path, patterns: list[str]
@@ -53,16 +193,28 @@ class BuildOrchestrator:
         manifest_dir: Path,
         entry_point: str,
         python_version: str | None = None,
+        jobs: int | None = None,
+        compression: Mapping[str, SectionCompression] | None = None,
+        compile_bytecode: bool | None = None,
     ) -> None:
         self.launcher_bin_path = launcher_bin_path
         self.package_integrity_key_path = package_integrity_key_path
         self.public_key_path = public_key_path
         self.output_pspf_path = output_pspf_path
         self.entry_point = entry_point
-        self.packager_executable = str(ensure_go_binary("pspf-packager"))
+        # Set once the build's `packager_binary` step has compiled it.
+        self.packager_executable: str | None = None
         self.build_config = build_config
         self.manifest_dir = manifest_dir
         self.python_version = python_version or self.DEFAULT_PYTHON_VERSION
+        self.jobs = jobs or resolve_jobs(build_config.get("jobs"))
+        self.compression = compression or resolve_compression(
+            build_config.get("compression", {})
+        )
+        if compile_bytecode is None:
+            compile_bytecode = build_config.get("compile_bytecode", False)
+        self.compile_bytecode = compile_bytecode
+        self.timer = BuildTimer()
 
     async def extract_schema(self) -> PvsSchema:
         """Extracts the provider schema."""
@@ -78,67 +230,423 @@ class BuildOrchestrator:
             if src_path.exists():
                 sys.path.pop(0)
 
-    def _run_subprocess(self, command: list[str], cwd: Path | str | None = None) -> str:
+    async def _run_subprocess(
+        self, command: list[str], cwd: Path | str | None = None
+    ) -> str:
+        """
+        Runs `command`, logging its output line by line as it arrives, and
+        returns its stdout. The command is killed if the build step running
+        it is cancelled.
+        """
         logger.info(f"Running command: {' '.join(command)}")
-        result = subprocess.run(
-            command, capture_output=True, text=True, cwd=cwd, check=False
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode != 0:
+        stdout: list[str] = []
+        stderr: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+        try:
+            await asyncio.gather(
+                _stream_lines(process.stdout, stdout, command[0], "stdout"),
+                _stream_lines(process.stderr, stderr, command[0], "stderr"),
+            )
+            returncode = await process.wait()
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        output = "\n".join(stdout).strip()
+        if returncode != 0:
+            stderr_tail = "\n".join(stderr).strip()
             error_message = (
-                f"Command failed with exit code {result.returncode}.\n"
+                f"Command failed with exit code {returncode}.\n"
                 f"  Command: {' '.join(command)}\n"
-                f"  Stdout:\n{result.stdout.strip()}\n"
-                f"  Stderr:\n{result.stderr.strip()}"
+                f"  Stdout:\n{output}\n"
+                f"  Stderr (last {STDERR_TAIL_LINES} lines):\n{stderr_tail}"
             )
             raise BuildError(error_message)
-        if result.stderr:
-            logger.debug("Command stderr", output=result.stderr.strip())
-        return result.stdout.strip()
+        return output
+
+    def _run_blocking(self, command: list[str], cwd: Path | None = None) -> str:
+        """Runs `command` from a worker thread, for the thread-pooled helpers."""
+        return asyncio.run(self._run_subprocess(command, cwd=cwd))
 
     def build_package(self) -> None:
+        asyncio.run(self.build_package_async())
+
+    async def build_package_async(self) -> None:
         logger.info("Orchestrator starting manifest-driven build process...")
         output_path = Path(self.output_pspf_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        with tempfile.TemporaryDirectory(prefix="pyvider_build_") as temp_dir_str:
+            pipeline = self.plan_build(Path(temp_dir_str))
+            logger.info(
+                "Build steps",
+                **{name: list(after) for name, after in pipeline.graph().items()},
+            )
+            await pipeline.run()
+
+        logger.info(
+            "Build phase totals (seconds)",
+            **{phase: round(secs, 3) for phase, secs in self.timer.totals().items()},
+        )
+
+    def plan_build(self, temp_dir: Path) -> BuildPipeline:
+        """
+        Returns the steps of the build and what each one waits for, with
+        every intermediate file under `temp_dir`.
+
+        Finding Python, compiling the Go packager and building local wheels
+        depend on nothing, so they run together. Downloading PyPI wheels
+        waits for the local wheels, whose requirements it resolves too. The
+        packager step waits for all of them, and assembly waits for it.
+        """
+        layout = self._layout(temp_dir)
+        python_archive = layout.python_archive
+        pipeline = BuildPipeline()
+
+        def add(name: str, step: BuildStep, after: Iterable[str] = ()) -> None:
+            async def run(results: Mapping[str, Any]) -> Any:
+                with self.timer.track(name):
+                    return await step(layout, results)
+
+            pipeline.add(name, run, after=after)
+
+        add("packager_binary", self._packager_binary)
+        add("local_wheels", self._local_wheels)
+        before_packager = ["packager_binary", "local_wheels"]
+        if not python_archive or layout.compile_payload:
+            add("find_python", self._find_python)
+            before_packager.append("find_python")
+        if not python_archive:
+            add("python_install_cache_key", self._python_install_key, ["find_python"])
+            before_packager.append("python_install_cache_key")
+        if (layout.remote_deps or layout.local_dirs) and not layout.site_packages:
+            after = ["local_wheels"] if layout.local_dirs else []
+            add("remote_wheels", self._remote_wheels, after)
+            before_packager.append("remote_wheels")
+        if layout.site_packages:
+            after = ["local_wheels"]
+            if not python_archive:
+                after.append("find_python")
+            add("site_packages_install", self._site_packages_install, after)
+            before_packager.append("site_packages_install")
+        if layout.compile_payload:
+            add("compile_bytecode", self._compile_payload, ["site_packages_install"])
+            before_packager.append("compile_bytecode")
+        add("packager", self._build_sections, before_packager)
+        add("assemble", self._assemble, ["packager"])
+        return pipeline
+
+    def _layout(self, temp_dir: Path) -> BuildLayout:
+        """Validates the build settings and lays the build out under `temp_dir`."""
         exclude_patterns = self.build_config.get("exclude", [])
-        python_executable_path_str = self._run_subprocess(
-            ["uv", "python", "find", self.python_version]
+        install_mode = self.build_config.get("install_mode", "wheels")
+        if install_mode not in INSTALL_MODES:
+            raise BuildError(
+                f"Invalid install_mode '{install_mode}'; expected one of: "
+                f"{', '.join(INSTALL_MODES)}."
+            )
+        uv_path = shutil.which("uv")
+        if not uv_path:
+            raise BuildError("'uv' not found in PATH. It is required to build packages.")
+        local_dirs, remote_deps = self._split_dependencies()
+        return BuildLayout(
+            temp_dir=temp_dir,
+            uv_path=uv_path,
+            install_mode=install_mode,
+            local_dirs=tuple(local_dirs),
+            remote_deps=tuple(remote_deps),
+            exclude_patterns=tuple(exclude_patterns),
+            # Compiled bytecode has to survive the archive excludes, which
+            # usually strip `__pycache__` from the source trees.
+            archive_excludes=tuple(
+                strip_bytecode_excludes(exclude_patterns)
+                if self.compile_bytecode
+                else exclude_patterns
+            ),
+            warm_server=resolve_warm_server(self.build_config.get("warm_server")),
+            python_archive=self.build_config.get("python_install_archive"),
+            compile_bytecode=self.compile_bytecode,
         )
-        python_install_dir = Path(python_executable_path_str).resolve().parent.parent
 
-        with tempfile.TemporaryDirectory(prefix="pyvider_build_") as temp_dir_str:
-            temp_dir = Path(temp_dir_str)
-            
-            # The Go builder now receives all dependencies directly.
-            # We resolve local paths here to make them absolute for the Go builder.
-            dependencies = self.build_config.get("dependencies", [])
-            resolved_deps = []
-            for dep in dependencies:
-                dep_path = self.manifest_dir / dep
-                if dep_path.exists():
-                    resolved_deps.append(str(dep_path.resolve()))
-                else:
-                    resolved_deps.append(dep)
-
-            config_data = {"entry_point": self.entry_point}
-            config_json_path = temp_dir / "config.json"
-            config_json_path.write_text(json.dumps(config_data))
-
-            build_cmd_args = [
-                self.packager_executable, "build",
-                "--launcher-bin", self.launcher_bin_path,
-                "--package-key", self.package_integrity_key_path,
-                "--public-key", self.public_key_path,
-                "--out", self.output_pspf_path,
-                "--python-install-dir", str(python_install_dir),
-                "--config", str(config_json_path),
-            ]
-            
-            for dep in resolved_deps:
-                build_cmd_args.extend(["--dependency", dep])
-
-            for pattern in exclude_patterns:
-                build_cmd_args.extend(["--exclude", pattern])
-            
-            # The Go builder now handles all wheel creation, so we run from a neutral temp dir.
-            self._run_subprocess(build_cmd_args, cwd=temp_dir)
+    async def _find_python(
+        self, layout: BuildLayout, results: Mapping[str, Any]
+    ) -> Path:
+        with self.timer.span("find_python"):
+            command = ["uv", "python", "find", self.python_version]
+            return Path(await self._run_subprocess(command))
+
+    async def _packager_binary(
+        self, layout: BuildLayout, results: Mapping[str, Any]
+    ) -> str:
+        with self.timer.span("packager_binary"):
+            binary = await asyncio.to_thread(ensure_go_binary, "pspf-packager")
+        self.packager_executable = str(binary)
+        return self.packager_executable
+
+    async def _local_wheels(
+        self, layout: BuildLayout, results: Mapping[str, Any]
+    ) -> None:
+        # Local paths are built into wheels, in parallel and cached by source hash.
+        with self.timer.span("local_wheels", count=len(layout.local_dirs)):
+            await asyncio.to_thread(
+                build_local_wheels,
+                list(layout.local_dirs),
+                layout.wheel_dir,
+                exclude_patterns=list(layout.exclude_patterns),
+                key_inputs=[self.python_version],
+                jobs=self.jobs,
+                run=self._run_blocking,
+            )
+
+    async def _remote_wheels(
+        self, layout: BuildLayout, results: Mapping[str, Any]
+    ) -> None:
+        # Local wheels are built without their dependencies, so pip resolves
+        # those here along with the PyPI requirements. Run from the neutral
+        # temp dir so `uv run` doesn't pick up a project.
+        local_wheels = sorted(map(str, layout.wheel_dir.glob("*.whl")))
+        requirements = [*local_wheels, *layout.remote_deps]
+        with self.timer.span("remote_wheels", count=len(requirements)):
+            await self._run_subprocess(
+                [
+                    "uv", "run", "pip", "download",
+                    "--dest", str(layout.remote_wheel_dir),
+                    *requirements,
+                ],
+                cwd=layout.temp_dir,
+            )
+
+    async def _site_packages_install(
+        self, layout: BuildLayout, results: Mapping[str, Any]
+    ) -> None:
+        # PyPI requirements are installed with the local wheels in this mode.
+        with self.timer.span("site_packages_install"):
+            await self._install_site_packages(
+                layout.site_packages_root / SITE_PACKAGES_DIR,
+                [*sorted(layout.wheel_dir.glob("*.whl")), *layout.remote_deps],
+                None if layout.python_archive else results["find_python"],
+            )
+
+    async def _compile_payload(
+        self, layout: BuildLayout, results: Mapping[str, Any]
+    ) -> None:
+        with self.timer.span("compile_bytecode", tree="payload"):
+            await asyncio.to_thread(
+                compile_tree,
+                results["find_python"],
+                layout.site_packages_root,
+                jobs=self.jobs,
+                run=self._run_blocking,
+            )
+
+    async def _python_install_key(
+        self, layout: BuildLayout, results: Mapping[str, Any]
+    ) -> str:
+        python_executable = results["find_python"]
+        with self.timer.span("python_install_cache_key"):
+            return await asyncio.to_thread(
+                python_install_cache_key,
+                python_executable,
+                self.python_version,
+                python_executable.resolve().parent.parent,
+                list(layout.archive_excludes),
+                self.compression["python_install"].flag("python_install"),
+                bytecode=self.compile_bytecode,
+            )
+
+    async def _build_sections(
+        self, layout: BuildLayout, results: Mapping[str, Any]
+    ) -> Path:
+        """Runs the Go packager and returns the Python install section it used."""
+        temp_dir = layout.temp_dir
+        if layout.remote_wheel_dir.is_dir():
+            _merge_wheels(layout.remote_wheel_dir, layout.wheel_dir)
+
+        config_data: dict[str, Any] = {
+            "entry_point": self.entry_point,
+            "payload_layout": layout.install_mode,
+        }
+        if layout.warm_server is not None:
+            config_data["warm_server"] = layout.warm_server
+        config_json_path = temp_dir / "config.json"
+        config_json_path.write_text(json.dumps(config_data))
+
+        packager_timings = temp_dir / "packager-timings.json"
+        build_cmd_args = [
+            results["packager_binary"], "build",
+            "--sections-dir", str(layout.sections_dir),
+            "--uv-path", layout.uv_path,
+            "--config", str(config_json_path),
+            "--timings", str(packager_timings),
+        ]
+
+        if layout.payload_dir is not None:
+            build_cmd_args.extend(["--payload-dir", str(layout.payload_dir)])
+
+        for pattern in layout.archive_excludes:
+            build_cmd_args.extend(["--exclude", pattern])
+
+        for section, settings in self.compression.items():
+            build_cmd_args.extend(["--compression", settings.flag(section)])
+
+        if layout.python_archive:
+            python_section = validate_python_archive(
+                self.manifest_dir / layout.python_archive
+            )
+            logger.info(
+                "Embedding pre-built Python archive as-is",
+                archive=str(python_section),
+            )
+            await self._run_packager(build_cmd_args, cwd=temp_dir)
+        else:
+            python_section = await self._run_packager_with_cached_python(
+                build_cmd_args,
+                results["find_python"],
+                results["python_install_cache_key"],
+                layout.sections_dir,
+                temp_dir,
+            )
+        self.timer.add_packager_spans(packager_timings)
+        return python_section
+
+    async def _assemble(self, layout: BuildLayout, results: Mapping[str, Any]) -> None:
+        await asyncio.to_thread(
+            self._assemble_package,
+            layout.sections_dir,
+            Path(layout.uv_path),
+            results["packager"],
+        )
+
+    def _split_dependencies(self) -> tuple[list[Path], list[str]]:
+        """
+        Splits the dependencies into local source trees and pip requirements.
+        A dependency naming an existing directory is a source tree, wherever
+        it is.
+        """
+        local_dirs = []
+        remote_deps = []
+        for dep in self.build_config.get("dependencies", []):
+            dep_path = self.manifest_dir / dep
+            source_dir = local_dependency_dir(dep, self.manifest_dir)
+            if source_dir is not None:
+                local_dirs.append(source_dir)
+            elif dep_path.exists():
+                remote_deps.append(str(dep_path.resolve()))
+            else:
+                remote_deps.append(dep)
+        return local_dirs, remote_deps
+
+    async def _run_packager(self, build_cmd_args: list[str], cwd: Path) -> None:
+        with self.timer.span("packager"):
+            await self._run_subprocess(build_cmd_args, cwd=cwd)
+
+    async def _install_site_packages(
+        self,
+        target: Path,
+        requirements: list[Path | str],
+        python_executable: Path | None,
+    ) -> None:
+        """
+        Installs the wheels and PyPI requirements into a relocatable
+        site-packages directory for the target interpreter, so the launcher
+        needs no venv or install step on first run.
+        """
+        if python_executable is not None:
+            python_args = ["--python", str(python_executable)]
+        else:
+            python_args = ["--python-version", self.python_version]
+        logger.info("Installing dependencies into site-packages", target=str(target))
+        target.mkdir(parents=True, exist_ok=True)
+        if requirements:
+            await self._run_subprocess(
+                [
+                    "uv", "pip", "install",
+                    "--target", str(target),
+                    *python_args,
+                    *map(str, requirements),
+                ]
+            )
+
+    async def _run_packager_with_cached_python(
+        self,
+        build_cmd_args: list[str],
+        python_executable: Path,
+        key: str,
+        sections_dir: Path,
+        cwd: Path,
+    ) -> Path:
+        """
+        Runs the Go packager, only asking it to archive the Python install
+        when no cached section matches `key`, and returns the section's path.
+        The section's member index is cached with it and handed back to the
+        packager on a hit, so the metadata always indexes the section.
+
+        With bytecode compilation on, a copy of the install is compiled and
+        archived, leaving the interpreter's own tree untouched.
+        """
+        python_install_dir = python_executable.resolve().parent.parent
+        file_name = SECTION_FILES["python_install"]
+        cache_dir = cache_subdir(PYTHON_INSTALL_CACHE_DIR)
+        # Every other step has finished by now, so waiting on the cache lock
+        # here holds nothing up.
+        with cache_entry(cache_dir, key) as (entry, staging_dir):
+            if staging_dir is None:
+                logger.info("Reusing cached Python install section", key=key[:16])
+                index_path = entry / PYTHON_INSTALL_INDEX_FILE
+                if index_path.is_file():
+                    build_cmd_args = [
+                        *build_cmd_args,
+                        "--python-install-index",
+                        str(index_path),
+                    ]
+                await self._run_packager(build_cmd_args, cwd=cwd)
+            else:
+                if self.compile_bytecode:
+                    compiled_dir = cwd / "python_install"
+                    with self.timer.span("compile_bytecode", tree="python_install"):
+                        await asyncio.to_thread(
+                            shutil.copytree,
+                            python_install_dir,
+                            compiled_dir,
+                            symlinks=True,
+                        )
+                        await asyncio.to_thread(
+                            compile_tree,
+                            python_executable,
+                            compiled_dir,
+                            jobs=self.jobs,
+                            run=self._run_blocking,
+                        )
+                    python_install_dir = compiled_dir
+                await self._run_packager(
+                    [*build_cmd_args, "--python-install-dir", str(python_install_dir)],
+                    cwd=cwd,
+                )
+                (sections_dir / file_name).replace(staging_dir / file_name)
+                index_path = sections_dir / PYTHON_INSTALL_INDEX_FILE
+                if index_path.is_file():
+                    index_path.replace(staging_dir / PYTHON_INSTALL_INDEX_FILE)
+        return entry / file_name
+
+    def _assemble_package(
+        self, sections_dir: Path, uv_path: Path, python_install_section: Path
+    ) -> None:
+        """Streams the sections into the final signed package."""
+        logger.info("Assembling and signing package", output=self.output_pspf_path)
+        private_key = load_private_key(Path(self.package_integrity_key_path))
+        public_key_pem = Path(self.public_key_path).read_bytes()
+        with PspfWriter(Path(self.output_pspf_path), private_key) as writer:
+            with self.timer.span("assemble"):
+                writer.add_section("launcher", Path(self.launcher_bin_path))
+                writer.add_section("uv", uv_path)
+                writer.add_section("python_install", python_install_section)
+                for name in ("metadata", "payload"):
+                    writer.add_section(name, sections_dir / SECTION_FILES[name])
+            with self.timer.span("sign"):
+                writer.finalize(public_key_pem)
@@ -0,0 +1,92 @@
+"""A dependency graph of build steps, run concurrently with asyncio."""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Iterable, Mapping
+from graphlib import CycleError, TopologicalSorter
+from typing import Any
+
+from attrs import define
+
+from ..exceptions import BuildError
+
+# A step receives the results of the steps that have finished so far,
+# which include every step it runs after.
+StepFunc = Callable[[Mapping[str, Any]], Coroutine[Any, Any, Any]]
+
+
+@define(frozen=True, slots=True)
+class Step:
+    name: str
+    run: StepFunc
+    after: tuple[str, ...] = ()
+
+
+class BuildPipeline:
+    """
+    Runs build steps as soon as the steps they depend on have finished, so
+    independent steps overlap.
+
+    Blocking work belongs in `asyncio.to_thread` inside a step. If a step
+    fails, the steps still running are cancelled and the error is raised.
+    """
+
+    def __init__(self) -> None:
+        self.steps: dict[str, Step] = {}
+
+    def add(self, name: str, run: StepFunc, *, after: Iterable[str] = ()) -> None:
+        if name in self.steps:
+            raise BuildError(f"Build step '{name}' is defined twice.")
+        self.steps[name] = Step(name, run, tuple(after))
+
+    def graph(self) -> dict[str, tuple[str, ...]]:
+        """Maps each step to the steps it runs after."""
+        return {name: step.after for name, step in self.steps.items()}
+
+    def _sorter(self) -> TopologicalSorter[str]:
+        for step in self.steps.values():
+            unknown = [name for name in step.after if name not in self.steps]
+            if unknown:
+                raise BuildError(
+                    f"Build step '{step.name}' depends on unknown steps: "
+                    f"{', '.join(unknown)}."
+                )
+        sorter = TopologicalSorter(self.graph())
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            cycle = " -> ".join(e.args[1])
+            raise BuildError(f"Build steps form a cycle: {cycle}") from e
+        return sorter
+
+    def order(self) -> list[str]:
+        """Returns the steps in an order that respects their dependencies."""
+        sorter = self._sorter()
+        order: list[str] = []
+        while sorter.is_active():
+            ready = sorter.get_ready()
+            order.extend(ready)
+            sorter.done(*ready)
+        return order
+
+    async def run(self) -> dict[str, Any]:
+        """Runs every step and returns their results by step name."""
+        sorter = self._sorter()
+        results: dict[str, Any] = {}
+        running: dict[asyncio.Task[Any], str] = {}
+        try:
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    task = asyncio.create_task(self.steps[name].run(results), name=name)
+                    running[task] = name
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = running.pop(task)
+                    results[name] = task.result()
+                    sorter.done(name)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        return results
@@ -0,0 +1,72 @@
+"""Caching and pass-through of the embedded Python installation section."""
+
+from collections.abc import Iterable
+import hashlib
+import os
+from pathlib import Path
+
+from ..exceptions import BuildError
+
+PYTHON_INSTALL_CACHE_DIR = "python-install"
+
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def python_install_cache_key(
+    python_executable: Path,
+    python_version: str,
+    install_dir: Path,
+    exclude_patterns: Iterable[str],
+    compression: str,
+    *,
+    bytecode: bool = False,
+) -> str:
+    """
+    Keys the compressed Python install section on the resolved interpreter,
+    the requested version, the exclude patterns, the section's compression
+    settings and whether the stdlib is compiled to bytecode, plus the
+    relative path, size and mtime of every entry in the install tree.
+
+    Sizes and mtimes are enough to notice a reinstalled or patched
+    interpreter without reading (and hashing) hundreds of megabytes.
+    """
+    digest = hashlib.sha256()
+    inputs = (
+        str(python_executable.resolve()),
+        python_version,
+        compression,
+        "bytecode" if bytecode else "source",
+    )
+    for value in (*inputs, *exclude_patterns):
+        digest.update(value.encode())
+        digest.update(b"\0")
+    for dir_path_str, dir_names, file_names in os.walk(install_dir):
+        dir_names.sort()
+        dir_path = Path(dir_path_str)
+        # os.walk lists symlinked directories under dir_names without
+        # descending into them; they are part of the install all the same.
+        dir_links = [d for d in dir_names if (dir_path / d).is_symlink()]
+        for name in sorted(file_names + dir_links):
+            path = dir_path / name
+            stat = path.lstat()
+            rel_path = path.relative_to(install_dir).as_posix()
+            digest.update(f"{rel_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def validate_python_archive(archive_path: Path) -> Path:
+    """
+    Checks that a pre-built python-build-standalone archive is a zstd
+    stream (`.tar.zst`), which the launcher can extract as-is.
+    """
+    try:
+        with archive_path.open("rb") as f:
+            magic = f.read(len(ZSTD_FRAME_MAGIC))
+    except OSError as e:
+        raise BuildError(f"Could not read Python archive {archive_path}: {e}") from e
+    if magic != ZSTD_FRAME_MAGIC:
+        raise BuildError(
+            f"Python archive {archive_path} is not zstd-compressed. "
+            "Use a python-build-standalone `.tar.zst` archive."
+        )
+    return archive_path
@@ -1,19 +1,327 @@
-"""Python-based reader for PSPF package metadata."""
+"""Python-based reader and verifier for PSPF packages."""
 
+from collections.abc import Iterator
+import contextlib
+import hashlib
+import io
+import json
+import mmap
 from pathlib import Path
+import tarfile
+from types import TracebackType
+from typing import IO, Self, cast
 
-from ..exceptions import InvalidFooterError
-from ..models import FOOTER_SIZE, PSPF_EOF_MAGIC, PspfFooter
+from cryptography.hazmat.primitives.asymmetric import rsa
+import zstandard
+
+from ..crypto import verify_payload_hash
+from ..exceptions import InvalidFooterError, VerificationError
+from ..models import (
+    ARCHIVE_SECTIONS,
+    FOOTER_SIZE,
+    PSPF_EOF_MAGIC,
+    SIGNED_SECTIONS,
+    ArchiveMember,
+    PspfFooter,
+)
+
+# Bytes hashed per read; keeps verification memory constant for any package size.
+VERIFY_CHUNK_SIZE = 1024 * 1024
+
+# The member index the packager writes into the metadata archive.
+INDEX_FILE = "index.json"
+
+_SKIPPABLE_FRAME_MAGIC = 0x184D2A50
+# Large enough for any zstd frame header.
+_MAX_FRAME_HEADER = 18
+
+
+class _SectionWindow(io.RawIOBase):
+    """A read-only, seekable file-like view over one section of a mapping."""
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview) -> int:  # type: ignore[override]
+        chunk = self._view[self._pos : self._pos + len(buffer)]
+        n = len(chunk)
+        buffer[:n] = chunk
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}
+        self._pos = max(0, base[whence] + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def _window(view: memoryview) -> IO[bytes]:
+    # A RawIOBase is a binary file, but typeshed does not type it as one.
+    return cast(IO[bytes], _SectionWindow(view))
+
+
+def _frame_length(view: memoryview, pos: int) -> int:
+    """Returns the compressed length of the zstd frame at `pos`."""
+    magic = int.from_bytes(view[pos : pos + 4], "little")
+    if magic & 0xFFFFFFF0 == _SKIPPABLE_FRAME_MAGIC:
+        return 8 + int.from_bytes(view[pos + 4 : pos + 8], "little")
+    end = pos + zstandard.frame_header_size(view[pos : pos + _MAX_FRAME_HEADER])
+    last = False
+    while not last:
+        header = int.from_bytes(view[end : end + 3], "little")
+        last = bool(header & 1)
+        # An RLE block stores its one repeated byte.
+        end += 3 + (1 if (header >> 1) & 3 == 1 else header >> 3)
+    if view[pos + 4] & 0x04:  # Content checksum flag.
+        end += 4
+    if end > len(view):
+        raise VerificationError("Section ends inside a zstd frame.")
+    return end - pos
+
+
+def _frame_containing(view: memoryview, target: int) -> tuple[int, int]:
+    """
+    Finds the zstd frame holding uncompressed byte `target` by walking the
+    frame and block headers, without decompressing anything. Returns the
+    frame's compressed offset and the uncompressed offset it starts at.
+    Frames that do not record their content size (those of a streamed,
+    single-frame section) end the walk.
+    """
+    pos = uncompressed = 0
+    while pos < len(view):
+        try:
+            params = zstandard.get_frame_parameters(
+                view[pos : pos + _MAX_FRAME_HEADER]
+            )
+        except zstandard.ZstdError:
+            break
+        size = params.content_size
+        if size == zstandard.CONTENTSIZE_UNKNOWN or uncompressed + size > target:
+            break
+        pos += _frame_length(view, pos)
+        uncompressed += size
+    return pos, uncompressed
+
+
+def _member_type(info: tarfile.TarInfo) -> str:
+    """Names a tar member's type the way the member index does."""
+    if info.isfile():
+        return "file"
+    if info.isdir():
+        return "dir"
+    if info.issym():
+        return "symlink"
+    if info.islnk():
+        return "hardlink"
+    return "other"
+
+
+def _parse_index(data: bytes) -> tuple[ArchiveMember, ...]:
+    """Parses the metadata archive's `INDEX_FILE`."""
+    try:
+        sections = json.loads(data)["sections"]
+        return tuple(
+            ArchiveMember(
+                section=section,
+                path=member["path"],
+                type=member["type"],
+                size=member["size"],
+                mode=member["mode"],
+                offset=member["offset"],
+                sha256=member.get("sha256"),
+            )
+            for section, members in sections.items()
+            for member in members
+        )
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise VerificationError(f"Corrupt member index: {e}") from e
 
 
 class PspfReader:
-    """Reads and interprets the footer of a PSPF file."""
+    """
+    Reads and interprets a PSPF file.
+
+    Sections are exposed zero-copy through a read-only memory map that is
+    opened on first use. Use the reader as a context manager (or call
+    `close()`) to unmap the file; any `memoryview` returned by `section()`
+    must be released before then.
+    """
 
     def __init__(self, package_path: Path) -> None:
         if not package_path.is_file():
             raise FileNotFoundError(f"Package not found at: {package_path}")
         self.package_path = package_path
         self.footer = self._read_and_verify_footer()
+        self._mmap: mmap.mmap | None = None
+        self._index: tuple[ArchiveMember, ...] | None = None
+        self._index_read = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps the package file, if it was mapped."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _mapping(self) -> mmap.mmap:
+        if self._mmap is None:
+            with self.package_path.open("rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def section(self, name: str) -> memoryview:
+        """
+        Returns a zero-copy, read-only `memoryview` of a named section
+        (see `models.PSPF_SECTIONS`).
+        """
+        offset, size = self.footer.section_range(name)
+        mapping = self._mapping()
+        if offset + size > len(mapping):
+            raise InvalidFooterError(
+                f"Section '{name}' extends past the end of the package."
+            )
+        return memoryview(mapping)[offset : offset + size]
+
+    def open_section(self, name: str) -> IO[bytes]:
+        """
+        Returns a bounded, seekable binary file object over a named section,
+        suitable for `tarfile`, `hashlib.file_digest` or `zstandard` readers.
+        """
+        return _window(self.section(name))
+
+    def read_metadata_file(self, name: str) -> bytes | None:
+        """
+        Returns a file from the metadata archive, or None if it has no such
+        file. Only the small metadata section is decompressed.
+        """
+        decompressor = zstandard.ZstdDecompressor()
+        with (
+            self.open_section("metadata") as window,
+            decompressor.stream_reader(window, read_across_frames=True) as stream,
+            tarfile.open(fileobj=stream, mode="r|") as tar,
+        ):
+            for member in tar:
+                if member.isfile() and member.name == name:
+                    extracted = tar.extractfile(member)
+                    assert extracted is not None
+                    return extracted.read()
+        return None
+
+    def index(self) -> tuple[ArchiveMember, ...] | None:
+        """
+        Returns every member of the indexed section archives (the payload and,
+        unless the package embeds a pre-built archive, the Python install)
+        with its size, mode, SHA-256 and offset in the uncompressed tar
+        stream, without decompressing those sections. The index is parsed
+        once per reader.
+
+        Returns None for packages built without an index, and raises
+        `VerificationError` if the index is corrupt.
+        """
+        if not self._index_read:
+            data = self.read_metadata_file(INDEX_FILE)
+            self._index = None if data is None else _parse_index(data)
+            self._index_read = True
+        return self._index
+
+    @contextlib.contextmanager
+    def _open_tar(self, section: str, offset: int = 0) -> Iterator[tarfile.TarFile]:
+        """
+        Opens a section's archive as a tar stream that starts at `offset` in
+        the uncompressed tar. Whole frames before `offset` are skipped
+        unread, so only the frame holding it is decompressed from its start.
+        """
+        if section not in ARCHIVE_SECTIONS:
+            raise ValueError(f"Section '{section}' is not an archive.")
+        with self.section(section) as view:
+            start, uncompressed = _frame_containing(view, offset) if offset else (0, 0)
+            decompressor = zstandard.ZstdDecompressor()
+            with (
+                _window(view[start:]) as window,
+                decompressor.stream_reader(window, read_across_frames=True) as stream,
+            ):
+                stream.seek(offset - uncompressed)
+                with tarfile.open(fileobj=stream, mode="r|") as tar:
+                    yield tar
+
+    def _indexed_offsets(self, section: str) -> dict[str, int] | None:
+        """Maps the paths in a section to their offsets, if the section is indexed."""
+        members = [m for m in self.index() or () if m.section == section]
+        return {m.path: m.offset for m in members} or None
+
+    def members(self, section: str) -> Iterator[ArchiveMember]:
+        """
+        Lists a section archive's members: from the member index when the
+        section is indexed, and otherwise by streaming the archive's headers.
+        """
+        indexed = [m for m in self.index() or () if m.section == section]
+        if indexed:
+            yield from indexed
+            return
+        with self._open_tar(section) as tar:
+            for info in tar:
+                yield ArchiveMember(
+                    section=section,
+                    path=info.name,
+                    type=_member_type(info),
+                    size=info.size,
+                    mode=info.mode,
+                    offset=info.offset,
+                )
+
+    @contextlib.contextmanager
+    def open_member(self, section: str, path: str) -> Iterator[IO[bytes]]:
+        """
+        Opens one regular file of a section archive for reading. With a
+        member index, decompression starts at the frame holding the file;
+        otherwise the archive is streamed up to the file. Either way it
+        stops once the file has been read.
+
+        Raises `FileNotFoundError` if the archive has no such file.
+        """
+        offsets = self._indexed_offsets(section)
+        if offsets is not None and path not in offsets:
+            raise FileNotFoundError(f"No '{path}' in the {section} section.")
+        offset = offsets[path] if offsets is not None else 0
+        with self._open_tar(section, offset) as tar:
+            for info in tar:
+                if info.name != path:
+                    if offsets is not None:
+                        break
+                    continue
+                extracted = tar.extractfile(info) if info.isfile() else None
+                if extracted is None:
+                    raise FileNotFoundError(
+                        f"'{path}' in the {section} section is not a regular file."
+                    )
+                yield extracted
+                return
+        raise FileNotFoundError(f"No '{path}' in the {section} section.")
 
     def _read_and_verify_footer(self) -> PspfFooter:
         """Reads and validates the PSPF footer from the end of the file."""
@@ -33,6 +341,47 @@ class PspfReader:
         except ValueError as e:
             raise InvalidFooterError(f"PSPF Footer validation failed: {e}") from e
 
+    def _read_range(self, offset: int, size: int) -> bytes:
+        with self.package_path.open("rb") as f:
+            f.seek(offset)
+            data = f.read(size)
+        if len(data) != size:
+            raise InvalidFooterError(
+                f"Package is truncated: expected {size} bytes at offset {offset}, "
+                f"read {len(data)}."
+            )
+        return data
+
+    def compute_signed_digest(self) -> bytes:
+        """
+        Returns the SHA-256 digest of the signed sections (launcher through
+        payload), streamed from disk in fixed-size chunks.
+        """
+        digest = hashlib.sha256()
+        buffer = memoryview(bytearray(VERIFY_CHUNK_SIZE))
+        with self.package_path.open("rb", buffering=0) as f:
+            for name in SIGNED_SECTIONS:
+                offset, remaining = self.footer.section_range(name)
+                f.seek(offset)
+                while remaining:
+                    n = f.readinto(buffer[: min(remaining, VERIFY_CHUNK_SIZE)])
+                    if not n:
+                        raise InvalidFooterError(
+                            f"Package is truncated inside the '{name}' section."
+                        )
+                    digest.update(buffer[:n])
+                    remaining -= n
+        return digest.digest()
+
+    def verify(self, public_key: rsa.RSAPublicKey) -> None:
+        """
+        Verifies the package's RSA-PSS signature against `public_key`.
+
+        Raises `SignatureVerificationError` if the signature does not match.
+        """
+        signature = self._read_range(*self.footer.section_range("signature"))
+        verify_payload_hash(self.compute_signed_digest(), signature, public_key)
+
     def get_info(self) -> str:
         """Returns a human-readable string of the package information."""
         f = self.footer
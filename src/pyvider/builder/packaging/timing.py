@@ -0,0 +1,143 @@
+"""Per-phase build timing and Chrome trace export."""
+
+from collections.abc import Iterator, Mapping
+import contextlib
+from contextvars import ContextVar
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from attrs import define, field
+
+from pyvider.telemetry import logger
+
+# The trace track spans are recorded on. Each asyncio task and worker thread
+# sees its own value, so concurrent build steps land on their own tracks.
+_TRACK: ContextVar[str] = ContextVar("build_timer_track", default="orchestrator")
+
+
+@define(frozen=True, slots=True)
+class Span:
+    """One timed phase; `start_us` is relative to the start of the build."""
+
+    name: str
+    start_us: int
+    duration_us: int
+    thread: str = "orchestrator"
+    args: Mapping[str, Any] = field(factory=dict)
+
+
+class BuildTimer:
+    """
+    Records how long each phase of a build takes.
+
+    Phases are timed with `span()`, which also logs each duration. Phases
+    timed by the Go packager are merged in with `add_packager_spans()`.
+    Spans opened under `track()` are drawn on that track of the trace.
+    """
+
+    def __init__(self) -> None:
+        self._start_ns = time.perf_counter_ns()
+        self._start_wall_us = time.time_ns() // 1000
+        self._lock = threading.Lock()
+        self.spans: list[Span] = []
+
+    def _now_us(self) -> int:
+        return (time.perf_counter_ns() - self._start_ns) // 1000
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    @contextlib.contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        token = _TRACK.set(name)
+        try:
+            yield
+        finally:
+            _TRACK.reset(token)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        start_us = self._now_us()
+        try:
+            yield
+        finally:
+            duration_us = self._now_us() - start_us
+            self._record(
+                Span(name, start_us, duration_us, thread=_TRACK.get(), args=args)
+            )
+            logger.info(
+                "Build phase finished",
+                phase=name,
+                duration_ms=round(duration_us / 1000, 1),
+                **args,
+            )
+
+    def add_packager_spans(self, timings_path: Path) -> None:
+        """
+        Merges the `pspf-packager build --timings` report, whose spans start
+        at Unix timestamps, onto this build's timeline.
+        """
+        try:
+            reported = json.loads(timings_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read packager timings", error=str(e))
+            return
+        for entry in reported or []:
+            span = Span(
+                entry["name"],
+                entry["start_us"] - self._start_wall_us,
+                entry["duration_us"],
+                thread="pspf-packager",
+            )
+            self._record(span)
+            logger.info(
+                "Packager phase finished",
+                phase=span.name,
+                duration_ms=round(span.duration_us / 1000, 1),
+            )
+
+    def totals(self) -> dict[str, float]:
+        """Seconds spent in each phase, summed over repeated spans."""
+        totals: dict[str, float] = {}
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_us / 1e6
+        return totals
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """
+        Writes the spans in the Chrome trace event format, which
+        chrome://tracing and ui.perfetto.dev open directly.
+        """
+        threads = {"orchestrator": 1, "pspf-packager": 2}
+        for span in self.spans:
+            threads.setdefault(span.thread, len(threads) + 1)
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for name, tid in threads.items()
+        ]
+        events.extend(
+            {
+                "name": span.name,
+                "cat": "build",
+                "ph": "X",
+                "ts": span.start_us,
+                "dur": span.duration_us,
+                "pid": os.getpid(),
+                "tid": threads[span.thread],
+                "args": dict(span.args),
+            }
+            for span in sorted(self.spans, key=lambda s: s.start_us)
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
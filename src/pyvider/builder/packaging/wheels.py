@@ -0,0 +1,106 @@
+"""Parallel, cached wheel builds for local-path dependencies."""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import platform
+import shutil
+
+from pyvider.telemetry import logger
+
+from ..exceptions import BuildError
+from .cache import cache_entry, cache_subdir, hash_tree
+
+WHEEL_CACHE_DIR = "wheels"
+
+RunCommand = Callable[[list[str], Path | None], object]
+
+
+def local_dependency_dir(dependency: str, base_dir: Path) -> Path | None:
+    """
+    Returns the source tree a dependency names when it is a directory,
+    relative to `base_dir` or absolute, and None for anything else.
+    """
+    path = base_dir / dependency
+    return path.resolve() if path.is_dir() else None
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def resolve_jobs(value: object) -> int:
+    """Validates the `jobs` build setting, defaulting to the CPU count."""
+    if value is None:
+        return default_jobs()
+    if type(value) is not int or value < 1:
+        raise BuildError(f"Invalid jobs setting {value!r}; expected an integer >= 1.")
+    return value
+
+
+def _build_one(
+    source_dir: Path,
+    wheel_dir: Path,
+    exclude_patterns: Sequence[str],
+    key_inputs: Sequence[str],
+    run: RunCommand,
+) -> list[str]:
+    """Builds or reuses the wheel of one source tree, returning its file names."""
+    key = hash_tree(source_dir, exclude_patterns, extra=key_inputs)
+    with cache_entry(cache_subdir(WHEEL_CACHE_DIR), key) as (entry, staging_dir):
+        if staging_dir is None:
+            logger.info("Reusing cached wheels", source=str(source_dir), key=key[:16])
+        else:
+            logger.info("Building local wheel", source=str(source_dir), key=key[:16])
+            # Only the tree itself: the key does not cover its dependencies,
+            # which are resolved with the PyPI requirements instead.
+            wheel_cmd = ["uv", "run", "pip", "wheel", "--no-deps", str(source_dir)]
+            run([*wheel_cmd, "--wheel-dir", str(staging_dir)], staging_dir)
+            entry = staging_dir
+        names = []
+        for wheel in entry.glob("*.whl"):
+            shutil.copy2(wheel, wheel_dir / wheel.name)
+            names.append(wheel.name)
+        return names
+
+
+def build_local_wheels(
+    source_dirs: Sequence[Path],
+    wheel_dir: Path,
+    *,
+    exclude_patterns: Sequence[str],
+    key_inputs: Sequence[str],
+    jobs: int,
+    run: RunCommand,
+) -> None:
+    """
+    Builds a wheel for each local source tree into `wheel_dir`, `jobs` at a
+    time.
+
+    Wheels are cached by a hash of the source tree (minus `exclude_patterns`)
+    plus `key_inputs`, such as the target Python version, so an unchanged
+    dependency is copied from the cache instead of being rebuilt. Each
+    wheel is built without its dependencies, which the caller resolves.
+    """
+    if not source_dirs:
+        return
+    wheel_dir.mkdir(parents=True, exist_ok=True)
+    key_inputs = [*key_inputs, platform.system(), platform.machine()]
+    workers = max(1, min(jobs, len(source_dirs)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _build_one, source_dir, wheel_dir, exclude_patterns, key_inputs, run
+            )
+            for source_dir in source_dirs
+        ]
+        built: dict[str, Path] = {}
+        for source_dir, future in zip(source_dirs, futures, strict=True):
+            for name in future.result():
+                if name in built:
+                    raise BuildError(
+                        f"Local dependencies {built[name]} and {source_dir} "
+                        f"both build {name}."
+                    )
+                built[name] = source_dir
@@ -0,0 +1,138 @@
+"""Streaming, bounded-memory writer for signed PSPF packages."""
+
+from collections.abc import Iterable, Iterator
+import hashlib
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Self
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from ..crypto import sign_payload_hash
+from ..exceptions import BuildError
+from ..models import PSPF_EOF_MAGIC, SIGNED_SECTIONS, PspfFooter
+
+# Size of the reusable copy buffer; this bounds the writer's memory use.
+COPY_CHUNK_SIZE = 1024 * 1024
+
+SectionSource = bytes | Path | BinaryIO | Iterable[bytes]
+
+
+def _iter_chunks(source: SectionSource) -> Iterator[bytes | memoryview]:
+    """Yields a section's bytes in bounded chunks from any supported source."""
+    if isinstance(source, bytes | bytearray | memoryview):
+        yield source
+    elif isinstance(source, Path):
+        with source.open("rb") as f:
+            yield from _iter_chunks(f)
+    elif hasattr(source, "readinto"):
+        buffer = memoryview(bytearray(COPY_CHUNK_SIZE))
+        while n := source.readinto(buffer):
+            yield buffer[:n]
+    elif hasattr(source, "read"):
+        while chunk := source.read(COPY_CHUNK_SIZE):
+            yield chunk
+    else:
+        yield from source
+
+
+class PspfWriter:
+    """
+    Assembles a signed PSPF package by appending sections straight to disk.
+
+    Each signed section (see `models.SIGNED_SECTIONS`) is added in file
+    order from bytes, a path, a binary file object or an iterable of byte
+    chunks. The signing hash is updated as bytes are written, so no section
+    is ever held in memory. `finalize()` signs the digest, appends the
+    signature, public key, footer and EOF magic, and atomically moves the
+    package into place.
+
+        with PspfWriter(out_path, private_key) as writer:
+            writer.add_section("launcher", launcher_path)
+            ...
+            footer = writer.finalize(public_key_pem)
+    """
+
+    def __init__(self, output_path: Path, private_key: rsa.RSAPrivateKey) -> None:
+        self.output_path = output_path
+        self._private_key = private_key
+        self._partial_path = output_path.with_name(f".{output_path.name}.partial")
+        self._file: BinaryIO = self._partial_path.open("wb")
+        self._digest = hashlib.sha256()
+        self._ranges: dict[str, tuple[int, int]] = {}
+        self._offset = 0
+        self.footer: PspfFooter | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self.footer is None:
+            self._file.close()
+            self._partial_path.unlink(missing_ok=True)
+
+    def _write(self, data: bytes | memoryview) -> None:
+        self._file.write(data)
+        self._offset += len(data)
+
+    def add_section(self, name: str, source: SectionSource) -> int:
+        """Appends the next signed section and returns its size in bytes."""
+        if self.footer is not None:
+            raise BuildError("Cannot add sections to a finalized package.")
+        if len(self._ranges) == len(SIGNED_SECTIONS):
+            raise BuildError("All signed sections have already been written.")
+        expected = SIGNED_SECTIONS[len(self._ranges)]
+        if name != expected:
+            raise BuildError(
+                f"Sections must be written in order: expected '{expected}', got '{name}'."
+            )
+
+        start = self._offset
+        for chunk in _iter_chunks(source):
+            self._digest.update(chunk)
+            self._write(chunk)
+        self._ranges[name] = (start, self._offset - start)
+        return self._offset - start
+
+    def finalize(self, public_key_pem: bytes) -> PspfFooter:
+        """Signs the package, writes the trailer and moves it into place."""
+        missing = [name for name in SIGNED_SECTIONS if name not in self._ranges]
+        if missing:
+            raise BuildError(f"Missing package sections: {', '.join(missing)}.")
+
+        signature = sign_payload_hash(self._digest.digest(), self._private_key)
+        signature_offset = self._offset
+        self._write(signature)
+        public_key_offset = self._offset
+        self._write(public_key_pem)
+
+        footer = PspfFooter(
+            uv_binary_offset=self._ranges["uv"][0],
+            uv_binary_size=self._ranges["uv"][1],
+            python_install_tgz_offset=self._ranges["python_install"][0],
+            python_install_tgz_size=self._ranges["python_install"][1],
+            metadata_tgz_offset=self._ranges["metadata"][0],
+            metadata_tgz_size=self._ranges["metadata"][1],
+            payload_tgz_offset=self._ranges["payload"][0],
+            payload_tgz_size=self._ranges["payload"][1],
+            package_signature_offset=signature_offset,
+            package_signature_size=len(signature),
+            public_key_pem_offset=public_key_offset,
+            public_key_pem_size=len(public_key_pem),
+        )
+        self._write(footer.pack())
+        self._write(PSPF_EOF_MAGIC)
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._partial_path.chmod(0o755)
+        self._partial_path.replace(self.output_path)
+        self.footer = footer
+        return footer
@@ -0,0 +1,278 @@
+"""
+Inspection and garbage collection of the launcher's runtime cache.
+
+Every packaged provider extracts itself into
+`<user cache dir>/pyvider/providers/<executable name>` on first run, with
+its Python install and uv binary in the shared store at
+`<user cache dir>/pyvider/store/<section>/<sha256>`. The launcher holds a
+shared lock on `<environment>.use` while the provider runs, locks
+`<environment>.lock` during setup, and touches `.last-used` on every start.
+"""
+
+from collections.abc import Iterable
+import contextlib
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+import sys
+import time
+
+from attrs import define
+
+from .locking import file_lock
+
+PROVIDERS_DIR = "providers"
+STORE_DIR = "store"
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_STAGING_NAME = re.compile(r"\.(setup|old)-\d+$")
+
+
+@define(frozen=True, slots=True)
+class RuntimeEnvironment:
+    """One provider's extracted environment."""
+
+    path: Path
+    size: int
+    last_used: float
+    in_use: bool
+    store_entries: tuple[Path, ...]
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+@define(frozen=True, slots=True)
+class StoreEntry:
+    """A Python install or uv binary shared through the content-addressed store."""
+
+    path: Path
+    size: int
+
+    @property
+    def section(self) -> str:
+        return self.path.parent.name
+
+
+@define(frozen=True, slots=True)
+class GcReport:
+    evicted: list[RuntimeEnvironment]
+    removed_store_entries: list[StoreEntry]
+    skipped_in_use: list[RuntimeEnvironment]
+    store_locked: bool
+
+    @property
+    def freed(self) -> int:
+        return sum(e.size for e in self.evicted) + sum(
+            e.size for e in self.removed_store_entries
+        )
+
+
+def launcher_cache_dir() -> Path:
+    """Mirrors Go's `os.UserCacheDir()`, under which the launcher works."""
+    if sys.platform == "win32":
+        default = Path.home() / "AppData" / "Local"
+        base = Path(os.environ.get("LOCALAPPDATA", default))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME", "")
+        base = Path(xdg) if Path(xdg).is_absolute() else Path.home() / ".cache"
+    return base / "pyvider"
+
+
+def parse_size(value: str) -> int:
+    """Parses a byte count such as `500M`, `5G` or `1024`."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?", value.strip(), re.I)
+    if not match:
+        raise ValueError(f"Invalid size '{value}'; expected e.g. 500M or 5G.")
+    return int(float(match[1]) * _SIZE_UNITS[match[2].upper()])
+
+
+def parse_duration(value: str) -> float:
+    """Parses a duration such as `30d`, `12h` or `90m` into seconds."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([smhdw])", value.strip())
+    if not match:
+        raise ValueError(f"Invalid duration '{value}'; expected e.g. 30d or 12h.")
+    return float(match[1]) * _DURATION_UNITS[match[2]]
+
+
+def format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KB", "MB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for dir_path, _, file_names in os.walk(path):
+        for name in file_names:
+            with contextlib.suppress(OSError):
+                total += (Path(dir_path) / name).lstat().st_size
+    return total
+
+
+def _last_used(path: Path) -> float:
+    for marker in (path / ".last-used", path / ".complete", path):
+        with contextlib.suppress(OSError):
+            return marker.stat().st_mtime
+    return 0.0
+
+
+def _store_key(path: Path) -> tuple[str, str]:
+    """Identifies a store entry by section and digest, however its path is spelled."""
+    return path.parent.name, path.name
+
+
+def _store_entries_of(path: Path) -> tuple[Path, ...]:
+    try:
+        info = json.loads((path / "runtime.json").read_text())
+    except (OSError, ValueError):
+        return ()
+    return tuple(Path(entry) for entry in info.get("store", []))
+
+
+def _is_locked(lock_path: Path) -> bool:
+    if not lock_path.exists():
+        return False
+    try:
+        with file_lock(lock_path, blocking=False):
+            return False
+    except BlockingIOError:
+        return True
+
+
+def list_environments(root: Path) -> list[RuntimeEnvironment]:
+    """Returns the provider environments under `root`, least recently used first."""
+    providers = root / PROVIDERS_DIR
+    if not providers.is_dir():
+        return []
+    environments = [
+        RuntimeEnvironment(
+            path=path,
+            size=_tree_size(path),
+            last_used=_last_used(path),
+            in_use=_is_locked(path.with_name(f"{path.name}.use")),
+            store_entries=_store_entries_of(path),
+        )
+        for path in providers.iterdir()
+        # Skip the staging directories of setups in progress.
+        if path.is_dir() and not _STAGING_NAME.search(path.name)
+    ]
+    return sorted(environments, key=lambda e: e.last_used)
+
+
+def list_store_entries(root: Path) -> list[StoreEntry]:
+    store = root / STORE_DIR
+    if not store.is_dir():
+        return []
+    return [
+        StoreEntry(path=entry, size=_tree_size(entry))
+        for section in sorted(store.iterdir())
+        if section.is_dir()
+        for entry in sorted(section.iterdir())
+        if entry.is_dir() and re.fullmatch(r"[0-9a-f]{64}", entry.name)
+    ]
+
+
+def _remove_quietly(paths: Iterable[Path]) -> None:
+    for path in paths:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+def _remove_environment(env: RuntimeEnvironment) -> bool:
+    """Deletes an environment unless a provider or setup holds its locks."""
+    use_lock = env.path.with_name(f"{env.name}.use")
+    setup_lock = env.path.with_name(f"{env.name}.lock")
+    try:
+        with (
+            file_lock(use_lock, blocking=False),
+            file_lock(setup_lock, blocking=False),
+        ):
+            shutil.rmtree(env.path, ignore_errors=True)
+            # Launchers waiting on these locks notice the files are gone and
+            # lock fresh ones.
+            _remove_quietly([use_lock, setup_lock])
+    except BlockingIOError:
+        return False
+    return True
+
+
+def collect_garbage(
+    root: Path,
+    *,
+    max_size: int | None = None,
+    older_than: float | None = None,
+    dry_run: bool = False,
+    now: float | None = None,
+) -> GcReport:
+    """
+    Evicts provider environments, least recently used first, that were
+    last used more than `older_than` seconds ago or that push the cache
+    over `max_size` bytes. Environments of running providers are skipped.
+    Store entries that no remaining environment references are then
+    removed, unless a launcher is setting up an environment.
+    """
+    now = time.time() if now is None else now
+    environments = list_environments(root)
+    store = list_store_entries(root)
+    kept = list(environments)
+
+    def referenced() -> set[tuple[str, str]]:
+        return {_store_key(p) for env in kept for p in env.store_entries}
+
+    def footprint() -> int:
+        live = referenced()
+        return sum(env.size for env in kept) + sum(
+            entry.size for entry in store if _store_key(entry.path) in live
+        )
+
+    evicted: list[RuntimeEnvironment] = []
+    skipped: list[RuntimeEnvironment] = []
+    for env in environments:
+        too_old = older_than is not None and now - env.last_used > older_than
+        over_budget = max_size is not None and footprint() > max_size
+        if not (too_old or over_budget):
+            break
+        if env.in_use or (not dry_run and not _remove_environment(env)):
+            skipped.append(env)
+            continue
+        kept.remove(env)
+        evicted.append(env)
+
+    live = referenced()
+    orphans = [entry for entry in store if _store_key(entry.path) not in live]
+    store_locked = False
+    if orphans and not dry_run:
+        try:
+            with file_lock(root / f"{STORE_DIR}.lock", blocking=False):
+                for entry in orphans:
+                    _remove_quietly(
+                        [
+                            entry.path,
+                            entry.path.with_name(f"{entry.path.name}.lock"),
+                            *entry.path.parent.glob(f"{entry.path.name}.*-*"),
+                        ]
+                    )
+        except BlockingIOError:
+            store_locked = True
+            orphans = []
+    return GcReport(
+        evicted=evicted,
+        removed_store_entries=orphans,
+        skipped_in_use=skipped,
+        store_locked=store_locked,
+    )
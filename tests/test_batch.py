@@ -0,0 +1,126 @@
+"""Tests for batch packaging of several manifests."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+import pytest
+from pytest import MonkeyPatch
+
+from pyvider.builder.cli import cli
+from pyvider.builder.exceptions import BuildError
+from pyvider.builder.packaging.batch import BatchResult, expand_manifests, run_batch
+from pyvider.builder.packaging.timing import BuildTimer
+
+
+def _manifests(root: Path, *names: str) -> list[Path]:
+    paths = []
+    for name in names:
+        path = root / name / "pyproject.toml"
+        path.parent.mkdir(parents=True)
+        path.write_text("[tool.pyvider]\n")
+        paths.append(path)
+    return paths
+
+
+def test_expand_manifests_globs_and_deduplicates(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    a, b = _manifests(tmp_path, "a", "b")
+    monkeypatch.chdir(tmp_path)
+
+    assert expand_manifests(["*/pyproject.toml", "a/pyproject.toml"]) == [a, b]
+    with pytest.raises(BuildError, match="No manifest matches"):
+        expand_manifests(["missing/*.toml"])
+    with pytest.raises(BuildError, match="does not exist"):
+        expand_manifests(["c/pyproject.toml"])
+
+
+def _record_build(manifest: Path, options: object) -> BatchResult:
+    return BatchResult(manifest=manifest, duration=0.0, output=manifest.parent)
+
+
+def _crashing_build(manifest: Path, options: object) -> BatchResult:
+    if manifest.parent.name == "b":
+        raise RuntimeError("worker crashed")
+    return _record_build(manifest, options)
+
+
+def test_run_batch_keeps_manifest_order(tmp_path: Path) -> None:
+    manifests = _manifests(tmp_path, "a", "b", "c")
+
+    results = run_batch(_record_build, manifests, {}, workers=2)
+
+    assert [result.manifest for result in results] == manifests
+    assert all(result.ok for result in results)
+
+
+def test_run_batch_reports_a_crashed_worker(tmp_path: Path) -> None:
+    manifests = _manifests(tmp_path, "a", "b", "c")
+
+    results = run_batch(_crashing_build, manifests, {}, workers=2)
+
+    assert [result.manifest for result in results] == manifests
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error == "RuntimeError: worker crashed"
+
+
+def _serial_batch(
+    build: Callable[[Path, Any], BatchResult],
+    manifests: list[Path],
+    options: Any,
+    *,
+    workers: int | None,
+) -> list[BatchResult]:
+    return [build(manifest, options) for manifest in manifests]
+
+
+def test_batch_cli_reports_every_target(tmp_path: Path) -> None:
+    good, bad, crash = _manifests(tmp_path, "good", "bad", "crash")
+
+    def prepare(manifest_path: Path, options: Any) -> tuple[Any, Path, Path]:
+        orchestrator = MagicMock()
+        orchestrator.timer = BuildTimer()
+        if manifest_path == bad:
+            orchestrator.build_package.side_effect = BuildError("uv exploded")
+        elif manifest_path == crash:
+            orchestrator.build_package.side_effect = KeyError("python_install")
+        else:
+            with orchestrator.timer.span("packager"):
+                pass
+        return orchestrator, manifest_path.parent / "provider", tmp_path / "pub.key"
+
+    with (
+        patch("pyvider.builder.cli._prepare_build", side_effect=prepare),
+        patch("pyvider.builder.cli.run_batch", side_effect=_serial_batch),
+        patch("pyvider.builder.cli.ensure_go_binaries"),
+        patch("pyvider.builder.packaging.reader.PspfReader"),
+        patch("pyvider.builder.crypto.load_public_key"),
+    ):
+        result = CliRunner().invoke(
+            cli, ["package", "--manifest", str(tmp_path / "*" / "pyproject.toml")]
+        )
+
+    assert result.exit_code == 1
+    assert "Packaging 3 providers" in result.output
+    assert f"✅ {good}" in result.output
+    assert "slowest: packager" in result.output
+    assert f"❌ {bad}" in result.output
+    assert "uv exploded" in result.output
+    assert f"❌ {crash}" in result.output
+    assert "KeyError: 'python_install'" in result.output
+    assert "1 of 3 packages built and verified." in result.output
+
+
+def test_batch_rejects_a_single_output_path(tmp_path: Path) -> None:
+    a, b = _manifests(tmp_path, "a", "b")
+
+    result = CliRunner().invoke(
+        cli,
+        ["package", "--manifest", str(a), "--manifest", str(b), "--out", "x"],
+    )
+
+    assert result.exit_code != 0
+    assert "--out cannot be used with several manifests" in result.output
@@ -0,0 +1,134 @@
+"""Tests for per-phase build timing and the Chrome trace export."""
+
+import json
+from pathlib import Path
+import time
+from unittest.mock import patch
+
+from pyvider.builder.packaging.orchestrator import BuildOrchestrator
+from pyvider.builder.packaging.timing import BuildTimer
+
+
+def test_spans_are_recorded_and_totalled() -> None:
+    timer = BuildTimer()
+    for _ in range(2):
+        with timer.span("compile_bytecode", tree="payload"):
+            time.sleep(0.01)
+
+    assert [span.name for span in timer.spans] == ["compile_bytecode"] * 2
+    assert timer.spans[0].args == {"tree": "payload"}
+    assert timer.spans[1].start_us >= timer.spans[0].start_us
+    assert timer.totals()["compile_bytecode"] >= 0.02
+
+
+def test_packager_spans_are_placed_on_the_build_timeline(tmp_path: Path) -> None:
+    timer = BuildTimer()
+    now_us = time.time_ns() // 1000
+    report = tmp_path / "timings.json"
+    report.write_text(
+        json.dumps(
+            [{"name": "archive:payload", "start_us": now_us, "duration_us": 2500}]
+        )
+    )
+
+    timer.add_packager_spans(report)
+    timer.add_packager_spans(tmp_path / "missing.json")
+
+    (span,) = timer.spans
+    assert span.name == "archive:payload"
+    assert span.thread == "pspf-packager"
+    assert span.duration_us == 2500
+    assert 0 <= span.start_us < 10_000_000
+
+
+def test_chrome_trace_format(tmp_path: Path) -> None:
+    timer = BuildTimer()
+    with timer.span("local_wheels", count=2):
+        pass
+    trace_path = tmp_path / "out" / "trace.json"
+
+    timer.write_chrome_trace(trace_path)
+
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    (complete,) = [e for e in events if e["ph"] == "X"]
+    assert complete["name"] == "local_wheels"
+    assert complete["args"] == {"count": 2}
+    assert {"ts", "dur", "pid", "tid"} <= complete.keys()
+    assert {e["args"]["name"] for e in events if e["ph"] == "M"} == {
+        "orchestrator",
+        "pspf-packager",
+    }
+
+
+def test_spans_under_a_track_get_their_own_trace_thread(tmp_path: Path) -> None:
+    timer = BuildTimer()
+    with timer.track("find_python"), timer.span("find_python"):
+        pass
+    with timer.span("assemble"):
+        pass
+    trace_path = tmp_path / "trace.json"
+
+    timer.write_chrome_trace(trace_path)
+
+    assert [span.thread for span in timer.spans] == ["find_python", "orchestrator"]
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    tids = {e["args"]["name"]: e["tid"] for e in events if e["ph"] == "M"}
+    assert tids == {"orchestrator": 1, "pspf-packager": 2, "find_python": 3}
+    (find_python,) = [e for e in events if e["name"] == "find_python"]
+    assert find_python["tid"] == 3
+
+
+def test_build_records_orchestrator_and_packager_phases(tmp_path: Path) -> None:
+    python = tmp_path / "python" / "bin" / "python3"
+    python.parent.mkdir(parents=True)
+    python.write_text("#!python")
+
+    def fake_subprocess(command: list[str], cwd: Path | None = None) -> str:
+        if command[:3] == ["uv", "python", "find"]:
+            return str(python)
+        sections_dir = Path(command[command.index("--sections-dir") + 1])
+        sections_dir.mkdir(parents=True, exist_ok=True)
+        (sections_dir / "python_install.tar.zst").write_bytes(b"archived")
+        timings = Path(command[command.index("--timings") + 1])
+        spans = [
+            {"name": name, "start_us": time.time_ns() // 1000, "duration_us": 10}
+            for name in ("dependencies", "archive:python_install", "archive:payload")
+        ]
+        timings.write_text(json.dumps(spans))
+        return ""
+
+    with patch.object(
+        BuildOrchestrator, "_run_subprocess", side_effect=fake_subprocess
+    ), patch.object(BuildOrchestrator, "_assemble_package"), patch(
+        "pyvider.builder.packaging.cache._get_cache_dir",
+        return_value=tmp_path / "cache",
+    ), patch(
+        "pyvider.builder.packaging.orchestrator.shutil.which",
+        return_value="/usr/bin/uv",
+    ), patch(
+        "pyvider.builder.packaging.orchestrator.ensure_go_binary",
+        return_value=Path("/fake/pspf-packager"),
+    ):
+        orchestrator = BuildOrchestrator(
+            launcher_bin_path="/fake/launcher",
+            package_integrity_key_path=str(tmp_path / "private.key"),
+            public_key_path=str(tmp_path / "public.key"),
+            output_pspf_path=str(tmp_path / "dist" / "provider"),
+            build_config={},
+            manifest_dir=tmp_path,
+            entry_point="main:serve",
+        )
+        orchestrator.build_package()
+
+    totals = orchestrator.timer.totals()
+    for phase in (
+        "find_python",
+        "local_wheels",
+        "packager_binary",
+        "python_install_cache_key",
+        "packager",
+        "dependencies",
+        "archive:python_install",
+        "archive:payload",
+    ):
+        assert phase in totals
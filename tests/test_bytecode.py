@@ -0,0 +1,34 @@
+"""Tests for ahead-of-time bytecode compilation."""
+
+import importlib.util
+from pathlib import Path
+import subprocess
+import sys
+
+from pyvider.builder.packaging.bytecode import compile_tree, strip_bytecode_excludes
+
+
+def test_bytecode_excludes_are_stripped() -> None:
+    patterns = ["**/.venv/**", "**/__pycache__/**", "**/*.pyc", "**/*.pyo", "*.log"]
+    assert strip_bytecode_excludes(patterns) == ["**/.venv/**", "*.log"]
+
+
+def test_compile_tree_writes_unchecked_hash_pycs(tmp_path: Path) -> None:
+    package = tmp_path / "site-packages" / "pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("VALUE = 1\n")
+    (package / "mod.py").write_text("def f():\n    return 2\n")
+
+    compile_tree(
+        Path(sys.executable),
+        tmp_path / "site-packages",
+        jobs=2,
+        run=lambda cmd: subprocess.run(cmd, check=True),
+    )
+
+    for name in ("__init__", "mod"):
+        pyc = Path(importlib.util.cache_from_source(str(package / f"{name}.py")))
+        header = pyc.read_bytes()[:8]
+        assert header[:4] == importlib.util.MAGIC_NUMBER
+        # PEP 552 flags: hash-based (bit 0) without check_source (bit 1).
+        assert int.from_bytes(header[4:8], "little") == 0b01
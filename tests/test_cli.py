@@ -61,7 +61,7 @@ public_key_path = "keys/provider-public.key"
             f"Package command failed: {package_result.output}"
         )
         assert (
-            "✅ Go-based cryptographic verification successful."
+            "✅ Cryptographic verification successful."
             in package_result.output
         )
         assert output_path.exists()
@@ -57,7 +57,9 @@ def test_package_command_reads_all_config_from_pyproject(
     the BuildOrchestrator with all configuration values read from pyproject.toml.
     """
     runner = CliRunner()
-    with patch("pyvider.builder.cli.BuildOrchestrator") as MockOrchestrator:
+    with patch(
+        "pyvider.builder.packaging.orchestrator.BuildOrchestrator"
+    ) as MockOrchestrator:
         mock_instance = MockOrchestrator.return_value
         mock_instance.build_package.return_value = None
 
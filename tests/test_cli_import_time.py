@@ -0,0 +1,60 @@
+"""Import-time regression tests for the `pyvbuild` CLI."""
+
+import os
+import subprocess
+import sys
+
+# Cumulative `-X importtime` figure, which excludes interpreter startup and
+# subprocess overhead. Generous for slow CI machines; importing the
+# orchestrator alone costs more.
+IMPORT_BUDGET_US = 500_000
+
+# Only the commands that use these import them; `--help` must not pay for them.
+DEFERRED_MODULES = (
+    "pyvider.builder.packaging.orchestrator",
+    "pyvider.builder.packaging.delta",
+    "pyvider.builder.packaging.reader",
+    "pyvider.builder.crypto",
+    "pyvider.builder.runtime_cache",
+    "pyvider.schema",
+    "pyvider.telemetry",
+    "cryptography",
+    "zstandard",
+    "tarfile",
+    "multiprocessing",
+    "importlib.metadata",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Returns the cumulative import time, in µs, of every module `module` loads."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_defers_command_modules() -> None:
+    times = _import_times("pyvider.builder.cli")
+
+    loaded = [name for name in DEFERRED_MODULES if name in times]
+    assert not loaded, f"Importing the CLI loads deferred modules: {loaded}"
+
+
+def test_cli_import_time_budget() -> None:
+    times = _import_times("pyvider.builder.cli")
+
+    assert times["pyvider.builder.cli"] < IMPORT_BUDGET_US, (
+        f"Importing the CLI took {times['pyvider.builder.cli'] / 1000:.0f} ms; "
+        f"the budget is {IMPORT_BUDGET_US / 1000:.0f} ms."
+    )
@@ -1,5 +1,6 @@
 """Coverage tests for the Go compiler module."""
 
+from collections.abc import Generator
 from pathlib import Path
 import subprocess
 from typing import Any
@@ -8,6 +9,7 @@ from unittest.mock import MagicMock
 import pytest
 from pytest import MonkeyPatch
 
+from pyvider.builder import compiler
 from pyvider.builder.compiler import _find_go_source_path, ensure_go_binary
 from pyvider.builder.exceptions import BuildError
 
@@ -57,3 +59,67 @@ def test_find_go_source_path_failure(monkeypatch: MonkeyPatch) -> None:
         BuildError, match="The 'go' source directory is not a physical directory"
     ):
         _find_go_source_path()
+
+
+@pytest.fixture
+def fake_go_module(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> Generator[Path]:
+    """A minimal Go module plus a fake toolchain environment."""
+    go_root = tmp_path / "go"
+    (go_root / "pspf-launcher").mkdir(parents=True)
+    (go_root / "go.mod").write_text("module pspf-tools/go\n")
+    (go_root / "go.sum").write_text("")
+    (go_root / "pspf-launcher" / "main.go").write_text("package main\n")
+
+    monkeypatch.setattr("shutil.which", lambda cmd: f"/usr/bin/{cmd}")
+    monkeypatch.setattr(compiler, "_find_go_source_path", lambda: go_root)
+    monkeypatch.setattr(compiler, "_get_cache_dir", lambda: tmp_path / "cache")
+    monkeypatch.setattr(compiler, "_go_env", lambda: "linux\namd64\ngo1.22.5\n1\n")
+    compiler._source_cache_key.cache_clear()
+    yield go_root
+    compiler._source_cache_key.cache_clear()
+
+
+def test_cache_key_tracks_sources_and_toolchain(
+    fake_go_module: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Tests that editing a Go source or changing the toolchain changes the key."""
+    original = compiler._source_cache_key(fake_go_module)
+
+    (fake_go_module / "pspf-launcher" / "main.go").write_text("package main // v2\n")
+    compiler._source_cache_key.cache_clear()
+    edited = compiler._source_cache_key(fake_go_module)
+    assert edited != original
+
+    monkeypatch.setattr(compiler, "_go_env", lambda: "darwin\narm64\ngo1.22.5\n1\n")
+    compiler._source_cache_key.cache_clear()
+    assert compiler._source_cache_key(fake_go_module) not in (original, edited)
+
+
+def test_ensure_go_binaries_compiles_each_tool_once(
+    fake_go_module: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Tests that tools compile into the keyed cache once, via an atomic rename."""
+    build_outputs: list[str] = []
+
+    def mock_go_build(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        output = cmd[cmd.index("-o") + 1]
+        assert ".partial" in output
+        Path(output).write_text("binary")
+        build_outputs.append(output)
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr("subprocess.run", mock_go_build)
+
+    paths = compiler.ensure_go_binaries("pspf-launcher", "pspf-packager")
+    assert len(build_outputs) == 2
+    assert paths["pspf-launcher"].read_text() == "binary"
+    assert paths["pspf-launcher"].parent == paths["pspf-packager"].parent
+    assert paths["pspf-launcher"].parent.name == compiler._source_cache_key(
+        fake_go_module
+    )
+    assert not list(paths["pspf-launcher"].parent.glob("*.partial"))
+
+    assert compiler.ensure_go_binary("pspf-launcher") == paths["pspf-launcher"]
+    assert len(build_outputs) == 2
@@ -0,0 +1,50 @@
+"""Tests for resolving per-section zstd compression settings."""
+
+import pytest
+
+from pyvider.builder.exceptions import BuildError
+from pyvider.builder.packaging.compression import (
+    SectionCompression,
+    resolve_compression,
+)
+
+
+def test_defaults_apply_to_every_section() -> None:
+    settings = resolve_compression({})
+    assert set(settings) == {"python_install", "metadata", "payload"}
+    assert all(s == SectionCompression(level=3, threads=1) for s in settings.values())
+
+
+def test_table_section_and_cli_precedence() -> None:
+    config = {"level": 19, "threads": 4, "payload": {"level": 9}}
+
+    settings = resolve_compression(config)
+    assert settings["python_install"] == SectionCompression(level=19, threads=4)
+    assert settings["payload"] == SectionCompression(level=9, threads=4)
+
+    dev = resolve_compression(config, level=1, threads=0)
+    assert all(s == SectionCompression(level=1, threads=0) for s in dev.values())
+
+    overridden = resolve_compression(
+        config, level=1, overrides=["python_install:22", "metadata:2:1"]
+    )
+    assert overridden["python_install"] == SectionCompression(level=22, threads=4)
+    assert overridden["metadata"] == SectionCompression(level=2, threads=1)
+    assert overridden["payload"].flag("payload") == "payload:1:4"
+
+
+@pytest.mark.parametrize(
+    ("config", "overrides"),
+    [
+        ({"level": 0}, []),
+        ({"payload": {"threads": -1}}, []),
+        ({"launcher": {"level": 3}}, []),
+        ({"level": "max"}, []),
+        ({}, ["payload"]),
+        ({}, ["uv:3"]),
+        ({}, ["payload:fast"]),
+    ],
+)
+def test_invalid_settings_are_rejected(config: dict, overrides: list[str]) -> None:
+    with pytest.raises(BuildError):
+        resolve_compression(config, overrides=overrides)
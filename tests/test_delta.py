@@ -0,0 +1,208 @@
+"""Tests for binary deltas between PSPF package versions."""
+
+import json
+import os
+from pathlib import Path
+import struct
+
+from click.testing import CliRunner
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+import pytest
+
+from pyvider.builder.cli import cli
+from pyvider.builder.crypto import generate_keys
+from pyvider.builder.exceptions import SignatureVerificationError, VerificationError
+from pyvider.builder.packaging.delta import (
+    DELTA_MAGIC,
+    DELTA_MAX_CHUNK,
+    apply_delta,
+    create_delta,
+)
+from pyvider.builder.packaging.writer import PspfWriter
+
+PYTHON_INSTALL = os.urandom(3 * DELTA_MAX_CHUNK + 123)
+
+
+def _package(
+    path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key_pem: bytes,
+    *,
+    launcher: bytes = b"launcher" * 100,
+    payload: bytes = b"payload-v1",
+) -> Path:
+    with PspfWriter(path, private_key) as writer:
+        writer.add_section("launcher", launcher)
+        writer.add_section("uv", b"uv" * 1000)
+        writer.add_section("python_install", PYTHON_INSTALL)
+        writer.add_section("metadata", b"metadata")
+        writer.add_section("payload", payload)
+        writer.finalize(public_key_pem)
+    return path
+
+
+def test_delta_reuses_unchanged_sections_and_round_trips(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key: rsa.RSAPublicKey,
+    public_key_pem: bytes,
+) -> None:
+    # A longer launcher shifts every later section to a new offset.
+    old = _package(tmp_path / "old", private_key, public_key_pem)
+    new = _package(
+        tmp_path / "new",
+        private_key,
+        public_key_pem,
+        launcher=b"launcher" * 101,
+        payload=b"payload-v2" * 10,
+    )
+    delta = tmp_path / "patch"
+
+    stats = create_delta(old, new, delta)
+
+    assert {"uv", "python_install", "metadata", "public_key"} <= set(
+        stats.reused_sections
+    )
+    assert "payload" not in stats.reused_sections
+    assert stats.delta_size < len(PYTHON_INSTALL)
+
+    rebuilt = tmp_path / "rebuilt"
+    apply_delta(old, delta, rebuilt, public_key)
+    assert rebuilt.read_bytes() == new.read_bytes()
+    assert rebuilt.stat().st_mode & 0o111
+
+
+def test_changed_section_copies_matching_chunks(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    shared = os.urandom(16 * DELTA_MAX_CHUNK)
+    old = _package(tmp_path / "old", private_key, public_key_pem, payload=shared)
+    new = _package(
+        tmp_path / "new", private_key, public_key_pem, payload=shared + b"tail"
+    )
+
+    stats = create_delta(old, new, tmp_path / "patch")
+
+    assert "payload" not in stats.reused_sections
+    assert stats.literal < DELTA_MAX_CHUNK + 1024
+
+
+def test_changed_section_copies_chunks_shifted_by_an_insertion(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key: rsa.RSAPublicKey,
+    public_key_pem: bytes,
+) -> None:
+    # Eight inserted bytes misalign everything after them in the payload.
+    head, tail = os.urandom(8 * DELTA_MAX_CHUNK), os.urandom(8 * DELTA_MAX_CHUNK)
+    old = _package(tmp_path / "old", private_key, public_key_pem, payload=head + tail)
+    new = _package(
+        tmp_path / "new",
+        private_key,
+        public_key_pem,
+        payload=head + b"inserted" + tail,
+    )
+    delta = tmp_path / "patch"
+
+    stats = create_delta(old, new, delta)
+
+    assert stats.literal < 2 * DELTA_MAX_CHUNK + 1024
+    rebuilt = tmp_path / "rebuilt"
+    apply_delta(old, delta, rebuilt, public_key)
+    assert rebuilt.read_bytes() == new.read_bytes()
+
+
+def test_apply_rejects_the_wrong_base_package(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    old = _package(tmp_path / "old", private_key, public_key_pem)
+    new = _package(tmp_path / "new", private_key, public_key_pem, payload=b"v2")
+    other = _package(tmp_path / "other", private_key, public_key_pem, payload=b"v3")
+    create_delta(old, new, tmp_path / "patch")
+
+    with pytest.raises(VerificationError, match="not the package"):
+        apply_delta(other, tmp_path / "patch", tmp_path / "rebuilt")
+    assert not list(tmp_path.glob("*rebuilt*"))
+
+
+def test_apply_verifies_the_signature_against_a_trusted_key(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    old = _package(tmp_path / "old", private_key, public_key_pem)
+    new = _package(tmp_path / "new", private_key, public_key_pem, payload=b"v2")
+    create_delta(old, new, tmp_path / "patch")
+    _, untrusted = generate_keys()
+
+    with pytest.raises(SignatureVerificationError):
+        apply_delta(old, tmp_path / "patch", tmp_path / "rebuilt", untrusted)
+    assert not list(tmp_path.glob("*rebuilt*"))
+
+
+def test_apply_defaults_to_the_old_package_key(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    # A new package signed by another key verifies against the key it embeds,
+    # but not against the key of the package it claims to upgrade.
+    old = _package(tmp_path / "old", private_key, public_key_pem)
+    other_private, other_public = generate_keys()
+    other_pem = other_public.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    new = _package(tmp_path / "new", other_private, other_pem, payload=b"v2")
+    create_delta(old, new, tmp_path / "patch")
+
+    with pytest.raises(SignatureVerificationError):
+        apply_delta(old, tmp_path / "patch", tmp_path / "rebuilt")
+    assert not list(tmp_path.glob("*rebuilt*"))
+
+    apply_delta(old, tmp_path / "patch", tmp_path / "rebuilt", other_public)
+    assert (tmp_path / "rebuilt").read_bytes() == new.read_bytes()
+
+
+@pytest.mark.parametrize(
+    ("header", "match"),
+    [
+        ([], "not a JSON object"),
+        ({"old_sha256": "0", "ops": []}, "missing or invalid new_sha256"),
+        ({"old_sha256": "0", "new_sha256": "0", "ops": {}}, "invalid ops"),
+        ({"old_sha256": "0", "new_sha256": "0", "ops": [["copy", 0]]}, "operation"),
+        ({"old_sha256": "0", "new_sha256": "0", "ops": [["move", 0]]}, "operation"),
+    ],
+)
+def test_apply_rejects_a_malformed_header(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key_pem: bytes,
+    header: object,
+    match: str,
+) -> None:
+    old = _package(tmp_path / "old", private_key, public_key_pem)
+    header_bytes = json.dumps(header).encode()
+    patch = tmp_path / "patch"
+    patch.write_bytes(DELTA_MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes)
+
+    with pytest.raises(VerificationError, match=match):
+        apply_delta(old, patch, tmp_path / "rebuilt")
+    assert not list(tmp_path.glob("*rebuilt*"))
+
+
+def test_delta_cli_round_trip(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    old = _package(tmp_path / "old", private_key, public_key_pem)
+    new = _package(tmp_path / "new", private_key, public_key_pem, payload=b"v2")
+    runner = CliRunner()
+
+    patch, rebuilt = tmp_path / "patch", tmp_path / "rebuilt"
+
+    created = runner.invoke(cli, ["delta", str(old), str(new), "-o", str(patch)])
+    assert created.exit_code == 0, created.output
+    assert "Reused sections: launcher, uv, python_install" in created.output
+
+    applied = runner.invoke(
+        cli, ["apply-delta", str(old), str(patch), "-o", str(rebuilt)]
+    )
+    assert applied.exit_code == 0, applied.output
+    assert rebuilt.read_bytes() == new.read_bytes()
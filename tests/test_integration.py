@@ -84,7 +84,7 @@ public_key_path = "{public_key_path.relative_to(td)}"
             f"Package command failed: {package_result.output}"
         )
         assert (
-            "✅ Go-based cryptographic verification successful."
+            "✅ Cryptographic verification successful."
             in package_result.output
         )
         assert output_path.exists()
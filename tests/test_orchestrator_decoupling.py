@@ -1,5 +1,5 @@
 """
-TDD tests for the BuildOrchestrator to ensure it correctly passes dependencies
+TDD tests for the BuildOrchestrator to ensure it correctly hands dependencies
 to the Go builder CLI.
 """
 
@@ -8,12 +8,42 @@ from unittest.mock import patch, call
 
 from pyvider.builder.packaging.orchestrator import BuildOrchestrator
 
+payload_contents: list[str] = []
 
-def test_orchestrator_passes_dependencies_as_flags(tmp_path: Path):
+
+def _fake_subprocess(command: list[str], cwd: Path | None = None) -> str:
+    """Answers `uv python find` and writes the files pip and the packager would."""
+    if command[:3] == ["uv", "python", "find"]:
+        return "/path/to/python/install/bin/python"
+    if command[:4] == ["uv", "run", "pip", "download"]:
+        dest = Path(command[command.index("--dest") + 1])
+        dest.mkdir(parents=True)
+        (dest / "attrs-23.1.0-py3-none-any.whl").write_text("wheel")
+        return ""
+    if "--payload-dir" in command:
+        payload_dir = Path(command[command.index("--payload-dir") + 1])
+        payload_contents.extend(sorted(p.name for p in payload_dir.iterdir()))
+    if "--python-install-dir" in command:
+        sections_dir = Path(command[command.index("--sections-dir") + 1])
+        sections_dir.mkdir(parents=True, exist_ok=True)
+        (sections_dir / "python_install.tar.zst").write_bytes(b"python")
+    return ""
+
+
+def _fake_build_local_wheels(
+    source_dirs: list[Path], wheel_dir: Path, **kwargs: object
+) -> None:
+    wheel_dir.mkdir(parents=True, exist_ok=True)
+    for source_dir in source_dirs:
+        (wheel_dir / f"{source_dir.name}-0.1-py3-none-any.whl").write_text("wheel")
+
+
+def test_orchestrator_hands_dependencies_to_packager_as_payload(tmp_path: Path) -> None:
     """
-    TDD Contract: Verifies that the BuildOrchestrator constructs the correct
-    `--dependency` flags for the Go builder subprocess call.
+    TDD Contract: Verifies that the BuildOrchestrator downloads PyPI wheels
+    itself and hands them to the Go builder in the payload directory.
     """
+    payload_contents.clear()
     manifest_dir = tmp_path
     (manifest_dir / "src" / "local_pkg").mkdir(parents=True)
 
@@ -26,9 +56,24 @@ def test_orchestrator_passes_dependencies_as_flags(tmp_path: Path):
 
     output_path = tmp_path / "dist" / "provider"
 
-    with patch("pyvider.builder.packaging.orchestrator.BuildOrchestrator._run_subprocess") as mock_run:
-        # Configure the mock to return a dummy path for the first call (uv python find)
-        mock_run.return_value = "/path/to/python/install/bin/python"
+    with patch(
+        "pyvider.builder.packaging.orchestrator.BuildOrchestrator._run_subprocess"
+    ) as mock_run, patch(
+        "pyvider.builder.packaging.orchestrator.BuildOrchestrator._assemble_package"
+    ) as mock_assemble, patch(
+        "pyvider.builder.packaging.orchestrator.build_local_wheels"
+    ) as mock_build_wheels, patch(
+        "pyvider.builder.packaging.cache._get_cache_dir",
+        return_value=tmp_path / "cache",
+    ), patch(
+        "pyvider.builder.packaging.orchestrator.shutil.which",
+        return_value="/usr/bin/uv",
+    ), patch(
+        "pyvider.builder.packaging.orchestrator.ensure_go_binary",
+        return_value=Path("/fake/pspf-packager"),
+    ):
+        mock_run.side_effect = _fake_subprocess
+        mock_build_wheels.side_effect = _fake_build_local_wheels
 
         orchestrator = BuildOrchestrator(
             launcher_bin_path="/fake/launcher",
@@ -43,16 +88,37 @@ def test_orchestrator_passes_dependencies_as_flags(tmp_path: Path):
 
         orchestrator.build_package()
 
-        # Assert that the mock was called twice
-        assert mock_run.call_count == 2
+        # Python discovery, the PyPI download and the Go packager.
+        assert mock_run.call_count == 3
+        commands = [c.args[0] for c in mock_run.call_args_list]
+        assert ["uv", "python", "find", "3.13"] in commands
+        download = next(c for c in commands if "download" in c)
+        assert download[-1] == "attrs>=23.1.0"
+        # The local wheel is handed to pip so its requirements are resolved.
+        assert download[-2].endswith("local_pkg-0.1-py3-none-any.whl")
 
-        # Assert the first call was to find python
-        first_call_args = mock_run.call_args_list[0].args[0]
-        assert first_call_args == ["uv", "python", "find", "3.13"]
-
-        # Assert the second call was to the Go packager with the correct args
-        second_call_args = mock_run.call_args_list[1].args[0]
+        # The Go packager runs last, with the downloaded wheels as payload.
+        second_call_args = commands[-1]
         assert second_call_args[0].endswith("pspf-packager")
-        assert "--dependency" in second_call_args
-        assert "attrs>=23.1.0" in second_call_args
-        assert str((manifest_dir / "src/local_pkg").resolve()) in second_call_args
+        assert "--dependency" not in second_call_args
+        assert "attrs>=23.1.0" not in second_call_args
+        assert "--sections-dir" in second_call_args
+        assert "payload:3:1" in second_call_args
+        assert payload_contents == [
+            "attrs-23.1.0-py3-none-any.whl",
+            "local_pkg-0.1-py3-none-any.whl",
+        ]
+
+        # Local paths are built into wheels by the orchestrator and handed to
+        # the Go builder as payload, not as `--dependency` flags.
+        local_pkg = (manifest_dir / "src/local_pkg").resolve()
+        assert str(local_pkg) not in second_call_args
+        mock_build_wheels.assert_called_once()
+        assert mock_build_wheels.call_args.args[0] == [local_pkg]
+        wheel_dir = mock_build_wheels.call_args.args[1]
+        assert second_call_args[second_call_args.index("--payload-dir") + 1] == str(
+            wheel_dir
+        )
+
+        # The Python side assembles and signs the sections the packager wrote.
+        mock_assemble.assert_called_once()
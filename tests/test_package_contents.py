@@ -0,0 +1,158 @@
+"""Tests for listing and reading single files from package sections."""
+
+import hashlib
+import io
+import json
+from pathlib import Path
+import tarfile
+from typing import Any
+
+from click.testing import CliRunner
+from cryptography.hazmat.primitives.asymmetric import rsa
+import pytest
+import zstandard
+
+from pyvider.builder.cli import cli
+from pyvider.builder.packaging.reader import PspfReader
+from pyvider.builder.packaging.writer import PspfWriter
+
+FRAME_SIZE = 4096
+FILES = {
+    "pkg-1.0-py3-none-any.whl": bytes(range(256)) * 40,
+    "pkg/__init__.py": b"VERSION = 1\n",
+    "pkg/data.bin": b"\x00\x01" * 9000,
+}
+
+
+def _tar(files: dict[str, bytes]) -> tuple[bytes, list[dict[str, object]]]:
+    """Returns a tar of `files` and its member index."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer) as tar:
+        members = [
+            {
+                "path": info.name,
+                "type": "file",
+                "size": info.size,
+                "mode": info.mode,
+                "sha256": hashlib.sha256(files[info.name]).hexdigest(),
+                "offset": info.offset,
+            }
+            for info in tar
+        ]
+    return buffer.getvalue(), members
+
+
+def _frames(data: bytes) -> bytes:
+    """Compresses `data` as independent frames, like a multi-threaded section."""
+    compressor = zstandard.ZstdCompressor()
+    return b"".join(
+        compressor.compress(data[start : start + FRAME_SIZE])
+        for start in range(0, len(data), FRAME_SIZE)
+    )
+
+
+def _package(
+    path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key_pem: bytes,
+    *,
+    indexed: bool = True,
+) -> Path:
+    payload, members = _tar(FILES)
+    metadata_files = {"config.json": b'{"entry_point": "pkg:serve"}'}
+    if indexed:
+        index = {"version": 1, "sections": {"payload": members}}
+        metadata_files["index.json"] = json.dumps(index).encode()
+    metadata, _ = _tar(metadata_files)
+    with PspfWriter(path, private_key) as writer:
+        writer.add_section("launcher", b"launcher")
+        writer.add_section("uv", b"uv")
+        writer.add_section("python_install", zstandard.ZstdCompressor().compress(b""))
+        writer.add_section("metadata", zstandard.ZstdCompressor().compress(metadata))
+        writer.add_section("payload", _frames(payload))
+        writer.finalize(public_key_pem)
+    return path
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_open_member_reads_one_file(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key_pem: bytes,
+    indexed: bool,
+) -> None:
+    package = _package(
+        tmp_path / "provider", private_key, public_key_pem, indexed=indexed
+    )
+    with PspfReader(package) as reader:
+        assert [m.path for m in reader.members("payload")] == list(FILES)
+        for name, data in FILES.items():
+            with reader.open_member("payload", name) as member:
+                assert member.read() == data
+        with (
+            pytest.raises(FileNotFoundError, match=r"missing\.py"),
+            reader.open_member("payload", "missing.py"),
+        ):
+            pass
+
+
+def test_open_member_skips_earlier_frames(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key_pem: bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that the index lets reads start at the frame holding the file."""
+    package = _package(tmp_path / "provider", private_key, public_key_pem)
+    sources: list[int] = []
+    original = zstandard.ZstdDecompressor.stream_reader
+
+    def stream_reader(
+        self: zstandard.ZstdDecompressor, source: Any, **kwargs: Any
+    ) -> zstandard.ZstdDecompressionReader:
+        sources.append(len(source._view))
+        return original(self, source, **kwargs)
+
+    monkeypatch.setattr(zstandard.ZstdDecompressor, "stream_reader", stream_reader)
+    with PspfReader(package) as reader:
+        payload_size = len(reader.section("payload"))
+        with reader.open_member("payload", "pkg/data.bin") as member:
+            assert member.read() == FILES["pkg/data.bin"]
+
+    # Metadata is read for the index, then the payload from a later frame.
+    assert sources[-1] < payload_size
+
+
+def test_ls_and_cat_cli(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    package = str(_package(tmp_path / "provider", private_key, public_key_pem))
+    runner = CliRunner()
+
+    listed = runner.invoke(cli, ["ls", package])
+    assert listed.exit_code == 0, listed.output
+    assert listed.output.splitlines() == list(FILES)
+
+    long_listing = runner.invoke(cli, ["ls", package, "--section", "metadata", "-l"])
+    assert long_listing.exit_code == 0, long_listing.output
+    assert "rw-r--r--" in long_listing.output
+    assert "config.json" in long_listing.output
+
+    config = runner.invoke(cli, ["cat", package, "config.json"])
+    assert config.exit_code == 0, config.output
+    assert json.loads(config.stdout_bytes) == {"entry_point": "pkg:serve"}
+
+    wheel = runner.invoke(cli, ["cat", package, "pkg-1.0-py3-none-any.whl"])
+    assert wheel.exit_code == 0
+    assert wheel.stdout_bytes == FILES["pkg-1.0-py3-none-any.whl"]
+
+    missing = runner.invoke(cli, ["cat", package, "nope.txt"])
+    assert missing.exit_code != 0
+    assert "nope.txt" in missing.output
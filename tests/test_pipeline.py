@@ -0,0 +1,180 @@
+"""Tests for the concurrent build step pipeline."""
+
+import asyncio
+from collections.abc import Mapping
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from pyvider.builder.exceptions import BuildError
+from pyvider.builder.packaging.orchestrator import BuildOrchestrator
+from pyvider.builder.packaging.pipeline import BuildPipeline
+
+
+def _orchestrator(tmp_path: Path, build_config: dict[str, Any]) -> BuildOrchestrator:
+    return BuildOrchestrator(
+        launcher_bin_path="/fake/launcher",
+        package_integrity_key_path=str(tmp_path / "private.key"),
+        public_key_path=str(tmp_path / "public.key"),
+        output_pspf_path=str(tmp_path / "dist" / "provider"),
+        build_config=build_config,
+        manifest_dir=tmp_path,
+        entry_point="main:serve",
+    )
+
+
+def test_independent_steps_overlap() -> None:
+    events: list[str] = []
+    both_started = asyncio.Event()
+    pipeline = BuildPipeline()
+
+    async def slow(name: str) -> str:
+        events.append(f"start:{name}")
+        if len(events) == 2:
+            both_started.set()
+        # Times out unless the other independent step is running too.
+        await asyncio.wait_for(both_started.wait(), timeout=5)
+        events.append(f"end:{name}")
+        return name
+
+    async def last(results: Mapping[str, Any]) -> list[str]:
+        events.append("last")
+        return [results["a"], results["b"]]
+
+    pipeline.add("a", lambda _: slow("a"))
+    pipeline.add("b", lambda _: slow("b"))
+    pipeline.add("last", last, after=["a", "b"])
+
+    results = asyncio.run(pipeline.run())
+
+    assert results["last"] == ["a", "b"]
+    assert events[:2] == ["start:a", "start:b"]
+    assert events[-1] == "last"
+    assert pipeline.order()[-1] == "last"
+
+
+def test_failure_cancels_running_steps() -> None:
+    cancelled: list[str] = []
+    pipeline = BuildPipeline()
+
+    async def hangs(results: Mapping[str, Any]) -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append("hangs")
+            raise
+
+    async def fails(results: Mapping[str, Any]) -> None:
+        raise BuildError("uv exploded")
+
+    async def never(results: Mapping[str, Any]) -> None:
+        raise AssertionError("ran after a failed step")
+
+    pipeline.add("hangs", hangs)
+    pipeline.add("fails", fails)
+    pipeline.add("never", never, after=["fails"])
+
+    with pytest.raises(BuildError, match="uv exploded"):
+        asyncio.run(pipeline.run())
+    assert cancelled == ["hangs"]
+
+
+def test_invalid_graphs_are_rejected() -> None:
+    async def step(results: Mapping[str, Any]) -> None:
+        pass
+
+    pipeline = BuildPipeline()
+    pipeline.add("a", step, after=["missing"])
+    with pytest.raises(BuildError, match="unknown steps: missing"):
+        asyncio.run(pipeline.run())
+
+    pipeline = BuildPipeline()
+    pipeline.add("a", step, after=["b"])
+    pipeline.add("b", step, after=["a"])
+    with pytest.raises(BuildError, match="cycle"):
+        pipeline.order()
+
+    with pytest.raises(BuildError, match="defined twice"):
+        pipeline.add("a", step)
+
+
+def test_build_graph_runs_independent_steps_together(tmp_path: Path) -> None:
+    (tmp_path / "src" / "local_pkg").mkdir(parents=True)
+    build_config = {"dependencies": ["./src/local_pkg", "attrs>=23.1.0"]}
+    with patch(
+        "pyvider.builder.packaging.orchestrator.shutil.which",
+        return_value="/usr/bin/uv",
+    ):
+        graph = _orchestrator(tmp_path, build_config).plan_build(tmp_path).graph()
+
+    for step in ("find_python", "packager_binary", "local_wheels"):
+        assert graph[step] == ()
+        assert step in graph["packager"]
+    # pip resolves the local wheels' requirements with the PyPI ones.
+    assert graph["remote_wheels"] == ("local_wheels",)
+    assert graph["python_install_cache_key"] == ("find_python",)
+    assert graph["assemble"] == ("packager",)
+
+    with patch(
+        "pyvider.builder.packaging.orchestrator.shutil.which",
+        return_value="/usr/bin/uv",
+    ):
+        orchestrator = _orchestrator(
+            tmp_path, {**build_config, "install_mode": "site-packages"}
+        )
+        graph = orchestrator.plan_build(tmp_path).graph()
+
+    # Site-packages mode installs PyPI requirements itself.
+    assert "remote_wheels" not in graph
+    assert set(graph["site_packages_install"]) == {"find_python", "local_wheels"}
+
+
+def test_unprefixed_local_dirs_are_built_not_downloaded(tmp_path: Path) -> None:
+    local_pkg = tmp_path / "src" / "local_pkg"
+    local_pkg.mkdir(parents=True)
+    wheel = tmp_path / "vendor" / "pkg-1.0-py3-none-any.whl"
+    wheel.parent.mkdir()
+    wheel.write_text("wheel")
+    build_config = {"dependencies": ["src/local_pkg", "vendor/" + wheel.name]}
+    orchestrator = _orchestrator(tmp_path, build_config)
+
+    assert orchestrator._split_dependencies() == ([local_pkg], [str(wheel)])
+
+    orchestrator = _orchestrator(tmp_path, {"dependencies": ["src/local_pkg"]})
+    with patch(
+        "pyvider.builder.packaging.orchestrator.shutil.which",
+        return_value="/usr/bin/uv",
+    ):
+        graph = orchestrator.plan_build(tmp_path).graph()
+    assert graph["remote_wheels"] == ("local_wheels",)
+
+
+def test_subprocess_output_is_streamed_and_reported(tmp_path: Path) -> None:
+    orchestrator = _orchestrator(tmp_path, {})
+    script = (
+        "import sys\n"
+        "print('first'); print('second', flush=True)\n"
+        "for i in range(300): print(f'warning {i}', file=sys.stderr)\n"
+        "sys.exit(int(sys.argv[1]))\n"
+    )
+    streamed: list[tuple[str, str]] = []
+
+    def debug(message: str, **fields: Any) -> None:
+        streamed.append((fields["stream"], fields["line"]))
+
+    with patch("pyvider.builder.packaging.orchestrator.logger.debug", debug):
+        output = orchestrator._run_blocking([sys.executable, "-c", script, "0"])
+        with pytest.raises(BuildError) as excinfo:
+            orchestrator._run_blocking([sys.executable, "-c", script, "3"])
+
+    assert output == "first\nsecond"
+    assert ("stdout", "second") in streamed
+    assert ("stderr", "warning 299") in streamed
+    message = str(excinfo.value)
+    assert "exit code 3" in message
+    # Only the tail of a long stderr is kept for the error.
+    assert "warning 299" in message
+    assert "warning 99\n" not in message
@@ -0,0 +1,124 @@
+"""Tests for the persistent Python install section cache and archive pass-through."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from pyvider.builder.exceptions import BuildError
+from pyvider.builder.packaging.orchestrator import BuildOrchestrator
+from pyvider.builder.packaging.python_install import (
+    ZSTD_FRAME_MAGIC,
+    python_install_cache_key,
+)
+
+
+@pytest.fixture
+def python_install(tmp_path: Path) -> Path:
+    install_dir = tmp_path / "python"
+    (install_dir / "bin").mkdir(parents=True)
+    (install_dir / "bin" / "python3").write_text("#!python")
+    (install_dir / "lib").mkdir()
+    (install_dir / "lib" / "os.py").write_text("# os")
+    return install_dir
+
+
+def _run_builds(
+    tmp_path: Path, python_install: Path, build_config: dict[str, Any], count: int
+) -> tuple[list[list[str]], list[Path]]:
+    """Runs `count` builds, returning the packager calls and embedded sections."""
+    packager_calls: list[list[str]] = []
+
+    def fake_subprocess(command: list[str], cwd: Path | None = None) -> str:
+        if command[:3] == ["uv", "python", "find"]:
+            return str(python_install / "bin" / "python3")
+        packager_calls.append(command)
+        if "--python-install-dir" in command:
+            sections_dir = Path(command[command.index("--sections-dir") + 1])
+            sections_dir.mkdir(parents=True, exist_ok=True)
+            (sections_dir / "python_install.tar.zst").write_bytes(b"archived")
+            (sections_dir / "python_install.index.json").write_text("[]")
+        return ""
+
+    with patch.object(
+        BuildOrchestrator, "_run_subprocess", side_effect=fake_subprocess
+    ), patch.object(BuildOrchestrator, "_assemble_package") as mock_assemble, patch(
+        "pyvider.builder.packaging.cache._get_cache_dir",
+        return_value=tmp_path / "cache",
+    ), patch(
+        "pyvider.builder.packaging.orchestrator.shutil.which",
+        return_value="/usr/bin/uv",
+    ), patch(
+        "pyvider.builder.packaging.orchestrator.ensure_go_binary",
+        return_value=Path("/fake/pspf-packager"),
+    ):
+        for _ in range(count):
+            BuildOrchestrator(
+                launcher_bin_path="/fake/launcher",
+                package_integrity_key_path=str(tmp_path / "private.key"),
+                public_key_path=str(tmp_path / "public.key"),
+                output_pspf_path=str(tmp_path / "dist" / "provider"),
+                build_config=build_config,
+                manifest_dir=tmp_path,
+                entry_point="main:serve",
+            ).build_package()
+
+    sections = [c.args[2] for c in mock_assemble.call_args_list]
+    return packager_calls, sections
+
+
+def test_python_install_section_is_archived_once(
+    tmp_path: Path, python_install: Path
+) -> None:
+    calls, sections = _run_builds(tmp_path, python_install, {}, count=2)
+
+    assert "--python-install-dir" in calls[0]
+    assert "--python-install-dir" not in calls[1]
+    assert sections[0] == sections[1]
+    assert sections[1].read_bytes() == b"archived"
+    # The cached section's member index goes back to the packager's metadata.
+    index_path = calls[1][calls[1].index("--python-install-index") + 1]
+    assert Path(index_path) == sections[1].with_name("python_install.index.json")
+
+
+def test_cache_key_tracks_install_tree(tmp_path: Path, python_install: Path) -> None:
+    exe = python_install / "bin" / "python3"
+    zstd = "python_install:3:1"
+    key = python_install_cache_key(exe, "3.13", python_install, [], zstd)
+
+    assert python_install_cache_key(exe, "3.12", python_install, [], zstd) != key
+    assert python_install_cache_key(exe, "3.13", python_install, ["*.pyc"], zstd) != key
+    assert (
+        python_install_cache_key(exe, "3.13", python_install, [], "python_install:19:1")
+        != key
+    )
+
+    (python_install / "lib" / "os.py").write_text("# patched os module")
+    assert python_install_cache_key(exe, "3.13", python_install, [], zstd) != key
+
+
+def test_prebuilt_python_archive_is_passed_through(
+    tmp_path: Path, python_install: Path
+) -> None:
+    archive = tmp_path / "cpython-3.13-install_only.tar.zst"
+    archive.write_bytes(ZSTD_FRAME_MAGIC + b"frames")
+
+    calls, sections = _run_builds(
+        tmp_path, python_install, {"python_install_archive": archive.name}, count=1
+    )
+
+    assert sections == [archive]
+    assert "--python-install-dir" not in calls[0]
+
+
+def test_prebuilt_python_archive_must_be_zstd(
+    tmp_path: Path, python_install: Path
+) -> None:
+    archive = tmp_path / "cpython.tar.gz"
+    archive.write_bytes(b"\x1f\x8b gzip")
+
+    with pytest.raises(BuildError, match="not zstd-compressed"):
+        _run_builds(
+            tmp_path, python_install, {"python_install_archive": archive.name}, count=1
+        )
@@ -1,10 +1,22 @@
 """Tests for the PSPF reader."""
 
+import hashlib
+import io
+import json
 from pathlib import Path
+import tarfile
 
+from cryptography.hazmat.primitives.asymmetric import rsa
 import pytest
+import zstandard
 
-from pyvider.builder.exceptions import InvalidFooterError
+from pyvider.builder.crypto import generate_keys, sign_payload_hash
+from pyvider.builder.exceptions import (
+    InvalidFooterError,
+    SignatureVerificationError,
+    VerificationError,
+)
+from pyvider.builder.models import PSPF_EOF_MAGIC, ArchiveMember, PspfFooter
 from pyvider.builder.packaging.reader import PspfReader
 
 
@@ -20,3 +32,255 @@ def test_reader_invalid_eof_magic(tmp_path: Path) -> None:
     bad_file.write_bytes(b"this is not a valid file")
     with pytest.raises(InvalidFooterError, match="Invalid PSPF EOF Magic"):
         PspfReader(bad_file)
+
+
+def _write_signed_package(
+    path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key_pem: bytes,
+    payload: bytes = b"payload",
+    metadata: bytes = b"metadata",
+) -> None:
+    """Assembles a minimal PSPF package the same way the Go packager does."""
+    sections = [b"launcher" * 10, b"uv", b"python" * 1000, metadata, payload]
+    offsets = []
+    offset = 0
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+    signature = sign_payload_hash(
+        hashlib.sha256(b"".join(sections)).digest(), private_key
+    )
+    footer = PspfFooter(
+        uv_binary_offset=offsets[1],
+        uv_binary_size=len(sections[1]),
+        python_install_tgz_offset=offsets[2],
+        python_install_tgz_size=len(sections[2]),
+        metadata_tgz_offset=offsets[3],
+        metadata_tgz_size=len(sections[3]),
+        payload_tgz_offset=offsets[4],
+        payload_tgz_size=len(sections[4]),
+        package_signature_offset=offset,
+        package_signature_size=len(signature),
+        public_key_pem_offset=offset + len(signature),
+        public_key_pem_size=len(public_key_pem),
+    )
+    path.write_bytes(
+        b"".join(sections) + signature + public_key_pem + footer.pack() + PSPF_EOF_MAGIC
+    )
+
+
+def test_reader_verify_valid_signature(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key: rsa.RSAPublicKey,
+    public_key_pem: bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that a correctly signed package verifies, even across many chunks."""
+    monkeypatch.setattr("pyvider.builder.packaging.reader.VERIFY_CHUNK_SIZE", 7)
+    package = tmp_path / "good.pspf"
+    _write_signed_package(package, private_key, public_key_pem)
+
+    PspfReader(package).verify(public_key)
+
+
+def test_reader_verify_detects_tampering(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key: rsa.RSAPublicKey,
+    public_key_pem: bytes,
+) -> None:
+    """Tests that modifying a signed section invalidates the signature."""
+    package = tmp_path / "tampered.pspf"
+    _write_signed_package(package, private_key, public_key_pem)
+    data = bytearray(package.read_bytes())
+    data[100] ^= 0xFF
+    package.write_bytes(bytes(data))
+
+    with pytest.raises(SignatureVerificationError):
+        PspfReader(package).verify(public_key)
+
+
+def test_reader_verify_wrong_key(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    """Tests that verification fails against an unrelated public key."""
+    package = tmp_path / "other-key.pspf"
+    _write_signed_package(package, private_key, public_key_pem)
+    _, other_public_key = generate_keys()
+
+    with pytest.raises(SignatureVerificationError):
+        PspfReader(package).verify(other_public_key)
+
+
+def test_reader_section_views(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    """Tests that sections are exposed as memoryviews over the mapped file."""
+    package = tmp_path / "sections.pspf"
+    _write_signed_package(package, private_key, public_key_pem)
+
+    with PspfReader(package) as reader:
+        launcher = reader.section("launcher")
+        assert isinstance(launcher, memoryview)
+        assert launcher.readonly
+        assert launcher.tobytes() == b"launcher" * 10
+        assert reader.section("metadata").tobytes() == b"metadata"
+        assert reader.section("public_key").tobytes() == public_key_pem
+        launcher.release()
+
+        with pytest.raises(ValueError, match="Unknown PSPF section"):
+            reader.section("bogus")
+
+
+def test_reader_open_section_is_bounded_file(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    """Tests that `open_section` can feed tarfile and hashlib directly."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        info = tarfile.TarInfo("config.json")
+        info.size = 2
+        tar.addfile(info, io.BytesIO(b"{}"))
+    package = tmp_path / "tar.pspf"
+    _write_signed_package(
+        package, private_key, public_key_pem, payload=buffer.getvalue()
+    )
+
+    with PspfReader(package) as reader:
+        with (
+            reader.open_section("payload") as window,
+            tarfile.open(fileobj=window, mode="r") as tar,
+        ):
+            member = tar.extractfile("config.json")
+            assert member is not None
+            assert member.read() == b"{}"
+
+        with reader.open_section("payload") as window:
+            digest = hashlib.file_digest(window, "sha256").digest()  # type: ignore[arg-type]
+        assert digest == hashlib.sha256(buffer.getvalue()).digest()
+
+        with reader.open_section("uv") as window:
+            assert window.read() == b"uv"
+            assert window.read() == b""
+            window.seek(-1, io.SEEK_END)
+            assert window.read() == b"v"
+
+
+def _zstd_tar(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return zstandard.ZstdCompressor().compress(buffer.getvalue())
+
+
+def test_reader_index_lists_archive_members(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    """Tests that the metadata's member index is read without the payload."""
+    index = {
+        "version": 1,
+        "sections": {
+            "payload": [
+                {"path": "pkg", "type": "dir", "size": 0, "mode": 0o755, "offset": 0},
+                {
+                    "path": "pkg/a.whl",
+                    "type": "file",
+                    "size": 5,
+                    "mode": 0o644,
+                    "sha256": "ab" * 32,
+                    "offset": 512,
+                },
+            ]
+        },
+    }
+    metadata = _zstd_tar(
+        {"config.json": b"{}", "index.json": json.dumps(index).encode()}
+    )
+    package = tmp_path / "indexed.pspf"
+    _write_signed_package(package, private_key, public_key_pem, metadata=metadata)
+
+    with PspfReader(package) as reader:
+        members = list(reader.index())
+        assert reader.read_metadata_file("config.json") == b"{}"
+        assert reader.read_metadata_file("missing.json") is None
+
+    assert [m.path for m in members] == ["pkg", "pkg/a.whl"]
+    assert members[1] == ArchiveMember(
+        section="payload",
+        path="pkg/a.whl",
+        type="file",
+        size=5,
+        mode=0o644,
+        offset=512,
+        sha256="ab" * 32,
+    )
+    assert members[0].sha256 is None
+
+
+def test_reader_index_missing(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    """Tests that packages built before the index existed have no index."""
+    package = tmp_path / "unindexed.pspf"
+    metadata = _zstd_tar({"config.json": b"{}"})
+    _write_signed_package(package, private_key, public_key_pem, metadata=metadata)
+
+    with PspfReader(package) as reader:
+        assert reader.index() is None
+
+
+@pytest.mark.parametrize(
+    "index",
+    [b"not json", b'{"version": 1}', b'{"sections": {"payload": [{"path": "a"}]}}'],
+)
+def test_reader_index_corrupt(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key_pem: bytes,
+    index: bytes,
+) -> None:
+    """Tests that a malformed index is an error, not a missing index."""
+    package = tmp_path / "corrupt.pspf"
+    metadata = _zstd_tar({"index.json": index})
+    _write_signed_package(package, private_key, public_key_pem, metadata=metadata)
+
+    with PspfReader(package) as reader:
+        with pytest.raises(VerificationError, match="Corrupt member index"):
+            reader.index()
+        with pytest.raises(VerificationError, match="Corrupt member index"):
+            list(reader.members("payload"))
+
+
+def test_reader_index_is_parsed_once(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key_pem: bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that the index is read from the metadata once per reader."""
+    package = tmp_path / "indexed.pspf"
+    member = {"path": "a.py", "type": "file", "size": 1, "mode": 0o644, "offset": 0}
+    index = {"version": 1, "sections": {"payload": [member]}}
+    metadata = _zstd_tar({"index.json": json.dumps(index).encode()})
+    _write_signed_package(package, private_key, public_key_pem, metadata=metadata)
+    reads: list[str] = []
+    read_metadata_file = PspfReader.read_metadata_file
+
+    def counting_read(self: PspfReader, name: str) -> bytes | None:
+        reads.append(name)
+        return read_metadata_file(self, name)
+
+    monkeypatch.setattr(PspfReader, "read_metadata_file", counting_read)
+
+    with PspfReader(package) as reader:
+        first = reader.index()
+        assert reader.index() is first
+        assert [m.path for m in reader.members("payload")] == ["a.py"]
+        assert [m.path for m in reader.members("payload")] == ["a.py"]
+
+    assert reads == ["index.json"]
@@ -0,0 +1,138 @@
+"""Tests for `pyvbuild cache` and the launcher runtime cache GC."""
+
+import json
+import os
+from pathlib import Path
+import time
+
+from click.testing import CliRunner
+import pytest
+from pytest import MonkeyPatch
+
+from pyvider.builder.cli import cli
+from pyvider.builder.locking import file_lock
+from pyvider.builder.runtime_cache import (
+    collect_garbage,
+    list_environments,
+    parse_duration,
+    parse_size,
+)
+
+DAY = 86400.0
+NOW = time.time()
+
+
+def _store_entry(root: Path, section: str, digest_char: str, size: int) -> Path:
+    entry = root / "store" / section / (digest_char * 64)
+    entry.mkdir(parents=True)
+    (entry / "blob").write_bytes(b"\0" * size)
+    return entry
+
+
+def _environment(
+    root: Path, name: str, *, size: int, age_days: float, store: list[Path]
+) -> Path:
+    env = root / "providers" / name
+    env.mkdir(parents=True)
+    (env / "payload").write_bytes(b"\0" * size)
+    (env / "runtime.json").write_text(json.dumps({"store": [str(p) for p in store]}))
+    last_used = env / ".last-used"
+    last_used.touch()
+    os.utime(last_used, (NOW - age_days * DAY, NOW - age_days * DAY))
+    return env
+
+
+@pytest.fixture
+def cache_root(tmp_path: Path) -> Path:
+    root = tmp_path / "pyvider"
+    python_a = _store_entry(root, "python_install", "a", 1000)
+    python_b = _store_entry(root, "python_install", "b", 1000)
+    uv = _store_entry(root, "uv", "c", 100)
+    _environment(root, "provider-old", size=500, age_days=40, store=[python_a, uv])
+    _environment(root, "provider-mid", size=500, age_days=10, store=[python_b, uv])
+    _environment(root, "provider-new", size=500, age_days=1, store=[python_b, uv])
+    (root / "providers" / "provider-new.setup-123").mkdir()
+    return root
+
+
+def test_environments_are_listed_least_recently_used_first(cache_root: Path) -> None:
+    names = [env.name for env in list_environments(cache_root)]
+    assert names == ["provider-old", "provider-mid", "provider-new"]
+
+
+def test_gc_older_than_evicts_stale_environments_and_orphaned_runtimes(
+    cache_root: Path,
+) -> None:
+    report = collect_garbage(cache_root, older_than=30 * DAY, now=NOW)
+
+    assert [env.name for env in report.evicted] == ["provider-old"]
+    assert [entry.path.name[0] for entry in report.removed_store_entries] == ["a"]
+    assert not (cache_root / "providers" / "provider-old").exists()
+    assert not (cache_root / "store" / "python_install" / ("a" * 64)).exists()
+    assert (cache_root / "store" / "python_install" / ("b" * 64)).exists()
+    assert (cache_root / "store" / "uv" / ("c" * 64)).exists()
+
+
+def test_gc_max_size_evicts_lru_until_within_budget(cache_root: Path) -> None:
+    # Remaining after evicting old and mid: 500 (env) + 1000 + 100 (store).
+    report = collect_garbage(cache_root, max_size=2000, now=NOW)
+
+    assert [env.name for env in report.evicted] == ["provider-old", "provider-mid"]
+    assert (cache_root / "providers" / "provider-new").exists()
+
+
+def test_gc_skips_environments_in_use(cache_root: Path) -> None:
+    with file_lock(cache_root / "providers" / "provider-old.use", shared=True):
+        report = collect_garbage(cache_root, older_than=30 * DAY, now=NOW)
+
+    assert report.evicted == []
+    assert [env.name for env in report.skipped_in_use] == ["provider-old"]
+    assert (cache_root / "providers" / "provider-old").exists()
+    assert (cache_root / "store" / "python_install" / ("a" * 64)).exists()
+
+
+def test_gc_leaves_the_store_alone_during_a_setup(cache_root: Path) -> None:
+    with file_lock(cache_root / "store.lock", shared=True):
+        report = collect_garbage(cache_root, older_than=30 * DAY, now=NOW)
+
+    assert report.store_locked
+    assert (cache_root / "store" / "python_install" / ("a" * 64)).exists()
+
+
+def test_gc_dry_run_removes_nothing(cache_root: Path) -> None:
+    report = collect_garbage(cache_root, older_than=30 * DAY, dry_run=True, now=NOW)
+
+    assert [env.name for env in report.evicted] == ["provider-old"]
+    assert (cache_root / "providers" / "provider-old").exists()
+
+
+def test_size_and_duration_parsing() -> None:
+    assert parse_size("1024") == 1024
+    assert parse_size("5G") == 5 * 1024**3
+    assert parse_size("1.5MiB") == int(1.5 * 1024**2)
+    assert parse_duration("30d") == 30 * DAY
+    assert parse_duration("12h") == 12 * 3600
+    with pytest.raises(ValueError):
+        parse_size("lots")
+    with pytest.raises(ValueError):
+        parse_duration("30")
+
+
+def test_cache_cli(cache_root: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "pyvider.builder.runtime_cache.launcher_cache_dir", lambda: cache_root
+    )
+    runner = CliRunner()
+
+    listed = runner.invoke(cli, ["cache", "list"])
+    assert listed.exit_code == 0, listed.output
+    assert "provider-old" in listed.output
+    assert "provider-new.setup-123" not in listed.output
+
+    bad = runner.invoke(cli, ["cache", "gc", "--older-than", "soon"])
+    assert bad.exit_code != 0
+    assert "Invalid duration" in bad.output
+
+    gc = runner.invoke(cli, ["cache", "gc", "--older-than", "30d"])
+    assert gc.exit_code == 0, gc.output
+    assert "Removed provider-old" in gc.output
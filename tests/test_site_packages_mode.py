@@ -0,0 +1,122 @@
+"""Tests for the build-time site-packages install mode."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from pyvider.builder.exceptions import BuildError
+from pyvider.builder.packaging.orchestrator import BuildOrchestrator
+
+
+def _build(tmp_path: Path, build_config: dict[str, Any]) -> list[list[str]]:
+    """Runs a build with all external commands faked; returns the commands."""
+    commands: list[list[str]] = []
+    python_exe = tmp_path / "python" / "bin" / "python3"
+    python_exe.parent.mkdir(parents=True)
+    python_exe.write_text("")
+
+    def fake_subprocess(command: list[str], cwd: Path | None = None) -> str:
+        commands.append(command)
+        if command[:3] == ["uv", "python", "find"]:
+            return str(python_exe)
+        if "--config" in command:
+            config_path = Path(command[command.index("--config") + 1])
+            commands.append(["config.json", config_path.read_text()])
+        if "--python-install-dir" in command:
+            sections_dir = Path(command[command.index("--sections-dir") + 1])
+            sections_dir.mkdir(parents=True, exist_ok=True)
+            (sections_dir / "python_install.tar.zst").write_bytes(b"archived")
+        return ""
+
+    def fake_build_local_wheels(source_dirs: list[Path], wheel_dir: Path, **_: Any) -> None:
+        wheel_dir.mkdir(parents=True, exist_ok=True)
+        for source in source_dirs:
+            (wheel_dir / f"{source.name}-0.1-py3-none-any.whl").write_text("wheel")
+
+    (tmp_path / "src" / "local_pkg").mkdir(parents=True)
+    with patch.object(
+        BuildOrchestrator, "_run_subprocess", side_effect=fake_subprocess
+    ), patch.object(BuildOrchestrator, "_assemble_package"), patch(
+        "pyvider.builder.packaging.orchestrator.build_local_wheels",
+        side_effect=fake_build_local_wheels,
+    ), patch(
+        "pyvider.builder.packaging.cache._get_cache_dir",
+        return_value=tmp_path / "cache",
+    ), patch(
+        "pyvider.builder.packaging.orchestrator.shutil.which",
+        return_value="/usr/bin/uv",
+    ), patch(
+        "pyvider.builder.packaging.orchestrator.ensure_go_binary",
+        return_value=Path("/fake/pspf-packager"),
+    ):
+        BuildOrchestrator(
+            launcher_bin_path="/fake/launcher",
+            package_integrity_key_path=str(tmp_path / "private.key"),
+            public_key_path=str(tmp_path / "public.key"),
+            output_pspf_path=str(tmp_path / "dist" / "provider"),
+            build_config=build_config,
+            manifest_dir=tmp_path,
+            entry_point="main:serve",
+        ).build_package()
+    return commands
+
+
+def test_site_packages_mode_installs_at_build_time(tmp_path: Path) -> None:
+    commands = _build(
+        tmp_path,
+        {
+            "install_mode": "site-packages",
+            "dependencies": ["./src/local_pkg", "attrs>=23.1.0"],
+        },
+    )
+
+    install = next(c for c in commands if c[:3] == ["uv", "pip", "install"])
+    target = Path(install[install.index("--target") + 1])
+    assert target.name == "site-packages"
+    python = Path(install[install.index("--python") + 1])
+    assert python == tmp_path / "python" / "bin" / "python3"
+    assert install[-2].endswith("local_pkg-0.1-py3-none-any.whl")
+    assert install[-1] == "attrs>=23.1.0"
+
+    packager = next(c for c in commands if "--sections-dir" in c)
+    assert "--dependency" not in packager
+    assert packager[packager.index("--payload-dir") + 1] == str(target.parent)
+
+    config = json.loads(next(c for c in commands if c[0] == "config.json")[1])
+    assert config["payload_layout"] == "site-packages"
+
+
+def test_wheels_mode_is_the_default(tmp_path: Path) -> None:
+    commands = _build(tmp_path, {"dependencies": ["attrs>=23.1.0"]})
+
+    assert not any(c[:3] == ["uv", "pip", "install"] for c in commands)
+    config = json.loads(next(c for c in commands if c[0] == "config.json")[1])
+    assert config["payload_layout"] == "wheels"
+
+
+def test_unknown_install_mode_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(BuildError, match="Invalid install_mode"):
+        _build(tmp_path, {"install_mode": "venv"})
+
+
+def test_site_packages_payload_is_compiled_when_requested(tmp_path: Path) -> None:
+    commands = _build(
+        tmp_path,
+        {
+            "install_mode": "site-packages",
+            "compile_bytecode": True,
+            "dependencies": ["attrs>=23.1.0"],
+            "exclude": ["**/__pycache__/**", "**/.venv/**"],
+        },
+    )
+
+    compiles = [c for c in commands if c[1:3] == ["-m", "compileall"]]
+    assert [Path(c[-1]).name for c in compiles] == ["payload", "python_install"]
+    assert all("unchecked-hash" in c for c in compiles)
+
+    packager = next(c for c in commands if "--sections-dir" in c)
+    excludes = [packager[i + 1] for i, arg in enumerate(packager) if arg == "--exclude"]
+    assert excludes == ["**/.venv/**"]
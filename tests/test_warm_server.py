@@ -0,0 +1,27 @@
+"""Tests for the warm provider worker build setting."""
+
+import pytest
+
+from pyvider.builder.exceptions import BuildError
+from pyvider.builder.packaging.orchestrator import (
+    DEFAULT_WARM_IDLE_TIMEOUT,
+    resolve_warm_server,
+)
+
+
+def test_warm_server_is_off_by_default() -> None:
+    assert resolve_warm_server(None) is None
+    assert resolve_warm_server(False) is None
+
+
+def test_warm_server_settings() -> None:
+    assert resolve_warm_server(True) == {"idle_timeout": DEFAULT_WARM_IDLE_TIMEOUT}
+    assert resolve_warm_server({"idle_timeout": 60}) == {"idle_timeout": 60}
+
+
+@pytest.mark.parametrize(
+    "value", [{"idle_timeout": 0}, {"idle_timeout": "5m"}, {"timeout": 60}, "yes"]
+)
+def test_invalid_warm_server_settings_are_rejected(value: object) -> None:
+    with pytest.raises(BuildError, match="warm_server"):
+        resolve_warm_server(value)  # type: ignore[arg-type]
@@ -0,0 +1,113 @@
+"""Tests for the parallel, source-hash-cached local wheel builds."""
+
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+from pyvider.builder.exceptions import BuildError
+from pyvider.builder.packaging import cache
+from pyvider.builder.packaging.wheels import (
+    build_local_wheels,
+    local_dependency_dir,
+    resolve_jobs,
+)
+
+
+class FakeWheelBuilder:
+    """Stands in for `uv run pip wheel`, recording which sources were built."""
+
+    def __init__(self) -> None:
+        self.built: list[str] = []
+
+    def __call__(self, cmd: list[str], cwd: Path | None) -> str:
+        assert "--no-deps" in cmd
+        source = Path(cmd[cmd.index("--wheel-dir") - 1])
+        wheel_dir = Path(cmd[cmd.index("--wheel-dir") + 1])
+        name = source.name.removesuffix("_copy")
+        (wheel_dir / f"{name}-0.1-py3-none-any.whl").write_text(source.name)
+        self.built.append(source.name)
+        return ""
+
+
+@pytest.fixture
+def sources(tmp_path: Path, monkeypatch: MonkeyPatch) -> list[Path]:
+    monkeypatch.setattr(cache, "_get_cache_dir", lambda: tmp_path / "cache")
+    dirs = []
+    for name in ("pkg_a", "pkg_b"):
+        src = tmp_path / name
+        (src / name).mkdir(parents=True)
+        (src / "pyproject.toml").write_text(f"[project]\nname = '{name}'\n")
+        (src / name / "__init__.py").write_text("VALUE = 1\n")
+        dirs.append(src)
+    return dirs
+
+
+def _build(sources: list[Path], out: Path, run: FakeWheelBuilder) -> set[str]:
+    build_local_wheels(
+        sources,
+        out,
+        exclude_patterns=["*.log"],
+        key_inputs=["3.13"],
+        jobs=2,
+        run=run,
+    )
+    return {p.name for p in out.glob("*.whl")}
+
+
+def test_wheels_are_built_once_and_reused(sources: list[Path], tmp_path: Path) -> None:
+    run = FakeWheelBuilder()
+    first = _build(sources, tmp_path / "out1", run)
+    assert first == {"pkg_a-0.1-py3-none-any.whl", "pkg_b-0.1-py3-none-any.whl"}
+    assert sorted(run.built) == ["pkg_a", "pkg_b"]
+
+    second = _build(sources, tmp_path / "out2", run)
+    assert second == first
+    assert len(run.built) == 2
+
+
+def test_only_changed_sources_are_rebuilt(sources: list[Path], tmp_path: Path) -> None:
+    run = FakeWheelBuilder()
+    _build(sources, tmp_path / "out1", run)
+
+    (sources[0] / "pkg_a" / "__init__.py").write_text("VALUE = 2\n")
+    (sources[1] / "debug.log").write_text("excluded from the hash")
+    (sources[1] / "pkg_b" / "__pycache__").mkdir()
+    (sources[1] / "pkg_b" / "__pycache__" / "x.pyc").write_bytes(b"\0")
+
+    _build(sources, tmp_path / "out2", run)
+    assert sorted(run.built) == ["pkg_a", "pkg_a", "pkg_b"]
+
+
+def test_local_wheels_must_not_share_a_name(
+    sources: list[Path], tmp_path: Path
+) -> None:
+    copy = tmp_path / "pkg_a_copy"
+    (copy / "pkg_a").mkdir(parents=True)
+    (copy / "pyproject.toml").write_text("[project]\nname = 'pkg_a'\n")
+
+    with pytest.raises(BuildError, match=r"both build pkg_a-0\.1-py3-none-any\.whl"):
+        _build([sources[0], copy], tmp_path / "out", FakeWheelBuilder())
+
+
+def test_local_dependencies_are_directories(tmp_path: Path) -> None:
+    (tmp_path / "src" / "local_pkg").mkdir(parents=True)
+    (tmp_path / "vendor.whl").write_text("wheel")
+    local_pkg = (tmp_path / "src" / "local_pkg").resolve()
+
+    assert local_dependency_dir("src/local_pkg", tmp_path) == local_pkg
+    assert local_dependency_dir("./src/local_pkg", tmp_path) == local_pkg
+    assert local_dependency_dir(str(local_pkg), tmp_path) == local_pkg
+    for dep in ("attrs>=23.1.0", "vendor.whl", "./missing"):
+        assert local_dependency_dir(dep, tmp_path) is None
+
+
+@pytest.mark.parametrize("value", [0, -1, "4", 2.0, True])
+def test_invalid_jobs_setting_is_rejected(value: object) -> None:
+    with pytest.raises(BuildError, match="Invalid jobs setting"):
+        resolve_jobs(value)
+
+
+def test_jobs_setting_defaults_to_cpu_count() -> None:
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(None) >= 1
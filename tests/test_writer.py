@@ -0,0 +1,60 @@
+"""Tests for the streaming PSPF writer."""
+
+import io
+from pathlib import Path
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+import pytest
+
+from pyvider.builder.exceptions import BuildError
+from pyvider.builder.packaging.reader import PspfReader
+from pyvider.builder.packaging.writer import PspfWriter
+
+
+def test_writer_round_trip(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    public_key: rsa.RSAPublicKey,
+    public_key_pem: bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that every source kind is streamed and the result verifies."""
+    monkeypatch.setattr("pyvider.builder.packaging.writer.COPY_CHUNK_SIZE", 5)
+    launcher = tmp_path / "launcher"
+    launcher.write_bytes(b"#!launcher" * 50)
+    output = tmp_path / "dist" / "provider"
+    output.parent.mkdir()
+
+    with PspfWriter(output, private_key) as writer:
+        writer.add_section("launcher", launcher)
+        writer.add_section("uv", b"uv-binary")
+        writer.add_section("python_install", io.BytesIO(b"python" * 100))
+        writer.add_section("metadata", (chunk for chunk in [b"meta", b"data"]))
+        writer.add_section("payload", io.BufferedReader(io.BytesIO(b"payload")))
+        footer = writer.finalize(public_key_pem)
+
+    assert output.stat().st_mode & 0o111
+    assert not list(tmp_path.glob("dist/.*partial"))
+    with PspfReader(output) as reader:
+        assert reader.footer == footer
+        assert reader.section("launcher").tobytes() == b"#!launcher" * 50
+        assert reader.section("metadata").tobytes() == b"metadata"
+        assert reader.section("public_key").tobytes() == public_key_pem
+        reader.verify(public_key)
+
+
+def test_writer_enforces_section_order(
+    tmp_path: Path, private_key: rsa.RSAPrivateKey, public_key_pem: bytes
+) -> None:
+    """Tests that sections out of order or missing are rejected."""
+    output = tmp_path / "provider"
+    with PspfWriter(output, private_key) as writer:
+        with pytest.raises(BuildError, match="expected 'launcher', got 'uv'"):
+            writer.add_section("uv", b"uv")
+        writer.add_section("launcher", b"launcher")
+        with pytest.raises(BuildError, match="Missing package sections: uv"):
+            writer.finalize(public_key_pem)
+
+    # An unfinished package never appears at the output path.
+    assert not output.exists()
+    assert not list(tmp_path.iterdir())